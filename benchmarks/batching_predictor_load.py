@@ -0,0 +1,91 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput and tail latency of BatchingPredictor under concurrent load.
+
+A local load generator runs n_clients coroutines that each send
+single-row requests back to back, standing in for a web endpoint.
+Compares one predict call per request on a thread against coalescing
+requests into micro-batches with BatchingPredictor.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/batching_predictor_load.py [n_clients] [n_requests]
+"""
+
+import asyncio
+import concurrent.futures
+import sys
+import time
+
+import numpy as np
+import sklearn.datasets
+
+from lale.lib.sklearn import PCA, LogisticRegression, StandardScaler
+from lale.util.batching_predictor import BatchingPredictor
+
+
+async def _load(score, rows, n_clients, n_requests):
+    latencies = []
+
+    async def client(i):
+        for j in range(n_requests):
+            row = rows[(i * n_requests + j) % len(rows)]
+            start = time.perf_counter()
+            await score(row)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[client(i) for i in range(n_clients)])
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, np.percentile(latencies, [50, 99])
+
+
+async def _unbatched(trained, rows, n_clients, n_requests):
+    loop = asyncio.get_running_loop()
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+
+        async def score(row):
+            return await loop.run_in_executor(executor, trained.predict, row)
+
+        return await _load(score, rows, n_clients, n_requests)
+
+
+async def _batched(trained, rows, n_clients, n_requests, **kwargs):
+    async with BatchingPredictor(trained, **kwargs) as predictor:
+        return await _load(predictor.predict, rows, n_clients, n_requests)
+
+
+def main(n_clients: int = 64, n_requests: int = 50):
+    X, y = sklearn.datasets.load_iris(return_X_y=True)
+    trained = (StandardScaler() >> PCA(n_components=2) >> LogisticRegression()).fit(
+        X, y
+    )
+    rows = [X[i : i + 1] for i in range(len(X))]
+
+    runs = {
+        "predict per request": _unbatched(trained, rows, n_clients, n_requests),
+        "BatchingPredictor": _batched(trained, rows, n_clients, n_requests),
+        "BatchingPredictor, no wait": _batched(
+            trained, rows, n_clients, n_requests, max_wait=0
+        ),
+    }
+    for name, run in runs.items():
+        throughput, (p50, p99) = asyncio.run(run)
+        print(
+            f"{name:28s} {throughput:8.0f} req/s"
+            f"  p50 {1e3 * p50:6.2f} ms  p99 {1e3 * p99:6.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,67 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time of inferring data schemas of a wide data frame.
+
+Infers the schema of a data frame with many columns, then of the
+training folds of 5-fold cross-validation (which share the columns of
+the data frame), and computes fold_schema as operators with data
+constraints do on every fit. Also converts the sampled rows of a wide
+array to JSON, as data validation does. Run on an older checkout to
+compare.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/data_schema_inference.py [n_columns] [n_rows]
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.model_selection import KFold
+
+from lale.datasets.data_schemas import to_schema
+from lale.helpers import fold_schema, ndarray_to_json, split_with_schemas
+from lale.lib.sklearn import LogisticRegression
+
+
+def _measure(name, f):
+    start = time.perf_counter()
+    f()
+    elapsed = time.perf_counter() - start
+    print(f"{name:32s} {elapsed:7.3f} s")
+
+
+def main(n_columns: int = 50_000, n_rows: int = 200):
+    rng = np.random.default_rng(42)
+    X = pd.DataFrame(
+        rng.random((n_rows, n_columns)),
+        columns=[f"c{i}" for i in range(n_columns)],
+    )
+    y = pd.Series(rng.integers(0, 2, n_rows))
+    print(f"data frame of shape {X.shape}")
+    _measure("to_schema", lambda: to_schema(X))
+
+    def folds():
+        for train, _ in KFold(n_splits=5).split(X):
+            train_X, _ = split_with_schemas(LogisticRegression, X, y, train)
+            to_schema(train_X)
+
+    _measure("to_schema of 5 folds", folds)
+    _measure("fold_schema x 5", lambda: [fold_schema(X, y, cv=5) for _ in range(5)])
+    _measure("ndarray_to_json", lambda: ndarray_to_json(X.values))
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
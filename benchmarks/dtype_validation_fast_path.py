@@ -0,0 +1,75 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cost of validating wide data against a common operator input schema.
+
+Compares deciding from dtypes and shape alone (dtypes_satisfy_schema)
+against materializing the JSON schema of the data and running the
+generic subschema check, without the subschema cache, for a DataFrame
+and an ndarray of increasing width.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/dtype_validation_fast_path.py [n_rows]
+"""
+
+import sys
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import lale.type_checking
+from lale.datasets.data_schemas import _to_schema
+
+_X_SCHEMA = {
+    "type": "array",
+    "items": {"type": "array", "items": {"type": "number"}},
+}
+
+
+def _subschema_check(value):
+    return lale.type_checking.is_subschema(_to_schema(value), _X_SCHEMA)
+
+
+def main(n_rows: int = 10_000):
+    default_size = lale.type_checking.subschema_cache_size
+    lale.type_checking.subschema_cache_size = 0
+    rng = np.random.default_rng(42)
+    try:
+        for n_columns in [10, 100, 1000]:
+            array = rng.normal(size=(n_rows, n_columns))
+            df = pd.DataFrame(array, columns=[f"c{i}" for i in range(n_columns)])
+            for name, value in [("DataFrame", df), ("ndarray", array)]:
+                assert lale.type_checking.dtypes_satisfy_schema(value, _X_SCHEMA)
+                fast = min(
+                    timeit.repeat(
+                        lambda: lale.type_checking.dtypes_satisfy_schema(
+                            value, _X_SCHEMA
+                        ),
+                        number=10,
+                    )
+                )
+                slow = min(
+                    timeit.repeat(lambda: _subschema_check(value), number=1, repeat=3)
+                )
+                print(
+                    f"{name:9s} {n_columns:5d} columns"
+                    f"  to_schema+is_subschema {1e3 * slow:9.2f} ms"
+                    f"  dtypes {1e3 * fast / 10:7.3f} ms"
+                )
+    finally:
+        lale.type_checking.subschema_cache_size = default_size
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
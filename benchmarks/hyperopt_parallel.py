@@ -0,0 +1,68 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall-clock time of Hyperopt with and without parallel trials.
+
+Runs the same search sequentially, with max_eval_time (which evaluates
+trials in a worker process), and with n_jobs worker processes. On a
+machine with n_jobs cores, the last one evaluates n_jobs trials at a
+time.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/hyperopt_parallel.py [max_evals] [n_jobs]
+"""
+
+import os
+import sys
+import time
+import warnings
+
+from sklearn.datasets import load_digits
+
+from lale.lib.lale import Hyperopt, NoOp
+from lale.lib.sklearn import (
+    PCA,
+    KNeighborsClassifier,
+    LogisticRegression,
+    RandomForestClassifier,
+)
+
+
+def main(max_evals: int = 32, n_jobs: int = os.cpu_count() or 1):
+    warnings.filterwarnings("ignore")
+    X, y = load_digits(return_X_y=True)
+    planned = (PCA | NoOp) >> (
+        LogisticRegression | KNeighborsClassifier | RandomForestClassifier
+    )
+    configs = {
+        "sequential": {},
+        "max_eval_time=600": {"max_eval_time": 600},
+        f"n_jobs={n_jobs}": {"n_jobs": n_jobs},
+    }
+    for name, kwargs in configs.items():
+        optimizer = Hyperopt(
+            estimator=planned,
+            max_evals=max_evals,
+            cv=3,
+            show_progressbar=False,
+            **kwargs,
+        )
+        start = time.perf_counter()
+        trained = optimizer.fit(X, y)
+        elapsed = time.perf_counter() - start
+        best = -trained.summary()["loss"].min()
+        print(f"{name:20s} {elapsed:7.2f} s  best accuracy {best:.3f}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,74 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Search time of Hyperopt with and without early stopping of trials.
+
+Runs Hyperopt with max_evals trials on a synthetic classification
+dataset, once evaluating every trial on all folds and samples, and
+once each with successive halving over folds and over samples. Prints
+the wall-clock time, the number of pruned trials, and the accuracy of
+the best pipeline on held-out data.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/hyperopt_successive_halving.py [max_evals] [n_rows]
+"""
+
+import sys
+import time
+import warnings
+
+from sklearn.datasets import make_classification
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+
+from lale.lib.lale import Hyperopt
+from lale.lib.sklearn import (
+    DecisionTreeClassifier,
+    KNeighborsClassifier,
+    LogisticRegression,
+    RandomForestClassifier,
+)
+
+
+def main(max_evals: int = 30, n_rows: int = 20000):
+    warnings.filterwarnings("ignore")
+    X, y = make_classification(n_rows, 30, n_informative=10, random_state=42)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, random_state=42)
+    planned = (
+        LogisticRegression
+        | KNeighborsClassifier
+        | DecisionTreeClassifier
+        | RandomForestClassifier
+    )
+    for resource in [None, "n_folds", "n_samples"]:
+        hpo = Hyperopt(
+            estimator=planned,
+            cv=5,
+            max_evals=max_evals,
+            resource=resource,
+            show_progressbar=False,
+        )
+        start = time.perf_counter()
+        trained = hpo.fit(X_train, y_train)
+        elapsed = time.perf_counter() - start
+        statuses = list(trained.summary()["status"])
+        accuracy = accuracy_score(y_test, trained.predict(X_test))
+        print(
+            f"resource={str(resource):10s} {elapsed:7.1f} s"
+            f"  pruned {statuses.count('pruned'):3d}/{len(statuses)}"
+            f"  test accuracy {accuracy:.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,61 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Throughput of configuring operators with and without the validator cache.
+
+Configuring an operator, as optimizers do for every trial, validates
+its hyperparameters against the operator's schema. Compares calls per
+second of IndividualOp.__call__ and _with_params when the compiled
+validators are cached against recompiling them on every call, which is
+what a cache size of zero amounts to.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/hyperparam_validation_cache.py [n_calls]
+"""
+
+import sys
+import timeit
+
+import lale.type_checking
+from lale.lib.sklearn import LogisticRegression, RandomForestClassifier
+
+
+def main(n_calls: int = 2000):
+    cases = {
+        "LogisticRegression(...)": lambda: LogisticRegression(C=0.5, solver="saga"),
+        "RandomForestClassifier(...)": lambda: RandomForestClassifier(
+            n_estimators=50, max_depth=5
+        ),
+        "LogisticRegression._with_params": lambda: LogisticRegression._with_params(
+            True, C=0.5, tol=0.001
+        ),
+    }
+    default_size = lale.type_checking.validator_cache_size
+    for name, f in cases.items():
+        rates = {}
+        for label, size in [("uncached", 0), ("cached", default_size)]:
+            lale.type_checking.validator_cache_size = size
+            lale.type_checking.clear_validator_cache()
+            f()  # warm up
+            seconds = min(timeit.repeat(f, number=n_calls, repeat=3))
+            rates[label] = n_calls / seconds
+        print(
+            f"{name:32s} uncached {rates['uncached']:8.0f}/s"
+            f"  cached {rates['cached']:8.0f}/s"
+            f"  ({rates['cached'] / rates['uncached']:4.2f}x)"
+        )
+    lale.type_checking.validator_cache_size = default_size
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
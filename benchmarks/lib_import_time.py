@@ -0,0 +1,77 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Import time of the operator packages in lale.lib.
+
+Each measurement runs in a fresh interpreter. Compares importing a
+package (operators load on first access), importing it and using one
+operator, and importing it and touching every export, which is what
+importing a package used to cost. The first line is the floor set by
+``import lale`` itself. Optional packages that are not installed are
+skipped.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/lib_import_time.py [repeat]
+"""
+
+import subprocess
+import sys
+
+_PACKAGES = {
+    "lale.lib.sklearn": "LogisticRegression",
+    "lale.lib.autogen": "TruncatedSVD",
+    "lale.lib.lale": "NoOp",
+    "lale.lib.rasl": "Project",
+    "lale.lib.imblearn": "SMOTE",
+    "lale.lib.aif360": "Reweighing",
+}
+
+
+def _seconds(statements, repeat):
+    code = (
+        "import time\n"
+        "start = time.perf_counter()\n"
+        f"{statements}\n"
+        "print(time.perf_counter() - start)\n"
+    )
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=False
+        )
+        if result.returncode != 0:
+            return None
+        times.append(float(result.stdout.split()[-1]))
+    return min(times)
+
+
+def main(repeat: int = 3):
+    floor = _seconds("import lale", repeat)
+    print(f"{'import lale':20s} {floor:6.2f} s")
+    for package, operator in _PACKAGES.items():
+        lazy = _seconds(f"import {package}", repeat)
+        if lazy is None:
+            print(f"{package:20s} not installed")
+            continue
+        one = _seconds(f"from {package} import {operator}", repeat)
+        every = _seconds(
+            f"import {package} as p\nfor name in p.__all__: getattr(p, name)", repeat
+        )
+        print(
+            f"{package:20s} import {lazy:6.2f} s  one operator {one:6.2f} s"
+            f"  all exports {every:6.2f} s"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
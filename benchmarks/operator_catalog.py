@@ -0,0 +1,85 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time of operator discovery with and without the operator catalog.
+
+Each measurement runs in a fresh interpreter that has imported
+lale.lib.sklearn and lale.lib.autogen. Compares querying operators by
+tag and looking up a wrapper by class name when the catalog is used
+against loading every export first, which is what these queries
+amounted to before the catalog.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/operator_catalog.py [repeat]
+"""
+
+import subprocess
+import sys
+
+_SETUP = (
+    "import lale.lib.autogen\n"
+    "import lale.lib.sklearn\n"
+    "from lale.lib._lazy_imports import attached_packages\n"
+)
+
+_LOAD_ALL = (
+    "for name, exports in attached_packages().items():\n"
+    "    for export in exports: getattr(sys.modules[name], export)\n"
+)
+
+_QUERIES = {
+    "get_available_estimators({'interpretable'})": (
+        "from lale.operators import get_available_estimators\n"
+        "get_available_estimators({'interpretable'})\n"
+    ),
+    "get_available_transformers()": (
+        "from lale.operators import get_available_transformers\n"
+        "get_available_transformers()\n"
+    ),
+    "find_lale_wrapper(PCA())": (
+        "from sklearn.decomposition import PCA\n"
+        "from lale.helpers import find_lale_wrapper\n"
+        "find_lale_wrapper(PCA())\n"
+    ),
+}
+
+
+def _seconds(statements, repeat):
+    code = (
+        "import sys, time\n"
+        f"{_SETUP}"
+        "start = time.perf_counter()\n"
+        f"{statements}"
+        "print(time.perf_counter() - start)\n"
+    )
+    times = []
+    for _ in range(repeat):
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        times.append(float(result.stdout.split()[-1]))
+    return min(times)
+
+
+def main(repeat: int = 3):
+    for name, query in _QUERIES.items():
+        catalog = _seconds(query, repeat)
+        load_all = _seconds(_LOAD_ALL + query, repeat)
+        print(
+            f"{name:45s} load all {load_all:6.2f} s  catalog {catalog:6.2f} s"
+            f"  ({load_all / catalog:5.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
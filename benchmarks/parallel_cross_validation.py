@@ -0,0 +1,64 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Wall-clock time of cross-validation with sequential and parallel folds.
+
+Runs lale.helpers.cross_val_score_track_trials on a pipeline with
+n_folds folds, one fold at a time and with n_jobs folds at a time on
+threads and on processes, and prints the total time together with the
+wall and CPU time of each fold.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/parallel_cross_validation.py [n_folds] [n_jobs] [n_rows]
+"""
+
+import sys
+import time
+
+from sklearn.datasets import make_classification
+
+from lale.helpers import cross_val_score_track_trials
+from lale.lib.sklearn import PCA, RandomForestClassifier
+
+
+def main(n_folds: int = 5, n_jobs: int = -1, n_rows: int = 10000):
+    X, y = make_classification(n_rows, 40, n_informative=10, random_state=42)
+    pipeline = PCA(n_components=20, svd_solver="full") >> RandomForestClassifier(
+        n_estimators=50, random_state=42
+    )
+    cases = [
+        ("sequential", None, "threads"),
+        ("threads", n_jobs, "threads"),
+        ("processes", n_jobs, "processes"),
+    ]
+    for label, jobs, prefer in cases:
+        start = time.perf_counter()
+        score, _, _, fold_times = cross_val_score_track_trials(
+            pipeline,
+            X,
+            y,
+            scoring="accuracy",
+            cv=n_folds,
+            n_jobs=jobs,
+            prefer=prefer,
+            return_fold_times=True,
+        )
+        elapsed = time.perf_counter() - start
+        folds = " ".join(f"{t.wall_time:.2f}/{t.cpu_time:.2f}" for t in fold_times)
+        print(
+            f"{label:12s} {elapsed:7.2f} s  score {score:.4f}  fold wall/cpu s: {folds}"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
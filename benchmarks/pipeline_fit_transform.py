@@ -0,0 +1,69 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pipeline training time with and without fused fit_transform.
+
+For each sklearn wrapper, times fitting a pipeline whose first step is
+that transformer, once as usual (the pipeline calls the fused
+fit_transform of the impl) and once with fit_transform hidden from the
+pipeline, so that it falls back to fit followed by transform.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/pipeline_fit_transform.py [n_rows]
+"""
+
+import sys
+import timeit
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+import lale.operators
+from lale.lib.sklearn import PCA, LogisticRegression, OneHotEncoder, TfidfVectorizer
+
+
+def main(n_rows: int = 20_000):
+    rng = np.random.default_rng(42)
+    y = rng.integers(0, 2, n_rows)
+    words = np.array([f"w{i}" for i in range(2000)])
+    docs = pd.DataFrame(
+        {"text": [" ".join(rng.choice(words, 30)) for _ in range(n_rows)]}
+    )
+    dense = rng.normal(size=(n_rows, 200))
+    categorical = rng.integers(0, 50, size=(n_rows, 10))
+    cases = {
+        "TfidfVectorizer": (TfidfVectorizer() >> LogisticRegression(), docs),
+        "PCA": (PCA(n_components=20) >> LogisticRegression(), dense),
+        "OneHotEncoder": (OneHotEncoder() >> LogisticRegression(), categorical),
+    }
+
+    def seconds(f):
+        return min(timeit.repeat(f, number=1, repeat=3))
+
+    for name, (trainable, X) in cases.items():
+        fused = seconds(lambda: trainable.fit(X, y))
+        with mock.patch.object(
+            lale.operators.TrainableIndividualOp,
+            "_has_fused_fit_transform",
+            lambda self: False,
+        ):
+            separate = seconds(lambda: trainable.fit(X, y))
+        print(
+            f"{name:16s} fit+transform {separate:7.3f} s"
+            f"  fit_transform {fused:7.3f} s  ({separate / fused:4.2f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,68 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-call overhead of TrainedPipeline.predict on small batches.
+
+Compares a trained Lale pipeline against the equivalent scikit-learn
+Pipeline, both with the cached inference plan and with the generic
+step-by-step evaluation that the plan replaces.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/pipeline_predict_overhead.py [n_calls]
+"""
+
+import copy
+import sys
+import timeit
+
+import sklearn.datasets
+import sklearn.decomposition
+import sklearn.linear_model
+import sklearn.pipeline
+import sklearn.preprocessing
+
+from lale.lib.sklearn import PCA, LogisticRegression, StandardScaler
+
+
+def main(n_calls: int = 2000):
+    X, y = sklearn.datasets.load_iris(return_X_y=True)
+    one_row = X[:1]
+
+    sk_trained = sklearn.pipeline.make_pipeline(
+        sklearn.preprocessing.StandardScaler(),
+        sklearn.decomposition.PCA(n_components=2),
+        sklearn.linear_model.LogisticRegression(),
+    ).fit(X, y)
+    lale_trained = (
+        StandardScaler() >> PCA(n_components=2) >> LogisticRegression()
+    ).fit(X, y)
+    # a cached plan of None means the pipeline is evaluated step by step
+    lale_unplanned = copy.deepcopy(lale_trained)
+    lale_unplanned._cached_inference_plans = {"_predict": None}
+
+    def per_call_us(f):
+        f()  # warm up, builds the inference plan for lale
+        return 1e6 * min(timeit.repeat(f, number=n_calls, repeat=5)) / n_calls
+
+    results = {
+        "sklearn Pipeline": per_call_us(lambda: sk_trained.predict(one_row)),
+        "lale, cached plan": per_call_us(lambda: lale_trained.predict(one_row)),
+        "lale, step by step": per_call_us(lambda: lale_unplanned.predict(one_row)),
+    }
+    baseline = results["sklearn Pipeline"]
+    for name, us in results.items():
+        print(f"{name:20s} {us:8.1f} us/call  ({us - baseline:+8.1f} us vs sklearn)")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
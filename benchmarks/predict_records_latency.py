@@ -0,0 +1,63 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Latency of scoring a single record with a rasl pipeline.
+
+Compares building a one-row dataframe and calling predict against
+predict_one, for a Map >> Project >> LogisticRegression pipeline.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/predict_records_latency.py [n_calls]
+"""
+
+import sys
+import timeit
+
+import pandas as pd
+import sklearn.datasets
+
+from lale.expressions import it
+from lale.lib.rasl import Map, Project
+from lale.lib.sklearn import LogisticRegression
+
+
+def main(n_calls: int = 500):
+    data = sklearn.datasets.load_iris(as_frame=True)
+    X, y = data.data, data.target
+    X.columns = ["a", "b", "c", "d"]
+    trained = (
+        Map(columns={"a2": it.a * 2, "b": it.b, "c": it.c})
+        >> Project(columns=["a2", "b"])
+        >> LogisticRegression()
+    ).fit(X, y)
+    record = X.iloc[0].to_dict()
+
+    def per_call_us(f):
+        f()  # warm up, builds the inference plan and column layout
+        return 1e6 * min(timeit.repeat(f, number=n_calls, repeat=5)) / n_calls
+
+    results = {
+        "predict(DataFrame([r]))": per_call_us(
+            lambda: trained.predict(pd.DataFrame([record]))
+        ),
+        "predict_one(r)": per_call_us(lambda: trained.predict_one(record)),
+        "predict_records([r]*10)": per_call_us(
+            lambda: trained.predict_records([record] * 10)
+        ),
+    }
+    for name, us in results.items():
+        print(f"{name:24s} {us:8.1f} us/call")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
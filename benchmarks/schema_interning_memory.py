@@ -0,0 +1,61 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Memory and time of keeping many cloned and trained pipelines.
+
+Optimizers clone the pipeline for every trial and fold, and may keep
+the trained pipelines around. Measures the time of cloning a pipeline
+with sklearn's clone, the memory retained by the trained clones, and
+the time of comparing the schemas of two clones. Run it before and
+after a change to operator schemas to compare.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/schema_interning_memory.py [n_pipelines]
+"""
+
+import sys
+import time
+import timeit
+import tracemalloc
+
+import numpy as np
+import sklearn.base
+
+from lale.lib.sklearn import PCA, LogisticRegression, StandardScaler
+
+
+def main(n_pipelines: int = 1000):
+    rng = np.random.default_rng(42)
+    X = rng.normal(size=(100, 5))
+    y = rng.integers(0, 2, 100)
+    planned = StandardScaler() >> PCA(n_components=3) >> LogisticRegression()
+    tracemalloc.start()
+    start = time.perf_counter()
+    clones = [sklearn.base.clone(planned) for _ in range(n_pipelines)]
+    clone_seconds = time.perf_counter() - start
+    trained = [clone.fit(X, y) for clone in clones]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    lr1, lr2 = trained[0].steps_list()[-1], trained[1].steps_list()[-1]
+    compare = min(
+        timeit.repeat(lambda: lr1._schemas == lr2._schemas, number=1000, repeat=3)
+    )
+    print(
+        f"clone {n_pipelines} pipelines {clone_seconds:6.2f} s"
+        f"  retained by trained pipelines {retained / 2**20:7.1f} MiB"
+        f"  schema comparison {compare * 1000:7.2f} us"
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,83 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time of building search spaces for many pipeline variants.
+
+AutoML loops build search spaces for many pipelines that share their
+operators. Compares building the hyperopt search spaces and the grid
+search grids of every combination of a few preprocessors and
+classifiers with and without the cache of per-operator search spaces.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/search_space_cache.py [n_rounds]
+"""
+
+import itertools
+import sys
+import time
+
+import lale.search.schema2search_space
+from lale.lib.lale import NoOp
+from lale.lib.sklearn import (
+    PCA,
+    KNeighborsClassifier,
+    LogisticRegression,
+    MinMaxScaler,
+    Normalizer,
+    Nystroem,
+    RandomForestClassifier,
+    StandardScaler,
+)
+from lale.search.lale_grid_search_cv import get_grid_search_parameter_grids
+from lale.search.op2hp import hyperopt_search_space
+
+
+def main(n_rounds: int = 3):
+    pipelines = [
+        scaler >> reducer >> classifier
+        for scaler, reducer, classifier in itertools.product(
+            [NoOp, StandardScaler, MinMaxScaler],
+            [PCA, Nystroem, Normalizer],
+            [LogisticRegression, RandomForestClassifier, KNeighborsClassifier],
+        )
+    ]
+    builders = {
+        "hyperopt_search_space": hyperopt_search_space,
+        "get_grid_search_parameter_grids": lambda p: get_grid_search_parameter_grids(
+            p, num_samples=2
+        ),
+    }
+    default_size = lale.search.schema2search_space.search_space_cache_size
+    for name, build in builders.items():
+        seconds = {}
+        for label, size in [("uncached", 0), ("cached", default_size)]:
+            lale.search.schema2search_space.search_space_cache_size = size
+            lale.search.schema2search_space.clear_search_space_cache()
+            start = time.perf_counter()
+            for _ in range(n_rounds):
+                for pipeline in pipelines:
+                    build(pipeline)
+            seconds[label] = time.perf_counter() - start
+        info = lale.search.schema2search_space.search_space_cache_info()
+        print(
+            f"{name:32s} {n_rounds * len(pipelines)} pipelines"
+            f"  uncached {seconds['uncached']:6.2f} s"
+            f"  cached {seconds['cached']:6.2f} s"
+            f"  ({seconds['uncached'] / seconds['cached']:4.1f}x,"
+            f" {info.hits} hits, {info.misses} misses)"
+        )
+    lale.search.schema2search_space.search_space_cache_size = default_size
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
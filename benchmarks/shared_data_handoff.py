@@ -0,0 +1,89 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time and memory of handing a dataset to spawned worker processes.
+
+Starts n_workers spawned processes that each receive a data frame,
+either pickled, as multiprocessing does with process arguments, or as
+a handle to shared memory from lale.shared_data. Reports the time until
+all workers have the data and the sum of their proportional memory.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/shared_data_handoff.py [n_megabytes] [n_workers]
+"""
+
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from lale.shared_data import SharedData, SharedDataHandle
+
+
+def _pss_kib() -> int:
+    # proportional set size, which splits shared pages among their users
+    with open("/proc/self/smaps_rollup", encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    return 0
+
+
+def _worker(data, conn):
+    if isinstance(data, SharedDataHandle):
+        data = data.load()
+    total = float(data.to_numpy().sum())  # touch all the data
+    conn.send((total, _pss_kib()))
+    conn.close()
+
+
+def _hand_off(ctx, data, n_workers):
+    start = time.perf_counter()
+    conns, procs = [], []
+    for _ in range(n_workers):
+        parent_conn, child_conn = ctx.Pipe()
+        proc = ctx.Process(target=_worker, args=(data, child_conn))
+        proc.start()
+        conns.append(parent_conn)
+        procs.append(proc)
+    results = [conn.recv() for conn in conns]
+    elapsed = time.perf_counter() - start
+    for proc in procs:
+        proc.join()
+    return elapsed, sum(pss for _, pss in results) / 1024
+
+
+def main(n_megabytes: int = 1000, n_workers: int = 4):
+    ctx = multiprocessing.get_context("spawn")
+    n_rows = n_megabytes * 2**20 // (8 * 100)
+    X = pd.DataFrame(np.random.default_rng(42).random((n_rows, 100)))
+    print(
+        f"data frame of {X.memory_usage().sum() / 2**20:.0f} MiB, {n_workers} workers"
+    )
+    elapsed, pss = _hand_off(ctx, X, n_workers)
+    print(f"{'pickled':20s} {elapsed:7.2f} s  workers' memory {pss:8.0f} MiB")
+    start = time.perf_counter()
+    with SharedData() as shared:
+        handle = shared.share(X)
+        share_time = time.perf_counter() - start
+        elapsed, pss = _hand_off(ctx, handle, n_workers)
+    print(
+        f"{'shared memory':20s} {share_time + elapsed:7.2f} s  workers' memory {pss:8.0f} MiB"
+        f"  (sharing took {share_time:.2f} s)"
+    )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,68 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Predict latency with data schema validation on, with and without caching.
+
+With data schema validation enabled, every step of a pipeline checks
+that the schema of its input is a subschema of the schema it expects.
+Compares the latency of predicting a batch when is_subschema recomputes
+every verdict (cache size zero) against reusing cached verdicts, and
+reports the hit rate of the cache.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/subschema_cache_latency.py [n_calls] [n_rows]
+"""
+
+import sys
+import timeit
+
+import sklearn.datasets
+
+import lale.settings
+import lale.type_checking
+from lale.lib.sklearn import PCA, LogisticRegression, StandardScaler
+
+
+def main(n_calls: int = 50, n_rows: int = 100):
+    X, y = sklearn.datasets.load_iris(return_X_y=True)
+    trained = (StandardScaler() >> PCA(n_components=2) >> LogisticRegression()).fit(
+        X, y
+    )
+    batch = X[:n_rows]
+    existing_flag = lale.settings.disable_data_schema_validation
+    default_size = lale.type_checking.subschema_cache_size
+    lale.settings.set_disable_data_schema_validation(True)
+    seconds = min(timeit.repeat(lambda: trained.predict(batch), number=n_calls))
+    print(f"{'validation off':22s} {1e3 * seconds / n_calls:8.2f} ms/predict")
+    lale.settings.set_disable_data_schema_validation(False)
+    try:
+        for label, size in [
+            ("validation, uncached", 0),
+            ("validation, cached", default_size),
+        ]:
+            lale.type_checking.subschema_cache_size = size
+            lale.type_checking.clear_subschema_cache()
+            seconds = min(
+                timeit.repeat(lambda: trained.predict(batch), number=n_calls, repeat=3)
+            )
+            info = lale.type_checking.subschema_cache_info()
+            lookups = info.hits + info.misses
+            hit_rate = f"  hit rate {info.hits / lookups:6.1%}" if lookups else ""
+            print(f"{label:22s} {1e3 * seconds / n_calls:8.2f} ms/predict{hit_rate}")
+    finally:
+        lale.type_checking.subschema_cache_size = default_size
+        lale.settings.set_disable_data_schema_validation(existing_flag)
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,72 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Time and peak memory of scoring a stream of batches.
+
+Batches are generated on the fly, so the input never exists in memory
+as a whole. Compares collecting the outputs in memory against writing
+them into a preallocated .npy memmap with transform_with_batches.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/transform_with_batches_memory.py [n_rows] [batch_size]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from lale.lib.sklearn import PCA, StandardScaler
+
+
+def main(n_rows: int = 2_000_000, batch_size: int = 10_000):
+    n_features = 20
+    rng = np.random.default_rng(42)
+    trained = (StandardScaler() >> PCA(n_components=10)).fit(
+        rng.normal(size=(10_000, n_features))
+    )
+
+    def batches():
+        for start in range(0, n_rows, batch_size):
+            stop = min(n_rows, start + batch_size)
+            yield rng.normal(size=(stop - start, n_features))
+
+    def measure(name, f):
+        tracemalloc.start()
+        start = time.perf_counter()
+        f()
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{name:22s} {elapsed:7.2f} s  peak {peak / 2**20:8.1f} MiB")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "out.npy")
+        measure("in memory", lambda: trained.transform_with_batches(batches()))
+        measure(
+            "streamed to .npy",
+            lambda: trained.transform_with_batches(
+                batches(), output_file=path, n_rows=n_rows
+            ),
+        )
+        measure(
+            "generator only",
+            lambda: sum(len(b) for b in trained.transform_batches(batches())),
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,95 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Search time of Hyperopt and GridSearchCV with and without a trial cache.
+
+Searches a planned pipeline whose choices make Hyperopt propose the
+same pipeline repeatedly on a synthetic classification dataset, first
+without a trial cache, then with an empty one, and then again with the
+cache left by the previous searches, which here is shared by
+GridSearchCV and Hyperopt and persisted in a temporary directory.
+Prints the wall-clock time, the number of trials found in the cache,
+and the cross-validation score of the best trial.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/trial_cache.py [max_evals] [n_rows]
+"""
+
+import sys
+import tempfile
+import time
+import warnings
+
+from sklearn.datasets import make_classification
+from sklearn.model_selection import StratifiedKFold
+
+from lale.lib.lale import GridSearchCV, Hyperopt, NoOp
+from lale.lib.sklearn import (
+    PCA,
+    DecisionTreeClassifier,
+    GaussianNB,
+    KNeighborsClassifier,
+    MinMaxScaler,
+    StandardScaler,
+)
+from lale.trial_cache import TrialCache
+
+
+def main(max_evals: int = 100, n_rows: int = 10000):
+    warnings.filterwarnings("ignore")
+    X, y = make_classification(n_rows, 30, n_informative=10, random_state=42)
+    cv = StratifiedKFold(5)
+    planned = (NoOp | MinMaxScaler | StandardScaler | PCA) >> (
+        GaussianNB | KNeighborsClassifier | DecisionTreeClassifier
+    )
+
+    def hyperopt(trial_cache) -> str:
+        hpo = Hyperopt(
+            estimator=planned,
+            cv=cv,
+            max_evals=max_evals,
+            trial_cache=trial_cache,
+            show_progressbar=False,
+        )
+        trained = hpo.fit(X, y)
+        results = trained.impl._trials.results
+        n_cached = sum(r.get("cached", False) for r in results)
+        score = -trained.summary()["loss"].min()
+        return f"cached {n_cached:3d}/{len(results)}  best cv score {score:.4f}"
+
+    def grid_search(trial_cache) -> str:
+        clf = GridSearchCV(
+            estimator=planned, cv=cv, lale_num_samples=1, trial_cache=trial_cache
+        )
+        grid = clf.fit(X, y).impl.grid
+        n_evaluated = 0 if grid is None else len(grid.cv_results_["params"])
+        return f"evaluated {n_evaluated} candidates"
+
+    with tempfile.TemporaryDirectory() as path:
+        persisted = TrialCache(path)
+        runs = [
+            ("Hyperopt, no cache", hyperopt, None),
+            ("Hyperopt, empty cache", hyperopt, TrialCache()),
+            ("GridSearchCV, empty cache", grid_search, persisted),
+            ("Hyperopt, after grid", hyperopt, persisted),
+            ("Hyperopt, from disk", hyperopt, TrialCache(path)),
+        ]
+        for label, search, trial_cache in runs:
+            start = time.perf_counter()
+            outcome = search(trial_cache)
+            elapsed = time.perf_counter() - start
+            print(f"{label:26s} {elapsed:7.1f} s  {outcome}")
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -0,0 +1,81 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Per-trial cost of instantiating operators from a Hyperopt search space.
+
+Samples configurations from the search space that Hyperopt would use
+and times creating the trainables from them, once trusting that they
+are valid by construction (only side constraints are checked) and once
+with full hyperparameter validation, which also proposes fixes for
+configurations that violate a constraint.
+
+Usage: PYTHONPATH=`pwd` python benchmarks/trusted_hyperparams_overhead.py [n_configs]
+"""
+
+import contextlib
+import sys
+import time
+from unittest import mock
+
+import hyperopt.pyll.stochastic
+import numpy as np
+
+import lale.settings
+from lale.helpers import create_instance_from_hyperopt_search_space
+from lale.lib.sklearn import (
+    PCA,
+    KNeighborsClassifier,
+    LogisticRegression,
+    RandomForestClassifier,
+)
+from lale.search.op2hp import hyperopt_search_space
+
+
+def _instantiate_all(planned, configs):
+    n_failed = 0
+    start = time.perf_counter()
+    for params in configs:
+        try:
+            create_instance_from_hyperopt_search_space(planned, params)
+        except Exception:
+            n_failed += 1
+    return time.perf_counter() - start, n_failed
+
+
+def main(n_configs: int = 500):
+    cases = {
+        "LogisticRegression": LogisticRegression,
+        "RandomForestClassifier": RandomForestClassifier,
+        "PCA >> (LR | KNN)": PCA >> (LogisticRegression | KNeighborsClassifier),
+    }
+    for name, planned in cases.items():
+        space = hyperopt_search_space(planned)
+        rng = np.random.RandomState(42)
+        configs = [
+            hyperopt.pyll.stochastic.sample(space, rng=rng) for _ in range(n_configs)
+        ]
+        with mock.patch.object(
+            lale.settings, "trusted_hyperparams", contextlib.nullcontext
+        ):
+            full, n_failed = _instantiate_all(planned, configs)
+        trusted, n_failed_trusted = _instantiate_all(planned, configs)
+        print(
+            f"{name:24s} full {1e3 * full / n_configs:6.2f} ms/trial"
+            f"  trusted {1e3 * trusted / n_configs:6.2f} ms/trial"
+            f"  ({full / trusted:4.2f}x, rejected {n_failed} vs {n_failed_trusted})"
+        )
+
+
+if __name__ == "__main__":
+    main(*[int(a) for a in sys.argv[1:]])
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import threading
+import weakref
 from typing import Any, List, Optional, Tuple, Type, Union
 
 import numpy as np
@@ -469,6 +472,95 @@ def csr_matrix_to_schema(matrix) -> JSON_TYPE:
     return result
 
 
+# Schemas of the columns of data frames, keyed by the identity of their
+# columns index and checked against the index and the dtypes.  Row
+# slices, such as the folds of cross-validation, share the columns index
+# of the data frame they came from, so their schemas are only updated
+# with the new number of rows.  Entries are shared and must not be
+# modified.
+_column_schema_cache: (
+    "collections.OrderedDict[int, Tuple[weakref.ref, np.ndarray, List[JSON_TYPE]]]"
+) = collections.OrderedDict()
+_column_schema_cache_lock = threading.Lock()
+_column_schema_cache_hits = 0
+_column_schema_cache_misses = 0
+column_schema_cache_size: int = 16
+
+ColumnSchemaCacheInfo = collections.namedtuple(
+    "ColumnSchemaCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+def column_schema_cache_info() -> ColumnSchemaCacheInfo:
+    """Hit and miss counts of the cache of data frame column schemas.
+
+    Returns
+    -------
+    ColumnSchemaCacheInfo
+        Named tuple of hits, misses, maxsize, and currsize, like
+        the cache_info of functools.lru_cache.
+    """
+    with _column_schema_cache_lock:
+        return ColumnSchemaCacheInfo(
+            _column_schema_cache_hits,
+            _column_schema_cache_misses,
+            column_schema_cache_size,
+            len(_column_schema_cache),
+        )
+
+
+def clear_column_schema_cache() -> None:
+    """Forget all cached column schemas and reset the counters."""
+    global _column_schema_cache_hits, _column_schema_cache_misses
+    with _column_schema_cache_lock:
+        _column_schema_cache.clear()
+        _column_schema_cache_hits = 0
+        _column_schema_cache_misses = 0
+
+
+def _summarize_columns(columns, dtypes) -> List[JSON_TYPE]:
+    # wide data frames have many columns but few distinct dtypes
+    templates = {}
+    items = []
+    for col, typ in zip(columns, dtypes):
+        template = templates.get(typ)
+        if template is None:
+            template = templates[typ] = _dtype_to_schema(typ)
+        items.append({"description": str(col), **template})
+    return items
+
+
+def _column_schemas(df) -> List[JSON_TYPE]:
+    global _column_schema_cache_hits, _column_schema_cache_misses
+    columns, dtypes = df.columns, df.dtypes.values
+    if column_schema_cache_size <= 0:
+        return _summarize_columns(columns, dtypes)
+    key = id(columns)
+    with _column_schema_cache_lock:
+        entry = _column_schema_cache.get(key)
+        if (
+            entry is not None
+            and entry[0]() is columns
+            and len(entry[1]) == len(dtypes)
+            and (entry[1] == dtypes).all()
+        ):
+            _column_schema_cache.move_to_end(key)
+            _column_schema_cache_hits += 1
+            items = entry[2]
+        else:
+            items = None
+            _column_schema_cache_misses += 1
+    if items is None:
+        items = _summarize_columns(columns, dtypes)
+        with _column_schema_cache_lock:
+            _column_schema_cache[key] = (weakref.ref(columns), dtypes, items)
+            _column_schema_cache.move_to_end(key)
+            while len(_column_schema_cache) > column_schema_cache_size:
+                _column_schema_cache.popitem(last=False)
+    # callers may edit the schemas they get, so they get their own copies
+    return [dict(item) for item in items]
+
+
 def _dataframe_to_schema(df) -> JSON_TYPE:
     assert isinstance(df, DataFrame)
     if (
@@ -478,12 +570,8 @@ def _dataframe_to_schema(df) -> JSON_TYPE:
     ):
         return df.json_schema
     n_rows, n_columns = df.shape
-    df_dtypes = df.dtypes
-    assert n_columns == len(df.columns) and n_columns == len(df_dtypes)
-    items = [
-        {"description": str(col), **_dtype_to_schema(df_dtypes[col])}
-        for col in df.columns
-    ]
+    items = _column_schemas(df)
+    assert n_columns == len(items)
     result = {
         "type": "array",
         "minItems": n_rows,
@@ -730,7 +818,17 @@ def _to_schema(obj) -> JSON_TYPE:
     return result
 
 
+def _is_inferred_from_dtype(obj) -> bool:
+    # such schemas are assembled from the valid results of _dtype_to_schema,
+    # and validating them takes time proportional to the number of columns
+    return (
+        isinstance(obj, (ndarray, csr_matrix, DataFrame, Series))
+        and getattr(obj, "json_schema", None) is None
+    )
+
+
 def to_schema(obj) -> JSON_TYPE:
     result = _to_schema(obj)
-    lale.type_checking.validate_is_schema(result)
+    if not _is_inferred_from_dtype(obj):
+        lale.type_checking.validate_is_schema(result)
     return result
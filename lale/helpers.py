@@ -13,20 +13,25 @@
 # limitations under the License.
 
 import ast
+import concurrent.futures
 import copy
 import importlib
 import logging
+import os
 import time
 import traceback
 from importlib import util
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
+    NamedTuple,
     Optional,
     Set,
     Tuple,
@@ -45,6 +50,8 @@ from sklearn.model_selection import StratifiedKFold
 from sklearn.utils.metaestimators import _safe_split
 
 import lale.datasets.data_schemas
+import lale.settings
+from lale.pruners import Pruner, TrialPruned
 
 try:
     import torch
@@ -66,6 +73,7 @@ LALE_NESTED_SPACE_KEY = "__lale_nested_space"
 astype_type = Literal["lale", "sklearn"]
 datatype_param_type = Literal["pandas", "spark"]
 randomstate_type = Union[RandomState, int, None]
+prefer_type = Literal["threads", "processes"]
 
 
 def make_nested_hyperopt_space(sub_space):
@@ -170,6 +178,11 @@ def ndarray_to_json(arr: np.ndarray, subsample_array: bool = True) -> Union[list
             np.iinfo(int).max,
         ]
 
+    if arr.dtype.kind in "biufU" and not isinstance(arr, np.matrix):
+        # tolist converts to bool, int, float, and str in one pass
+        sample = arr[tuple(slice(n) for n in num_subsamples[: arr.ndim])]
+        return sample.tolist()
+
     def subarray_to_json(indices: Tuple[int, ...]) -> Any:
         if len(indices) == len(arr.shape):
             if isinstance(arr[indices], (bool, int, float, str)):
@@ -250,6 +263,165 @@ def fold_schema(X, y, cv=1, is_classifier=True):
     return result
 
 
+def effective_n_jobs(n_jobs: Optional[int]) -> int:
+    """Number of workers for n_jobs, following the joblib convention
+    where negative values count backwards from the number of CPUs."""
+    if n_jobs is None or n_jobs == 0:
+        return 1
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return n_jobs
+
+
+class FoldTimes(NamedTuple):
+    """Wall-clock and CPU seconds spent fitting and scoring one fold."""
+
+    wall_time: float
+    cpu_time: float
+
+
+def _map_folds(
+    fn: Callable[..., Any],
+    fold_args: Iterable[Tuple[Any, ...]],
+    n_jobs: Optional[int],
+    prefer: prefer_type,
+) -> Iterator[Any]:
+    """Apply fn to the arguments of each fold and yield the results in
+    the order of the folds. With more than one worker, the folds run
+    concurrently on a thread or process pool, and the arguments of at
+    most twice as many folds as workers are held at any time."""
+    workers = effective_n_jobs(n_jobs)
+    if workers == 1:
+        for args in fold_args:
+            yield fn(*args)
+        return
+    executor: concurrent.futures.Executor
+    if prefer == "processes":
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    elif prefer == "threads":
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(f"prefer must be 'threads' or 'processes', got {prefer}")
+    with executor:
+        pending: List[concurrent.futures.Future] = []
+        try:
+            for args in fold_args:
+                if len(pending) == 2 * workers:
+                    yield pending.pop(0).result()
+                pending.append(executor.submit(fn, *args))
+            while pending:
+                yield pending.pop(0).result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _fold_estimator(estimator, parallel: bool):
+    """The estimator to fit on one fold, copied when folds run
+    concurrently on threads. Other estimators are trained in place, and
+    even trainable Lale operators remember their last fit, so folds
+    cannot share them."""
+    if not parallel:
+        return estimator
+    return copy.deepcopy(estimator)
+
+
+class _PrecomputedPredictions:
+    """Stands in for a trained estimator when scoring X, answering the
+    methods whose outputs on X were computed in advance and delegating
+    everything else (including calls on other data) to the estimator."""
+
+    def __init__(self, trained, X, outputs: Dict[str, Any]):
+        self._trained = trained
+        self._X = X
+        self._outputs = outputs
+
+    def __getattr__(self, name):
+        outputs = self.__dict__.get("_outputs", {})
+        if name in outputs:
+
+            def method(X, *args, **kwargs):
+                if X is self._X and not args and not kwargs:
+                    return outputs[name]
+                return getattr(self._trained, name)(X, *args, **kwargs)
+
+            method.__name__ = name  # sklearn dispatches on the method name
+            return method
+        return getattr(self._trained, name)
+
+
+def _predict_for_scoring(trained, X_test) -> Dict[str, Any]:
+    """Run predict and predict_proba of a trained pipeline in one pass
+    over its preceding steps, or return what is available."""
+    import lale.operators
+
+    if not isinstance(trained, lale.operators.TrainedPipeline):
+        return {}
+    sink = trained.get_last()
+    if sink is None or not sink.has_method("predict"):
+        return {}
+    methods = ["predict"]
+    if sink.has_method("predict_proba"):
+        methods.append("predict_proba")
+    try:
+        return trained.predict_many(X_test, methods)
+    except (AttributeError, NotImplementedError):
+        # for instance, the wrapped model disables predict_proba
+        return {}
+
+
+def _fit_and_score_fold(
+    estimator,
+    X_train,
+    y_train,
+    X_test,
+    y_test,
+    scorer,
+    args_to_scorer: Dict[str, Any],
+    fit_params: Dict[str, Any],
+    cpu_clock: Callable[[], float],
+) -> Tuple[Any, Optional[float], FoldTimes]:
+    start, cpu_start = time.time(), cpu_clock()
+    # Not calling sklearn.base.clone() here, because:
+    #  (1) For Lale pipelines, clone() calls the pipeline constructor
+    #      with edges=None, so the resulting topology is incorrect.
+    #  (2) For Lale individual operators, the fit() method already
+    #      clones the impl object, so cloning again is redundant.
+    trained = estimator.fit(X_train, y_train, **fit_params)
+    # for pipelines, run the transformers on X_test only once for
+    # both the scorer and the log loss below
+    predictions = _predict_for_scoring(trained, X_test)
+    score_value = scorer(
+        (
+            _PrecomputedPredictions(trained, X_test, predictions)
+            if predictions
+            else trained
+        ),
+        X_test,
+        y_test,
+        **args_to_scorer,
+    )
+    fold_times = FoldTimes(time.time() - start, cpu_clock() - cpu_start)
+    # not all estimators have predict probability
+    logloss: Optional[float] = None
+    try:
+        if "predict_proba" in predictions:
+            y_pred_proba = predictions["predict_proba"]
+        else:
+            y_pred_proba = trained.predict_proba(X_test)
+        logloss = log_loss(y_true=y_test, y_pred=y_pred_proba)
+    except BaseException:
+        logger.debug("Warning, log loss cannot be computed")
+    return score_value, logloss, fold_times
+
+
+def _cpu_clock(n_jobs: Optional[int], prefer: prefer_type) -> Callable[[], float]:
+    # concurrent threads share the CPU time of the process
+    if effective_n_jobs(n_jobs) > 1 and prefer == "threads":
+        return time.thread_time
+    return time.process_time
+
+
 def cross_val_score_track_trials(
     estimator,
     X,
@@ -258,6 +430,10 @@ def cross_val_score_track_trials(
     cv: Any = 5,
     args_to_scorer: Optional[Dict[str, Any]] = None,
     args_to_cv: Optional[Dict[str, Any]] = None,
+    n_jobs: Optional[int] = None,
+    prefer: prefer_type = "threads",
+    return_fold_times: bool = False,
+    pruner: Optional[Pruner] = None,
     **fit_params,
 ):
     """
@@ -284,10 +460,23 @@ def cross_val_score_track_trials(
                 Used for cases where the scorer has a signature such as ``scorer(estimator, X, y, **kwargs)``.
     args_to_cv: A dictionary of additional keyword arguments to pass to the split method of cv.
                 This is only applicable when cv is not an integer.
+    n_jobs: Number of folds to fit and score concurrently.
+                None or 1 runs the folds one at a time, -1 uses all processors.
+    prefer: "threads" or "processes", whether concurrent folds run on a thread pool or on a process pool.
+                Threads avoid copying the data and work well for estimators that release the GIL;
+                processes require the estimator, data, and scorer to be picklable.
+    return_fold_times: If True, also return the wall-clock and CPU time of each fold.
+    pruner: A lale.pruners.Pruner that is asked after each fold but the last whether to stop
+                the trial, and to which the trial is reported if it finishes all folds.
     fit_params: Additional parameters that should be passed when calling fit on the estimator
     Returns
     -------
-        cv_results: a list of scores corresponding to each cross validation fold
+        cv_results: a tuple of the mean score, mean log loss, and mean time over the folds,
+            followed by a list of FoldTimes (one per fold) if return_fold_times is True.
+            With concurrent threads, the CPU time of a fold only counts its own thread.
+    Raises
+    ------
+        TrialPruned: If the pruner stopped the trial, with the results of the finished folds.
     """
     if isinstance(cv, int):
         cv = StratifiedKFold(cv)
@@ -297,39 +486,84 @@ def cross_val_score_track_trials(
     if args_to_cv is None:
         args_to_cv = {}
     scorer = check_scoring(estimator, scoring=scoring)
+    shared = effective_n_jobs(n_jobs) > 1 and prefer == "threads"
+    cpu_clock = _cpu_clock(n_jobs, prefer)
+
+    def fold_args():
+        for train, test in cv.split(X, y, **args_to_cv):
+            X_train, y_train = split_with_schemas(estimator, X, y, train)
+            X_test, y_test = split_with_schemas(estimator, X, y, test, train)
+            yield (
+                _fold_estimator(estimator, shared),
+                X_train,
+                y_train,
+                X_test,
+                y_test,
+                scorer,
+                args_to_scorer,
+                fit_params,
+                cpu_clock,
+            )
+
+    n_splits = None
+    if pruner is not None and hasattr(cv, "get_n_splits"):
+        n_splits = cv.get_n_splits(X, y, **args_to_cv)
     cv_results: List[float] = []
     log_loss_results = []
-    time_results = []
-    for train, test in cv.split(X, y, **args_to_cv):
-        X_train, y_train = split_with_schemas(estimator, X, y, train)
-        X_test, y_test = split_with_schemas(estimator, X, y, test, train)
-        start = time.time()
-        # Not calling sklearn.base.clone() here, because:
-        #  (1) For Lale pipelines, clone() calls the pipeline constructor
-        #      with edges=None, so the resulting topology is incorrect.
-        #  (2) For Lale individual operators, the fit() method already
-        #      clones the impl object, so cloning again is redundant.
-        trained = estimator.fit(X_train, y_train, **fit_params)
-        score_value = scorer(trained, X_test, y_test, **args_to_scorer)
-        execution_time = time.time() - start
-        # not all estimators have predict probability
-        try:
-            y_pred_proba = trained.predict_proba(X_test)
-            logloss = log_loss(y_true=y_test, y_pred=y_pred_proba)
-            log_loss_results.append(logloss)
-        except BaseException:
-            logger.debug("Warning, log loss cannot be computed")
+    fold_times: List[FoldTimes] = []
+    mean_scores: List[float] = []
+    for score_value, logloss, times in _map_folds(
+        _fit_and_score_fold, fold_args(), n_jobs, prefer
+    ):
         cv_results.append(score_value)
-        time_results.append(execution_time)
+        if logloss is not None:
+            log_loss_results.append(logloss)
+        fold_times.append(times)
+        if pruner is None:
+            continue
+        fold = len(mean_scores)
+        mean_scores.append(float(np.array(cv_results).mean()))
+        if (n_splits is None or fold + 1 < n_splits) and pruner.should_prune(
+            fold, mean_scores[-1]
+        ):
+            raise TrialPruned(
+                mean_scores[-1],
+                np.array(log_loss_results).mean(),
+                np.array([t.wall_time for t in fold_times]).mean(),
+                fold + 1,
+            )
+    if pruner is not None:
+        pruner.report(mean_scores)
     result = (
         np.array(cv_results).mean(),
         np.array(log_loss_results).mean(),
-        np.array(time_results).mean(),
+        np.array([t.wall_time for t in fold_times]).mean(),
     )
+    if return_fold_times:
+        return result + (fold_times,)
     return result
 
 
-def cross_val_score(estimator, X, y=None, scoring: Any = accuracy_score, cv: Any = 5):
+def _fit_and_predict_fold(
+    estimator, X_train, y_train, X_test, y_test, scoring, cpu_clock
+) -> Tuple[Any, FoldTimes]:
+    start, cpu_start = time.time(), cpu_clock()
+    trained_estimator = estimator.fit(X_train, y_train)
+    predicted_values = trained_estimator.predict(X_test)
+    score_value = scoring(y_test, predicted_values)
+    return score_value, FoldTimes(time.time() - start, cpu_clock() - cpu_start)
+
+
+def cross_val_score(
+    estimator,
+    X,
+    y=None,
+    scoring: Any = accuracy_score,
+    cv: Any = 5,
+    n_jobs: Optional[int] = None,
+    prefer: prefer_type = "threads",
+    return_fold_times: bool = False,
+):
     """
     Use the given estimator to perform fit and predict for splits defined by 'cv' and compute the given score on
     each of the splits.
@@ -345,22 +579,45 @@ def cross_val_score(estimator, X, y=None, scoring: Any = accuracy_score, cv: Any
     cv: an integer or an object that has a split function as a generator yielding (train, test) splits as arrays of indices.
         Integer value is used as number of folds in sklearn.model_selection.StratifiedKFold, default is 5.
         Note that any of the iterators from https://scikit-learn.org/stable/modules/cross_validation.html#cross-validation-iterators can be used here.
+    n_jobs: Number of folds to fit and score concurrently.
+        None or 1 runs the folds one at a time, -1 uses all processors.
+    prefer: "threads" or "processes", whether concurrent folds run on a thread pool or on a process pool.
+    return_fold_times: If True, also return the wall-clock and CPU time of each fold.
 
     Returns
     -------
-    cv_results: a list of scores corresponding to each cross validation fold
+    cv_results: a list of scores corresponding to each cross validation fold,
+        followed by a list of FoldTimes (one per fold) if return_fold_times is True.
     """
     if isinstance(cv, int):
         cv = StratifiedKFold(cv)
 
-    cv_results = []
-    for train, test in cv.split(X, y):
-        X_train, y_train = split_with_schemas(estimator, X, y, train)
-        X_test, y_test = split_with_schemas(estimator, X, y, test, train)
-        trained_estimator = estimator.fit(X_train, y_train)
-        predicted_values = trained_estimator.predict(X_test)
-        cv_results.append(scoring(y_test, predicted_values))
+    shared = effective_n_jobs(n_jobs) > 1 and prefer == "threads"
+    cpu_clock = _cpu_clock(n_jobs, prefer)
+
+    def fold_args():
+        for train, test in cv.split(X, y):
+            X_train, y_train = split_with_schemas(estimator, X, y, train)
+            X_test, y_test = split_with_schemas(estimator, X, y, test, train)
+            yield (
+                _fold_estimator(estimator, shared),
+                X_train,
+                y_train,
+                X_test,
+                y_test,
+                scoring,
+                cpu_clock,
+            )
 
+    cv_results = []
+    fold_times: List[FoldTimes] = []
+    for score_value, times in _map_folds(
+        _fit_and_predict_fold, fold_args(), n_jobs, prefer
+    ):
+        cv_results.append(score_value)
+        fold_times.append(times)
+    if return_fold_times:
+        return cv_results, fold_times
     return cv_results
 
 
@@ -506,7 +763,10 @@ def create_instance_from_hyperopt_search_space(
                     new_hyperparams[k] = updated_params
 
         all_hyperparams = {**obj_hyperparams, **new_hyperparams}
-        return lale_object(**all_hyperparams)
+        # the hyperparameters were drawn from a search space compiled from
+        # the schema of lale_object, so they are valid by construction
+        with lale.settings.trusted_hyperparams():
+            return lale_object(**all_hyperparams)
     elif isinstance(lale_object, BasePipeline):
         steps = lale_object.steps_list()
         if len(hyperparams) != len(steps):
@@ -560,12 +820,15 @@ def find_lale_wrapper(sklearn_obj: Any) -> Optional[Any]:
     :param sklearn_obj: An sklearn compatible object that may have a lale wrapper
     :return: The lale wrapper type, or None if one could not be found
     """
+    from .lib._catalog import may_define
     from .operator_wrapper import get_lale_wrapper_modules
 
     module_names = get_lale_wrapper_modules()
 
     class_name = sklearn_obj.__class__.__name__
     for module_name in module_names:
+        if not may_define(module_name, class_name):
+            continue
         try:
             module = importlib.import_module(module_name)
         except ModuleNotFoundError:
@@ -859,6 +1122,42 @@ def append_batch(data, batch_data):
     )
 
 
+def concat_batches(batches: List[Any]):
+    """Concatenate a list of batch outputs in one pass.
+
+    Unlike repeatedly calling append_batch, this copies each batch once.
+
+    Parameters
+    ----------
+    batches : list
+        Batches of the same type, as accepted by append_batch.
+
+    Returns
+    -------
+    The concatenated data, or None if batches is empty.
+    """
+    if len(batches) == 0:
+        return None
+    first = batches[0]
+    if len(batches) == 1:
+        return first
+    if isinstance(first, tuple):
+        return tuple(concat_batches(list(parts)) for parts in zip(*batches))
+    elif isinstance(first, np.ndarray):
+        if all(len(b.shape) == 1 for b in batches):
+            return np.concatenate(batches)
+        else:
+            return np.vstack(batches)
+    elif torch_installed and isinstance(first, torch.Tensor):
+        return torch.cat(batches)
+    elif isinstance(first, (pd.Series, pd.DataFrame)):
+        return pd.concat(batches, axis=0)
+    result = first
+    for batch_data in batches[1:]:
+        result = append_batch(result, batch_data)
+    return result
+
+
 def create_data_loader(
     X: Any,
     y: Any = None,
@@ -964,6 +1263,18 @@ def create_data_loader(
     )
 
 
+def _batch_output_shape(batch_out, n_rows, what):
+    if len(batch_out.shape) not in [1, 2, 3]:
+        raise ValueError(
+            f"{what} is expected to be a 1-d, 2-d or 3-d array. Any other data types are not handled."
+        )
+    return (n_rows, *batch_out.shape[1:])
+
+
+def _npy_label_path(file_path: str) -> str:
+    return file_path[: -len(".npy")] + "_y.npy"
+
+
 def write_batch_output_to_file(
     file_obj,
     file_path,
@@ -973,58 +1284,90 @@ def write_batch_output_to_file(
     batch_y,
     batch_out_X,
     batch_out_y,
+    row_offset: Optional[int] = None,
 ):
+    """Write the output of one batch into a preallocated file.
+
+    On the first call (file_obj is None), the file is created with room
+    for total_len input rows, scaled by the ratio of output to input rows
+    of the first batch. Paths ending in ".npy" are written as numpy
+    memory-mapped arrays (labels go to a sibling "_y.npy" file), any
+    other path as an HDF5 file with datasets "X" and "y", which
+    requires h5py.
+
+    Parameters
+    ----------
+    file_obj : h5py.File, dict, or None
+        What a previous call returned, or None for the first batch.
+    file_path : str or None
+        Where to create the file on the first call.
+    total_len : int
+        Number of input rows over all batches.
+    batch_idx : int
+        Index of this batch, used to locate its rows when row_offset is None.
+    batch_X, batch_y :
+        Input of this batch; batch_y is written when there is no batch_out_y.
+    batch_out_X, batch_out_y :
+        Output of this batch.
+    row_offset : int, optional
+        First output row of this batch. Needed when batches have
+        different lengths, for instance a shorter last batch.
+
+    Returns
+    -------
+    file_obj :
+        An open h5py.File, or a dictionary of numpy memmaps with keys
+        "X" and possibly "y"; pass it back in for the next batch.
+    """
     if file_obj is None and file_path is None:
         raise ValueError("Only one of the file object or file path can be None.")
+    if batch_out_y is None and batch_y is not None:
+        batch_out_y = batch_y
     if file_obj is None:
-        import h5py
-
-        file_obj = h5py.File(file_path, "w")
         # estimate the size of the dataset based on the first batch output size
         transform_ratio = int(len(batch_out_X) / len(batch_X))
-        if len(batch_out_X.shape) == 1:
-            h5_data_shape = (transform_ratio * total_len,)
-        elif len(batch_out_X.shape) == 2:
-            h5_data_shape = (transform_ratio * total_len, batch_out_X.shape[1])
-        elif len(batch_out_X.shape) == 3:
-            h5_data_shape = (
-                transform_ratio * total_len,
-                batch_out_X.shape[1],
-                batch_out_X.shape[2],
-            )
-        else:
-            raise ValueError(
-                "batch_out_X is expected to be a 1-d, 2-d or 3-d array. Any other data types are not handled."
-            )
-        dataset = file_obj.create_dataset(
-            name="X", shape=h5_data_shape, chunks=True, compression="gzip"
-        )
-        if batch_out_y is None and batch_y is not None:
-            batch_out_y = batch_y
+        n_rows = transform_ratio * total_len
+        h5_data_shape = _batch_output_shape(batch_out_X, n_rows, "batch_out_X")
         if batch_out_y is not None:
-            if len(batch_out_y.shape) == 1:
-                h5_labels_shape = (transform_ratio * total_len,)
-            elif len(batch_out_y.shape) == 2:
-                h5_labels_shape = (transform_ratio * total_len, batch_out_y.shape[1])
-            else:
+            h5_labels_shape = _batch_output_shape(batch_out_y, n_rows, "batch_out_y")
+            if len(h5_labels_shape) > 2:
                 raise ValueError(
                     "batch_out_y is expected to be a 1-d or 2-d array. Any other data types are not handled."
                 )
-            dataset = file_obj.create_dataset(
-                name="y", shape=h5_labels_shape, chunks=True, compression="gzip"
+        if str(file_path).endswith(".npy"):
+            file_obj = {
+                "X": np.lib.format.open_memmap(
+                    file_path,
+                    mode="w+",
+                    dtype=np.asarray(batch_out_X).dtype,
+                    shape=h5_data_shape,
+                )
+            }
+            if batch_out_y is not None:
+                file_obj["y"] = np.lib.format.open_memmap(
+                    _npy_label_path(file_path),
+                    mode="w+",
+                    dtype=np.asarray(batch_out_y).dtype,
+                    shape=h5_labels_shape,
+                )
+        else:
+            import h5py
+
+            file_obj = h5py.File(file_path, "w")
+            file_obj.create_dataset(
+                name="X", shape=h5_data_shape, chunks=True, compression="gzip"
             )
+            if batch_out_y is not None:
+                file_obj.create_dataset(
+                    name="y", shape=h5_labels_shape, chunks=True, compression="gzip"
+                )
+    if row_offset is None:
+        row_offset = batch_idx * len(batch_out_X)
     dataset = file_obj["X"]
-    dataset[batch_idx * len(batch_out_X) : (batch_idx + 1) * len(batch_out_X)] = (
-        batch_out_X
-    )
-    if batch_out_y is not None or batch_y is not None:
+    dataset[row_offset : row_offset + len(batch_out_X)] = batch_out_X
+    if batch_out_y is not None:
         labels = file_obj["y"]
-        if batch_out_y is not None:
-            labels[
-                batch_idx * len(batch_out_y) : (batch_idx + 1) * len(batch_out_y)
-            ] = batch_out_y
-        else:
-            labels[batch_idx * len(batch_y) : (batch_idx + 1) * len(batch_y)] = batch_y
+        labels[row_offset : row_offset + len(batch_out_y)] = batch_out_y
     return file_obj
 
 
@@ -0,0 +1,161 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Precomputed catalog of the operators in the packages of lale.lib.
+
+For each package, the catalog maps the operators it exports to the
+module that defines them and their tags. It is shipped as catalog.json next to this
+file, so that queries by tag (get_available_operators) and lookups by
+name (find_lale_wrapper, get_op_from_lale_lib) only import the wrappers
+they return rather than every wrapper of every package. Packages whose
+dependencies were missing when the catalog was generated are not
+covered, and are handled by importing them as before.
+
+Regenerate the catalog after adding or changing wrappers with
+
+.. code-block:: bash
+
+    python -m lale.lib._catalog
+"""
+
+import importlib
+import json
+import logging
+import os
+import sys
+from typing import AbstractSet, Any, Dict, List, Optional
+
+from lale.lib._lazy_imports import attached_packages
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = os.path.join(os.path.dirname(__file__), "catalog.json")
+
+CATALOG_PACKAGES = [
+    "lale.lib.aif360",
+    "lale.lib.autogen",
+    "lale.lib.imblearn",
+    "lale.lib.lale",
+    "lale.lib.lightgbm",
+    "lale.lib.rasl",
+    "lale.lib.sklearn",
+    "lale.lib.snapml",
+    "lale.lib.xgboost",
+]
+
+_catalog: Optional[Dict[str, Dict[str, Dict[str, Any]]]] = None
+
+
+def load_catalog() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """The catalog, as a dictionary from package names to dictionaries
+    from operator names to their entries."""
+    global _catalog
+    if _catalog is None:
+        try:
+            with open(CATALOG_FILE, encoding="utf-8") as f:
+                _catalog = json.load(f)["packages"]
+        except OSError:
+            logger.warning(f"Lale:Operator catalog {CATALOG_FILE} not found")
+            _catalog = {}
+    return _catalog
+
+
+def may_define(package_name: str, name: str) -> bool:
+    """False if the catalog covers the package and it does not export
+    an operator with the given name, True otherwise."""
+    entries = load_catalog().get(package_name)
+    return entries is None or name in entries
+
+
+def _tag_set(tags: Dict[str, List[str]]) -> AbstractSet[str]:
+    return {tag for prefix in tags for tag in tags[prefix]}
+
+
+def load_operators_with_tags(tags: AbstractSet[str]) -> None:
+    """Import the operators with all the given tags from the lazily
+    loaded packages imported so far, so that they become available.
+    Packages not covered by the catalog are imported completely."""
+    catalog = load_catalog()
+    for package_name, exports in list(attached_packages().items()):
+        package = sys.modules[package_name]
+        entries = catalog.get(package_name)
+        for name in exports:
+            if entries is None or (
+                name in entries and tags.issubset(_tag_set(entries[name]["tags"]))
+            ):
+                getattr(package, name)
+
+
+def build_catalog(
+    packages: Optional[List[str]] = None,
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """Import all operators of the given packages and describe them.
+
+    Parameters
+    ----------
+    packages : list of string, optional, default None
+        Names of the packages to cover, CATALOG_PACKAGES if None.
+        Packages that cannot be imported are skipped.
+
+    Returns
+    -------
+    dict
+        Package names mapped to operator names mapped to entries with
+        the keys module and tags.
+    """
+    from lale.operators import IndividualOp
+
+    result: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    for package_name in CATALOG_PACKAGES if packages is None else packages:
+        try:
+            package = importlib.import_module(package_name)
+            if package_name in attached_packages():
+                imports = attached_packages()[package_name]
+                names = sorted(imports)
+            else:
+                names = sorted(n for n in dir(package) if not n.startswith("_"))
+                imports = {}
+            ops = {name: getattr(package, name) for name in names}
+        except ImportError as e:
+            logger.warning(f"Lale:Not cataloging {package_name}: {e}")
+            continue
+        entries = {}
+        for name, op in ops.items():
+            if isinstance(op, IndividualOp):
+                if name in imports:
+                    module = importlib.util.resolve_name(imports[name], package_name)
+                else:
+                    submodules = [
+                        m
+                        for m in sorted(sys.modules)
+                        if m.startswith(package_name + ".")
+                        and getattr(sys.modules[m], name, None) is op
+                    ]
+                    module = submodules[0] if submodules else package_name
+                entries[name] = {"module": module, "tags": op.get_tags()}
+        result[package_name] = entries
+    return result
+
+
+def main():
+    catalog = build_catalog()
+    with open(CATALOG_FILE, "w", encoding="utf-8") as f:
+        json.dump({"packages": catalog}, f, indent=1, sort_keys=True)
+        f.write("\n")
+    n_ops = sum(len(entries) for entries in catalog.values())
+    print(f"wrote {n_ops} operators of {len(catalog)} packages to {CATALOG_FILE}")
+
+
+if __name__ == "__main__":
+    main()
@@ -211,3 +211,31 @@ schema_max_opt_time: JSON_TYPE = {
     ],
     "default": None,
 }
+
+schema_trial_cache: JSON_TYPE = {
+    "description": """Reuse the results of trials that evaluate the same pipeline.
+
+Trials are keyed by the canonical JSON of the pipeline they instantiate
+and a fingerprint of the data, the cross-validation, and the scoring, so
+repeated proposals are evaluated once (see lale.trial_cache). Only
+pipelines and data that can be described canonically are cached.
+
+A key takes a few milliseconds to compute, depending on the size of the
+pipeline. GridSearchCV computes the keys of all candidates of the grid
+before it evaluates any of them, so that it evaluates each distinct
+pipeline once. For a grid of 10,000 candidates, this can take minutes
+even when the cache is empty.""",
+    "anyOf": [
+        {"description": "Evaluate every trial.", "enum": [None, False]},
+        {
+            "description": "Share results with all optimizers of this process.",
+            "enum": [True],
+        },
+        {
+            "description": "Directory in which results are persisted, to be reused by later fits and other processes.",
+            "type": "string",
+        },
+        {"description": "lale.trial_cache.TrialCache"},
+    ],
+    "default": None,
+}
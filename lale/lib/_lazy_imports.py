@@ -0,0 +1,96 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Lazy loading of the operators exported by the packages in lale.lib.
+
+Each wrapper module builds its operator with make_operator when it is
+imported, which checks the schemas and generates docstrings. Instead of
+importing all wrapper modules eagerly, a package maps its exports to
+the modules that define them and installs the module-level
+``__getattr__`` returned by attach, which imports the defining module
+on first access. The same exports are also listed as imports guarded
+by ``if TYPE_CHECKING:``, so that static type checkers still see them.
+
+.. code-block:: python
+
+    from typing import TYPE_CHECKING
+
+    from lale.lib._lazy_imports import attach
+
+    if TYPE_CHECKING:
+        from .pca import PCA as PCA
+
+    _lazy_exports = {"PCA": ".pca"}
+
+    __getattr__, __dir__, __all__ = attach(__name__, _lazy_exports)
+"""
+
+import importlib
+import sys
+from typing import Any, Callable, Dict, List, Tuple
+
+_attached: Dict[str, Dict[str, str]] = {}
+
+
+def attached_packages() -> Dict[str, Dict[str, str]]:
+    """Names of the packages that use attach, mapped to their exports,
+    which are mapped to the modules that define them."""
+    return _attached
+
+
+def attach(
+    package_name: str, exports: Dict[str, str]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """Make the exports of a package load on first access.
+
+    Parameters
+    ----------
+    package_name : str
+        The ``__name__`` of the package.
+
+    exports : dict
+        Names exported by the package, mapped to the names of the
+        modules that define them under the same name, which are
+        relative to the package if they start with a dot.
+
+    Returns
+    -------
+    tuple
+        The ``__getattr__``, ``__dir__``, and ``__all__`` of the package.
+        Besides the exports, ``__getattr__`` also imports submodules
+        of the package that define them.
+    """
+    submodules = {
+        module[1:]
+        for module in exports.values()
+        if module.startswith(".") and not module.startswith("..")
+    }
+
+    def __getattr__(name: str) -> Any:
+        if name in exports:
+            module = importlib.import_module(exports[name], package_name)
+            value = getattr(module, name)
+        elif name in submodules:
+            value = importlib.import_module("." + name, package_name)
+        else:
+            raise AttributeError(f"module {package_name!r} has no attribute {name!r}")
+        # later accesses find the value without calling __getattr__
+        setattr(sys.modules[package_name], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package_name])) | set(exports))
+
+    _attached[package_name] = exports
+    return __getattr__, __dir__, sorted(exports)
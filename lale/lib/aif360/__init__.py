@@ -204,68 +204,136 @@ zero or one to simplify the task for the mitigator.
 
 """
 
+from typing import TYPE_CHECKING
+
+from lale.lib._lazy_imports import attach
+
+from ._suppress_aif360_warnings import dummy as _dummy_from_suppress_warnings
+
 # Note: all imports should be done as
 # from .xxx import XXX as XXX
 # this ensures that pyright considers them to be publicly available
 # and not private imports (this affects lale users that use pyright)
+if TYPE_CHECKING:
+    from .adversarial_debiasing import AdversarialDebiasing as AdversarialDebiasing
+    from .bagging_orbis_classifier import (
+        BaggingOrbisClassifier as BaggingOrbisClassifier,
+    )
+    from .calibrated_eq_odds_postprocessing import (
+        CalibratedEqOddsPostprocessing as CalibratedEqOddsPostprocessing,
+    )
+    from .datasets import _fetch_boston_housing_df as _fetch_boston_housing_df
+    from .datasets import fetch_adult_df as fetch_adult_df
+    from .datasets import fetch_bank_df as fetch_bank_df
+    from .datasets import fetch_compas_df as fetch_compas_df
+    from .datasets import fetch_compas_violent_df as fetch_compas_violent_df
+    from .datasets import fetch_creditg_df as fetch_creditg_df
+    from .datasets import fetch_default_credit_df as fetch_default_credit_df
+    from .datasets import fetch_heart_disease_df as fetch_heart_disease_df
+    from .datasets import fetch_law_school_df as fetch_law_school_df
+    from .datasets import fetch_meps_panel19_fy2015_df as fetch_meps_panel19_fy2015_df
+    from .datasets import fetch_meps_panel20_fy2015_df as fetch_meps_panel20_fy2015_df
+    from .datasets import fetch_meps_panel21_fy2016_df as fetch_meps_panel21_fy2016_df
+    from .datasets import fetch_nlsy_df as fetch_nlsy_df
+    from .datasets import fetch_nursery_df as fetch_nursery_df
+    from .datasets import fetch_ricci_df as fetch_ricci_df
+    from .datasets import fetch_speeddating_df as fetch_speeddating_df
+    from .datasets import fetch_student_math_df as fetch_student_math_df
+    from .datasets import fetch_student_por_df as fetch_student_por_df
+    from .datasets import fetch_tae_df as fetch_tae_df
+    from .datasets import fetch_titanic_df as fetch_titanic_df
+    from .datasets import fetch_us_crime_df as fetch_us_crime_df
+    from .disparate_impact_remover import (
+        DisparateImpactRemover as DisparateImpactRemover,
+    )
+    from .eq_odds_postprocessing import EqOddsPostprocessing as EqOddsPostprocessing
+    from .gerry_fair_classifier import GerryFairClassifier as GerryFairClassifier
+    from .lfr import LFR as LFR
+    from .meta_fair_classifier import MetaFairClassifier as MetaFairClassifier
+    from .optim_preproc import OptimPreproc as OptimPreproc
+    from .orbis import Orbis as Orbis
+    from .prejudice_remover import PrejudiceRemover as PrejudiceRemover
+    from .protected_attributes_encoder import (
+        ProtectedAttributesEncoder as ProtectedAttributesEncoder,
+    )
+    from .redacting import Redacting as Redacting
+    from .reject_option_classification import (
+        RejectOptionClassification as RejectOptionClassification,
+    )
+    from .reweighing import Reweighing as Reweighing
+    from .util import FAIRNESS_INFO_SCHEMA as FAIRNESS_INFO_SCHEMA
+    from .util import FairStratifiedKFold as FairStratifiedKFold
+    from .util import accuracy_and_disparate_impact as accuracy_and_disparate_impact
+    from .util import average_odds_difference as average_odds_difference
+    from .util import (
+        balanced_accuracy_and_disparate_impact as balanced_accuracy_and_disparate_impact,
+    )
+    from .util import count_fairness_groups as count_fairness_groups
+    from .util import dataset_to_pandas as dataset_to_pandas
+    from .util import disparate_impact as disparate_impact
+    from .util import equal_opportunity_difference as equal_opportunity_difference
+    from .util import f1_and_disparate_impact as f1_and_disparate_impact
+    from .util import (
+        fair_stratified_train_test_split as fair_stratified_train_test_split,
+    )
+    from .util import r2_and_disparate_impact as r2_and_disparate_impact
+    from .util import statistical_parity_difference as statistical_parity_difference
+    from .util import symmetric_disparate_impact as symmetric_disparate_impact
+    from .util import theil_index as theil_index
 
-from ._suppress_aif360_warnings import dummy as _dummy_from_suppress_warnings
-from .adversarial_debiasing import AdversarialDebiasing as AdversarialDebiasing
-from .bagging_orbis_classifier import BaggingOrbisClassifier as BaggingOrbisClassifier
-from .calibrated_eq_odds_postprocessing import (
-    CalibratedEqOddsPostprocessing as CalibratedEqOddsPostprocessing,
-)
-from .datasets import _fetch_boston_housing_df as _fetch_boston_housing_df
-from .datasets import fetch_adult_df as fetch_adult_df
-from .datasets import fetch_bank_df as fetch_bank_df
-from .datasets import fetch_compas_df as fetch_compas_df
-from .datasets import fetch_compas_violent_df as fetch_compas_violent_df
-from .datasets import fetch_creditg_df as fetch_creditg_df
-from .datasets import fetch_default_credit_df as fetch_default_credit_df
-from .datasets import fetch_heart_disease_df as fetch_heart_disease_df
-from .datasets import fetch_law_school_df as fetch_law_school_df
-from .datasets import fetch_meps_panel19_fy2015_df as fetch_meps_panel19_fy2015_df
-from .datasets import fetch_meps_panel20_fy2015_df as fetch_meps_panel20_fy2015_df
-from .datasets import fetch_meps_panel21_fy2016_df as fetch_meps_panel21_fy2016_df
-from .datasets import fetch_nlsy_df as fetch_nlsy_df
-from .datasets import fetch_nursery_df as fetch_nursery_df
-from .datasets import fetch_ricci_df as fetch_ricci_df
-from .datasets import fetch_speeddating_df as fetch_speeddating_df
-from .datasets import fetch_student_math_df as fetch_student_math_df
-from .datasets import fetch_student_por_df as fetch_student_por_df
-from .datasets import fetch_tae_df as fetch_tae_df
-from .datasets import fetch_titanic_df as fetch_titanic_df
-from .datasets import fetch_us_crime_df as fetch_us_crime_df
-from .disparate_impact_remover import DisparateImpactRemover as DisparateImpactRemover
-from .eq_odds_postprocessing import EqOddsPostprocessing as EqOddsPostprocessing
-from .gerry_fair_classifier import GerryFairClassifier as GerryFairClassifier
-from .lfr import LFR as LFR
-from .meta_fair_classifier import MetaFairClassifier as MetaFairClassifier
-from .optim_preproc import OptimPreproc as OptimPreproc
-from .orbis import Orbis as Orbis
-from .prejudice_remover import PrejudiceRemover as PrejudiceRemover
-from .protected_attributes_encoder import (
-    ProtectedAttributesEncoder as ProtectedAttributesEncoder,
-)
-from .redacting import Redacting as Redacting
-from .reject_option_classification import (
-    RejectOptionClassification as RejectOptionClassification,
-)
-from .reweighing import Reweighing as Reweighing
-from .util import FAIRNESS_INFO_SCHEMA as FAIRNESS_INFO_SCHEMA
-from .util import FairStratifiedKFold as FairStratifiedKFold
-from .util import accuracy_and_disparate_impact as accuracy_and_disparate_impact
-from .util import average_odds_difference as average_odds_difference
-from .util import (
-    balanced_accuracy_and_disparate_impact as balanced_accuracy_and_disparate_impact,
-)
-from .util import count_fairness_groups as count_fairness_groups
-from .util import dataset_to_pandas as dataset_to_pandas
-from .util import disparate_impact as disparate_impact
-from .util import equal_opportunity_difference as equal_opportunity_difference
-from .util import f1_and_disparate_impact as f1_and_disparate_impact
-from .util import fair_stratified_train_test_split as fair_stratified_train_test_split
-from .util import r2_and_disparate_impact as r2_and_disparate_impact
-from .util import statistical_parity_difference as statistical_parity_difference
-from .util import symmetric_disparate_impact as symmetric_disparate_impact
-from .util import theil_index as theil_index
+# the exports listed above, by the module that defines them
+_lazy_exports = {
+    "AdversarialDebiasing": ".adversarial_debiasing",
+    "BaggingOrbisClassifier": ".bagging_orbis_classifier",
+    "CalibratedEqOddsPostprocessing": ".calibrated_eq_odds_postprocessing",
+    "_fetch_boston_housing_df": ".datasets",
+    "fetch_adult_df": ".datasets",
+    "fetch_bank_df": ".datasets",
+    "fetch_compas_df": ".datasets",
+    "fetch_compas_violent_df": ".datasets",
+    "fetch_creditg_df": ".datasets",
+    "fetch_default_credit_df": ".datasets",
+    "fetch_heart_disease_df": ".datasets",
+    "fetch_law_school_df": ".datasets",
+    "fetch_meps_panel19_fy2015_df": ".datasets",
+    "fetch_meps_panel20_fy2015_df": ".datasets",
+    "fetch_meps_panel21_fy2016_df": ".datasets",
+    "fetch_nlsy_df": ".datasets",
+    "fetch_nursery_df": ".datasets",
+    "fetch_ricci_df": ".datasets",
+    "fetch_speeddating_df": ".datasets",
+    "fetch_student_math_df": ".datasets",
+    "fetch_student_por_df": ".datasets",
+    "fetch_tae_df": ".datasets",
+    "fetch_titanic_df": ".datasets",
+    "fetch_us_crime_df": ".datasets",
+    "DisparateImpactRemover": ".disparate_impact_remover",
+    "EqOddsPostprocessing": ".eq_odds_postprocessing",
+    "GerryFairClassifier": ".gerry_fair_classifier",
+    "LFR": ".lfr",
+    "MetaFairClassifier": ".meta_fair_classifier",
+    "OptimPreproc": ".optim_preproc",
+    "Orbis": ".orbis",
+    "PrejudiceRemover": ".prejudice_remover",
+    "ProtectedAttributesEncoder": ".protected_attributes_encoder",
+    "Redacting": ".redacting",
+    "RejectOptionClassification": ".reject_option_classification",
+    "Reweighing": ".reweighing",
+    "FAIRNESS_INFO_SCHEMA": ".util",
+    "FairStratifiedKFold": ".util",
+    "accuracy_and_disparate_impact": ".util",
+    "average_odds_difference": ".util",
+    "balanced_accuracy_and_disparate_impact": ".util",
+    "count_fairness_groups": ".util",
+    "dataset_to_pandas": ".util",
+    "disparate_impact": ".util",
+    "equal_opportunity_difference": ".util",
+    "f1_and_disparate_impact": ".util",
+    "fair_stratified_train_test_split": ".util",
+    "r2_and_disparate_impact": ".util",
+    "statistical_parity_difference": ".util",
+    "symmetric_disparate_impact": ".util",
+    "theil_index": ".util",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _lazy_exports)
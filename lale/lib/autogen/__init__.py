@@ -14,121 +14,249 @@ The following paper describes the schema extractor::
 
 """
 
-from lale.lib.sklearn.ada_boost_classifier import AdaBoostClassifier
-from lale.lib.sklearn.ada_boost_regressor import AdaBoostRegressor
-from lale.lib.sklearn.decision_tree_classifier import DecisionTreeClassifier
-from lale.lib.sklearn.decision_tree_regressor import DecisionTreeRegressor
-from lale.lib.sklearn.extra_trees_classifier import ExtraTreesClassifier
-from lale.lib.sklearn.extra_trees_regressor import ExtraTreesRegressor
-from lale.lib.sklearn.function_transformer import FunctionTransformer
-from lale.lib.sklearn.gaussian_nb import GaussianNB
-from lale.lib.sklearn.gradient_boosting_classifier import GradientBoostingClassifier
-from lale.lib.sklearn.gradient_boosting_regressor import GradientBoostingRegressor
-from lale.lib.sklearn.isomap import Isomap
-from lale.lib.sklearn.k_means import KMeans
-from lale.lib.sklearn.k_neighbors_classifier import KNeighborsClassifier
-from lale.lib.sklearn.k_neighbors_regressor import KNeighborsRegressor
-from lale.lib.sklearn.linear_regression import LinearRegression
-from lale.lib.sklearn.linear_svc import LinearSVC
-from lale.lib.sklearn.linear_svr import LinearSVR
-from lale.lib.sklearn.logistic_regression import LogisticRegression
-from lale.lib.sklearn.min_max_scaler import MinMaxScaler
-from lale.lib.sklearn.missing_indicator import MissingIndicator
-from lale.lib.sklearn.mlp_classifier import MLPClassifier
-from lale.lib.sklearn.multinomial_nb import MultinomialNB
-from lale.lib.sklearn.nmf import NMF
-from lale.lib.sklearn.normalizer import Normalizer
-from lale.lib.sklearn.nystroem import Nystroem
-from lale.lib.sklearn.one_hot_encoder import OneHotEncoder
-from lale.lib.sklearn.ordinal_encoder import OrdinalEncoder
-from lale.lib.sklearn.passive_aggressive_classifier import PassiveAggressiveClassifier
-from lale.lib.sklearn.pca import PCA
-from lale.lib.sklearn.polynomial_features import PolynomialFeatures
-from lale.lib.sklearn.quadratic_discriminant_analysis import (
-    QuadraticDiscriminantAnalysis,
-)
-from lale.lib.sklearn.quantile_transformer import QuantileTransformer
-from lale.lib.sklearn.random_forest_classifier import RandomForestClassifier
-from lale.lib.sklearn.random_forest_regressor import RandomForestRegressor
-from lale.lib.sklearn.ridge import Ridge
-from lale.lib.sklearn.ridge_classifier import RidgeClassifier
-from lale.lib.sklearn.robust_scaler import RobustScaler
-from lale.lib.sklearn.sgd_classifier import SGDClassifier
-from lale.lib.sklearn.sgd_regressor import SGDRegressor
-from lale.lib.sklearn.simple_imputer import SimpleImputer
-from lale.lib.sklearn.standard_scaler import StandardScaler
-from lale.lib.sklearn.svc import SVC
-from lale.lib.sklearn.svr import SVR
+from typing import TYPE_CHECKING
 
-from .additive_chi2_sampler import AdditiveChi2Sampler
-from .ard_regression import ARDRegression
-from .bayesian_ridge import BayesianRidge
-from .bernoulli_nb import BernoulliNB
-from .bernoulli_rbm import BernoulliRBM
-from .binarizer import Binarizer
-from .birch import Birch
-from .calibrated_classifier_cv import CalibratedClassifierCV
-from .cca import CCA
-from .complement_nb import ComplementNB
-from .dictionary_learning import DictionaryLearning
-from .elastic_net import ElasticNet
-from .elastic_net_cv import ElasticNetCV
-from .factor_analysis import FactorAnalysis
-from .fast_ica import FastICA
-from .gaussian_process_classifier import GaussianProcessClassifier
-from .gaussian_process_regressor import GaussianProcessRegressor
-from .gaussian_random_projection import GaussianRandomProjection
-from .huber_regressor import HuberRegressor
-from .incremental_pca import IncrementalPCA
-from .k_bins_discretizer import KBinsDiscretizer
-from .kernel_pca import KernelPCA
-from .kernel_ridge import KernelRidge
-from .label_binarizer import LabelBinarizer
-from .label_encoder import LabelEncoder
-from .label_propagation import LabelPropagation
-from .label_spreading import LabelSpreading
-from .lars import Lars
-from .lars_cv import LarsCV
-from .lasso import Lasso
-from .lasso_cv import LassoCV
-from .lasso_lars import LassoLars
-from .lasso_lars_cv import LassoLarsCV
-from .lasso_lars_ic import LassoLarsIC
-from .latent_dirichlet_allocation import LatentDirichletAllocation
-from .linear_discriminant_analysis import LinearDiscriminantAnalysis
-from .locally_linear_embedding import LocallyLinearEmbedding
-from .logistic_regression_cv import LogisticRegressionCV
-from .max_abs_scaler import MaxAbsScaler
-from .mini_batch_dictionary_learning import MiniBatchDictionaryLearning
-from .mini_batch_k_means import MiniBatchKMeans
-from .mini_batch_sparse_pca import MiniBatchSparsePCA
-from .mlp_regressor import MLPRegressor
-from .multi_label_binarizer import MultiLabelBinarizer
-from .multi_task_elastic_net import MultiTaskElasticNet
-from .multi_task_elastic_net_cv import MultiTaskElasticNetCV
-from .multi_task_lasso import MultiTaskLasso
-from .multi_task_lasso_cv import MultiTaskLassoCV
-from .nearest_centroid import NearestCentroid
-from .nu_svc import NuSVC
-from .nu_svr import NuSVR
-from .orthogonal_matching_pursuit import OrthogonalMatchingPursuit
-from .orthogonal_matching_pursuit_cv import OrthogonalMatchingPursuitCV
-from .passive_aggressive_regressor import PassiveAggressiveRegressor
-from .perceptron import Perceptron
-from .pls_canonical import PLSCanonical
-from .pls_regression import PLSRegression
-from .plssvd import PLSSVD
-from .power_transformer import PowerTransformer
-from .radius_neighbors_classifier import RadiusNeighborsClassifier
-from .radius_neighbors_regressor import RadiusNeighborsRegressor
-from .random_trees_embedding import RandomTreesEmbedding
-from .ransac_regressor import RANSACRegressor
-from .rbf_sampler import RBFSampler
-from .ridge_classifier_cv import RidgeClassifierCV
-from .ridge_cv import RidgeCV
-from .skewed_chi2_sampler import SkewedChi2Sampler
-from .sparse_pca import SparsePCA
-from .sparse_random_projection import SparseRandomProjection
-from .theil_sen_regressor import TheilSenRegressor
-from .transformed_target_regressor import TransformedTargetRegressor
-from .truncated_svd import TruncatedSVD
+from lale.lib._lazy_imports import attach
+
+if TYPE_CHECKING:
+    from lale.lib.sklearn.ada_boost_classifier import AdaBoostClassifier
+    from lale.lib.sklearn.ada_boost_regressor import AdaBoostRegressor
+    from lale.lib.sklearn.decision_tree_classifier import DecisionTreeClassifier
+    from lale.lib.sklearn.decision_tree_regressor import DecisionTreeRegressor
+    from lale.lib.sklearn.extra_trees_classifier import ExtraTreesClassifier
+    from lale.lib.sklearn.extra_trees_regressor import ExtraTreesRegressor
+    from lale.lib.sklearn.function_transformer import FunctionTransformer
+    from lale.lib.sklearn.gaussian_nb import GaussianNB
+    from lale.lib.sklearn.gradient_boosting_classifier import GradientBoostingClassifier
+    from lale.lib.sklearn.gradient_boosting_regressor import GradientBoostingRegressor
+    from lale.lib.sklearn.isomap import Isomap
+    from lale.lib.sklearn.k_means import KMeans
+    from lale.lib.sklearn.k_neighbors_classifier import KNeighborsClassifier
+    from lale.lib.sklearn.k_neighbors_regressor import KNeighborsRegressor
+    from lale.lib.sklearn.linear_regression import LinearRegression
+    from lale.lib.sklearn.linear_svc import LinearSVC
+    from lale.lib.sklearn.linear_svr import LinearSVR
+    from lale.lib.sklearn.logistic_regression import LogisticRegression
+    from lale.lib.sklearn.min_max_scaler import MinMaxScaler
+    from lale.lib.sklearn.missing_indicator import MissingIndicator
+    from lale.lib.sklearn.mlp_classifier import MLPClassifier
+    from lale.lib.sklearn.multinomial_nb import MultinomialNB
+    from lale.lib.sklearn.nmf import NMF
+    from lale.lib.sklearn.normalizer import Normalizer
+    from lale.lib.sklearn.nystroem import Nystroem
+    from lale.lib.sklearn.one_hot_encoder import OneHotEncoder
+    from lale.lib.sklearn.ordinal_encoder import OrdinalEncoder
+    from lale.lib.sklearn.passive_aggressive_classifier import (
+        PassiveAggressiveClassifier,
+    )
+    from lale.lib.sklearn.pca import PCA
+    from lale.lib.sklearn.polynomial_features import PolynomialFeatures
+    from lale.lib.sklearn.quadratic_discriminant_analysis import (
+        QuadraticDiscriminantAnalysis,
+    )
+    from lale.lib.sklearn.quantile_transformer import QuantileTransformer
+    from lale.lib.sklearn.random_forest_classifier import RandomForestClassifier
+    from lale.lib.sklearn.random_forest_regressor import RandomForestRegressor
+    from lale.lib.sklearn.ridge import Ridge
+    from lale.lib.sklearn.ridge_classifier import RidgeClassifier
+    from lale.lib.sklearn.robust_scaler import RobustScaler
+    from lale.lib.sklearn.sgd_classifier import SGDClassifier
+    from lale.lib.sklearn.sgd_regressor import SGDRegressor
+    from lale.lib.sklearn.simple_imputer import SimpleImputer
+    from lale.lib.sklearn.standard_scaler import StandardScaler
+    from lale.lib.sklearn.svc import SVC
+    from lale.lib.sklearn.svr import SVR
+
+    from .additive_chi2_sampler import AdditiveChi2Sampler
+    from .ard_regression import ARDRegression
+    from .bayesian_ridge import BayesianRidge
+    from .bernoulli_nb import BernoulliNB
+    from .bernoulli_rbm import BernoulliRBM
+    from .binarizer import Binarizer
+    from .birch import Birch
+    from .calibrated_classifier_cv import CalibratedClassifierCV
+    from .cca import CCA
+    from .complement_nb import ComplementNB
+    from .dictionary_learning import DictionaryLearning
+    from .elastic_net import ElasticNet
+    from .elastic_net_cv import ElasticNetCV
+    from .factor_analysis import FactorAnalysis
+    from .fast_ica import FastICA
+    from .gaussian_process_classifier import GaussianProcessClassifier
+    from .gaussian_process_regressor import GaussianProcessRegressor
+    from .gaussian_random_projection import GaussianRandomProjection
+    from .huber_regressor import HuberRegressor
+    from .incremental_pca import IncrementalPCA
+    from .k_bins_discretizer import KBinsDiscretizer
+    from .kernel_pca import KernelPCA
+    from .kernel_ridge import KernelRidge
+    from .label_binarizer import LabelBinarizer
+    from .label_encoder import LabelEncoder
+    from .label_propagation import LabelPropagation
+    from .label_spreading import LabelSpreading
+    from .lars import Lars
+    from .lars_cv import LarsCV
+    from .lasso import Lasso
+    from .lasso_cv import LassoCV
+    from .lasso_lars import LassoLars
+    from .lasso_lars_cv import LassoLarsCV
+    from .lasso_lars_ic import LassoLarsIC
+    from .latent_dirichlet_allocation import LatentDirichletAllocation
+    from .linear_discriminant_analysis import LinearDiscriminantAnalysis
+    from .locally_linear_embedding import LocallyLinearEmbedding
+    from .logistic_regression_cv import LogisticRegressionCV
+    from .max_abs_scaler import MaxAbsScaler
+    from .mini_batch_dictionary_learning import MiniBatchDictionaryLearning
+    from .mini_batch_k_means import MiniBatchKMeans
+    from .mini_batch_sparse_pca import MiniBatchSparsePCA
+    from .mlp_regressor import MLPRegressor
+    from .multi_label_binarizer import MultiLabelBinarizer
+    from .multi_task_elastic_net import MultiTaskElasticNet
+    from .multi_task_elastic_net_cv import MultiTaskElasticNetCV
+    from .multi_task_lasso import MultiTaskLasso
+    from .multi_task_lasso_cv import MultiTaskLassoCV
+    from .nearest_centroid import NearestCentroid
+    from .nu_svc import NuSVC
+    from .nu_svr import NuSVR
+    from .orthogonal_matching_pursuit import OrthogonalMatchingPursuit
+    from .orthogonal_matching_pursuit_cv import OrthogonalMatchingPursuitCV
+    from .passive_aggressive_regressor import PassiveAggressiveRegressor
+    from .perceptron import Perceptron
+    from .pls_canonical import PLSCanonical
+    from .pls_regression import PLSRegression
+    from .plssvd import PLSSVD
+    from .power_transformer import PowerTransformer
+    from .radius_neighbors_classifier import RadiusNeighborsClassifier
+    from .radius_neighbors_regressor import RadiusNeighborsRegressor
+    from .random_trees_embedding import RandomTreesEmbedding
+    from .ransac_regressor import RANSACRegressor
+    from .rbf_sampler import RBFSampler
+    from .ridge_classifier_cv import RidgeClassifierCV
+    from .ridge_cv import RidgeCV
+    from .skewed_chi2_sampler import SkewedChi2Sampler
+    from .sparse_pca import SparsePCA
+    from .sparse_random_projection import SparseRandomProjection
+    from .theil_sen_regressor import TheilSenRegressor
+    from .transformed_target_regressor import TransformedTargetRegressor
+    from .truncated_svd import TruncatedSVD
+
+# the exports listed above, by the module that defines them
+_lazy_exports = {
+    "AdaBoostClassifier": "lale.lib.sklearn.ada_boost_classifier",
+    "AdaBoostRegressor": "lale.lib.sklearn.ada_boost_regressor",
+    "DecisionTreeClassifier": "lale.lib.sklearn.decision_tree_classifier",
+    "DecisionTreeRegressor": "lale.lib.sklearn.decision_tree_regressor",
+    "ExtraTreesClassifier": "lale.lib.sklearn.extra_trees_classifier",
+    "ExtraTreesRegressor": "lale.lib.sklearn.extra_trees_regressor",
+    "FunctionTransformer": "lale.lib.sklearn.function_transformer",
+    "GaussianNB": "lale.lib.sklearn.gaussian_nb",
+    "GradientBoostingClassifier": "lale.lib.sklearn.gradient_boosting_classifier",
+    "GradientBoostingRegressor": "lale.lib.sklearn.gradient_boosting_regressor",
+    "Isomap": "lale.lib.sklearn.isomap",
+    "KMeans": "lale.lib.sklearn.k_means",
+    "KNeighborsClassifier": "lale.lib.sklearn.k_neighbors_classifier",
+    "KNeighborsRegressor": "lale.lib.sklearn.k_neighbors_regressor",
+    "LinearRegression": "lale.lib.sklearn.linear_regression",
+    "LinearSVC": "lale.lib.sklearn.linear_svc",
+    "LinearSVR": "lale.lib.sklearn.linear_svr",
+    "LogisticRegression": "lale.lib.sklearn.logistic_regression",
+    "MinMaxScaler": "lale.lib.sklearn.min_max_scaler",
+    "MissingIndicator": "lale.lib.sklearn.missing_indicator",
+    "MLPClassifier": "lale.lib.sklearn.mlp_classifier",
+    "MultinomialNB": "lale.lib.sklearn.multinomial_nb",
+    "NMF": "lale.lib.sklearn.nmf",
+    "Normalizer": "lale.lib.sklearn.normalizer",
+    "Nystroem": "lale.lib.sklearn.nystroem",
+    "OneHotEncoder": "lale.lib.sklearn.one_hot_encoder",
+    "OrdinalEncoder": "lale.lib.sklearn.ordinal_encoder",
+    "PassiveAggressiveClassifier": "lale.lib.sklearn.passive_aggressive_classifier",
+    "PCA": "lale.lib.sklearn.pca",
+    "PolynomialFeatures": "lale.lib.sklearn.polynomial_features",
+    "QuadraticDiscriminantAnalysis": "lale.lib.sklearn.quadratic_discriminant_analysis",
+    "QuantileTransformer": "lale.lib.sklearn.quantile_transformer",
+    "RandomForestClassifier": "lale.lib.sklearn.random_forest_classifier",
+    "RandomForestRegressor": "lale.lib.sklearn.random_forest_regressor",
+    "Ridge": "lale.lib.sklearn.ridge",
+    "RidgeClassifier": "lale.lib.sklearn.ridge_classifier",
+    "RobustScaler": "lale.lib.sklearn.robust_scaler",
+    "SGDClassifier": "lale.lib.sklearn.sgd_classifier",
+    "SGDRegressor": "lale.lib.sklearn.sgd_regressor",
+    "SimpleImputer": "lale.lib.sklearn.simple_imputer",
+    "StandardScaler": "lale.lib.sklearn.standard_scaler",
+    "SVC": "lale.lib.sklearn.svc",
+    "SVR": "lale.lib.sklearn.svr",
+    "AdditiveChi2Sampler": ".additive_chi2_sampler",
+    "ARDRegression": ".ard_regression",
+    "BayesianRidge": ".bayesian_ridge",
+    "BernoulliNB": ".bernoulli_nb",
+    "BernoulliRBM": ".bernoulli_rbm",
+    "Binarizer": ".binarizer",
+    "Birch": ".birch",
+    "CalibratedClassifierCV": ".calibrated_classifier_cv",
+    "CCA": ".cca",
+    "ComplementNB": ".complement_nb",
+    "DictionaryLearning": ".dictionary_learning",
+    "ElasticNet": ".elastic_net",
+    "ElasticNetCV": ".elastic_net_cv",
+    "FactorAnalysis": ".factor_analysis",
+    "FastICA": ".fast_ica",
+    "GaussianProcessClassifier": ".gaussian_process_classifier",
+    "GaussianProcessRegressor": ".gaussian_process_regressor",
+    "GaussianRandomProjection": ".gaussian_random_projection",
+    "HuberRegressor": ".huber_regressor",
+    "IncrementalPCA": ".incremental_pca",
+    "KBinsDiscretizer": ".k_bins_discretizer",
+    "KernelPCA": ".kernel_pca",
+    "KernelRidge": ".kernel_ridge",
+    "LabelBinarizer": ".label_binarizer",
+    "LabelEncoder": ".label_encoder",
+    "LabelPropagation": ".label_propagation",
+    "LabelSpreading": ".label_spreading",
+    "Lars": ".lars",
+    "LarsCV": ".lars_cv",
+    "Lasso": ".lasso",
+    "LassoCV": ".lasso_cv",
+    "LassoLars": ".lasso_lars",
+    "LassoLarsCV": ".lasso_lars_cv",
+    "LassoLarsIC": ".lasso_lars_ic",
+    "LatentDirichletAllocation": ".latent_dirichlet_allocation",
+    "LinearDiscriminantAnalysis": ".linear_discriminant_analysis",
+    "LocallyLinearEmbedding": ".locally_linear_embedding",
+    "LogisticRegressionCV": ".logistic_regression_cv",
+    "MaxAbsScaler": ".max_abs_scaler",
+    "MiniBatchDictionaryLearning": ".mini_batch_dictionary_learning",
+    "MiniBatchKMeans": ".mini_batch_k_means",
+    "MiniBatchSparsePCA": ".mini_batch_sparse_pca",
+    "MLPRegressor": ".mlp_regressor",
+    "MultiLabelBinarizer": ".multi_label_binarizer",
+    "MultiTaskElasticNet": ".multi_task_elastic_net",
+    "MultiTaskElasticNetCV": ".multi_task_elastic_net_cv",
+    "MultiTaskLasso": ".multi_task_lasso",
+    "MultiTaskLassoCV": ".multi_task_lasso_cv",
+    "NearestCentroid": ".nearest_centroid",
+    "NuSVC": ".nu_svc",
+    "NuSVR": ".nu_svr",
+    "OrthogonalMatchingPursuit": ".orthogonal_matching_pursuit",
+    "OrthogonalMatchingPursuitCV": ".orthogonal_matching_pursuit_cv",
+    "PassiveAggressiveRegressor": ".passive_aggressive_regressor",
+    "Perceptron": ".perceptron",
+    "PLSCanonical": ".pls_canonical",
+    "PLSRegression": ".pls_regression",
+    "PLSSVD": ".plssvd",
+    "PowerTransformer": ".power_transformer",
+    "RadiusNeighborsClassifier": ".radius_neighbors_classifier",
+    "RadiusNeighborsRegressor": ".radius_neighbors_regressor",
+    "RandomTreesEmbedding": ".random_trees_embedding",
+    "RANSACRegressor": ".ransac_regressor",
+    "RBFSampler": ".rbf_sampler",
+    "RidgeClassifierCV": ".ridge_classifier_cv",
+    "RidgeCV": ".ridge_cv",
+    "SkewedChi2Sampler": ".skewed_chi2_sampler",
+    "SparsePCA": ".sparse_pca",
+    "SparseRandomProjection": ".sparse_random_projection",
+    "TheilSenRegressor": ".theil_sen_regressor",
+    "TransformedTargetRegressor": ".transformed_target_regressor",
+    "TruncatedSVD": ".truncated_svd",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _lazy_exports)
@@ -51,30 +51,54 @@ Operators:
 
 """
 
+from typing import TYPE_CHECKING
+
+from lale.lib._lazy_imports import attach
+
 # Note: all imports should be done as
 # from .xxx import XXX as XXX
 # this ensures that pyright considers them to be publicly available
 # and not private imports (this affects lale users that use pyright)
+if TYPE_CHECKING:
+    from .adasyn import ADASYN as ADASYN
+    from .all_knn import AllKNN as AllKNN
+    from .borderline_smote import BorderlineSMOTE as BorderlineSMOTE
+    from .condensed_nearest_neighbour import (
+        CondensedNearestNeighbour as CondensedNearestNeighbour,
+    )
+    from .edited_nearest_neighbours import (
+        EditedNearestNeighbours as EditedNearestNeighbours,
+    )
+    from .instance_hardness_threshold import (
+        InstanceHardnessThreshold as InstanceHardnessThreshold,
+    )
+    from .random_over_sampler import RandomOverSampler as RandomOverSampler
+    from .random_under_sampler import RandomUnderSampler as RandomUnderSampler
+    from .repeated_edited_nearest_neighbours import (
+        RepeatedEditedNearestNeighbours as RepeatedEditedNearestNeighbours,
+    )
+    from .smote import SMOTE as SMOTE
+    from .smoteenn import SMOTEENN as SMOTEENN
+    from .smoten import SMOTEN as SMOTEN
+    from .smotenc import SMOTENC as SMOTENC
+    from .svm_smote import SVMSMOTE as SVMSMOTE
+
+# the exports listed above, by the module that defines them
+_lazy_exports = {
+    "ADASYN": ".adasyn",
+    "AllKNN": ".all_knn",
+    "BorderlineSMOTE": ".borderline_smote",
+    "CondensedNearestNeighbour": ".condensed_nearest_neighbour",
+    "EditedNearestNeighbours": ".edited_nearest_neighbours",
+    "InstanceHardnessThreshold": ".instance_hardness_threshold",
+    "RandomOverSampler": ".random_over_sampler",
+    "RandomUnderSampler": ".random_under_sampler",
+    "RepeatedEditedNearestNeighbours": ".repeated_edited_nearest_neighbours",
+    "SMOTE": ".smote",
+    "SMOTEENN": ".smoteenn",
+    "SMOTEN": ".smoten",
+    "SMOTENC": ".smotenc",
+    "SVMSMOTE": ".svm_smote",
+}
 
-from .adasyn import ADASYN as ADASYN
-from .all_knn import AllKNN as AllKNN
-from .borderline_smote import BorderlineSMOTE as BorderlineSMOTE
-from .condensed_nearest_neighbour import (
-    CondensedNearestNeighbour as CondensedNearestNeighbour,
-)
-from .edited_nearest_neighbours import (
-    EditedNearestNeighbours as EditedNearestNeighbours,
-)
-from .instance_hardness_threshold import (
-    InstanceHardnessThreshold as InstanceHardnessThreshold,
-)
-from .random_over_sampler import RandomOverSampler as RandomOverSampler
-from .random_under_sampler import RandomUnderSampler as RandomUnderSampler
-from .repeated_edited_nearest_neighbours import (
-    RepeatedEditedNearestNeighbours as RepeatedEditedNearestNeighbours,
-)
-from .smote import SMOTE as SMOTE
-from .smoteenn import SMOTEENN as SMOTEENN
-from .smoten import SMOTEN as SMOTEN
-from .smotenc import SMOTENC as SMOTENC
-from .svm_smote import SVMSMOTE as SVMSMOTE
+__getattr__, __dir__, __all__ = attach(__name__, _lazy_exports)
@@ -95,44 +95,84 @@ Functions:
 .. _`spark_explainer`: lale.lib.rasl.spark_explainer.html
 """
 
+from typing import TYPE_CHECKING
+
+from lale.lib._lazy_imports import attach
+
 # Note: all imports should be done as
 # from .xxx import XXX as XXX
 # this ensures that pyright considers them to be publicly available
 # and not private imports (this affects lale users that use pyright)
-
-from lale.lib.rasl import Aggregate as Aggregate
-from lale.lib.rasl import Alias as Alias
-from lale.lib.rasl import Batching as Batching
-from lale.lib.rasl import ConcatFeatures as ConcatFeatures
-from lale.lib.rasl import Filter as Filter
-from lale.lib.rasl import GroupBy as GroupBy
-from lale.lib.rasl import Join as Join
-from lale.lib.rasl import Map as Map
-from lale.lib.rasl import OrderBy as OrderBy
-from lale.lib.rasl import Project as Project
-from lale.lib.rasl import Relational as Relational
-from lale.lib.rasl import Scan as Scan
-from lale.lib.rasl import SplitXy as SplitXy
-from lale.lib.rasl import categorical as categorical
-from lale.lib.rasl import date_time as date_time
-from lale.lib.rasl import spark_explainer as spark_explainer
-
-# estimators
-from .auto_pipeline import AutoPipeline as AutoPipeline
-
-# estimators and transformers
-from .both import Both as Both
-
-# functions
-from .grid_search_cv import GridSearchCV as GridSearchCV
-from .halving_grid_search_cv import HalvingGridSearchCV as HalvingGridSearchCV
-from .hyperopt import Hyperopt as Hyperopt
-from .identity_wrapper import IdentityWrapper as IdentityWrapper
-from .no_op import NoOp as NoOp
-from .observing import Observing as Observing
-from .optimize_last import OptimizeLast as OptimizeLast
-from .optimize_suffix import OptimizeSuffix as OptimizeSuffix
-from .sample_based_voting import SampleBasedVoting as SampleBasedVoting
-from .smac import SMAC as SMAC
-from .tee import Tee as Tee
-from .topk_voting_classifier import TopKVotingClassifier as TopKVotingClassifier
+if TYPE_CHECKING:
+    from lale.lib.rasl import Aggregate as Aggregate
+    from lale.lib.rasl import Alias as Alias
+    from lale.lib.rasl import Batching as Batching
+    from lale.lib.rasl import ConcatFeatures as ConcatFeatures
+    from lale.lib.rasl import Filter as Filter
+    from lale.lib.rasl import GroupBy as GroupBy
+    from lale.lib.rasl import Join as Join
+    from lale.lib.rasl import Map as Map
+    from lale.lib.rasl import OrderBy as OrderBy
+    from lale.lib.rasl import Project as Project
+    from lale.lib.rasl import Relational as Relational
+    from lale.lib.rasl import Scan as Scan
+    from lale.lib.rasl import SplitXy as SplitXy
+    from lale.lib.rasl import categorical as categorical
+    from lale.lib.rasl import date_time as date_time
+    from lale.lib.rasl import spark_explainer as spark_explainer
+
+    # estimators
+    from .auto_pipeline import AutoPipeline as AutoPipeline
+
+    # estimators and transformers
+    from .both import Both as Both
+
+    # functions
+    from .grid_search_cv import GridSearchCV as GridSearchCV
+    from .halving_grid_search_cv import HalvingGridSearchCV as HalvingGridSearchCV
+    from .hyperopt import Hyperopt as Hyperopt
+    from .identity_wrapper import IdentityWrapper as IdentityWrapper
+    from .no_op import NoOp as NoOp
+    from .observing import Observing as Observing
+    from .optimize_last import OptimizeLast as OptimizeLast
+    from .optimize_suffix import OptimizeSuffix as OptimizeSuffix
+    from .sample_based_voting import SampleBasedVoting as SampleBasedVoting
+    from .smac import SMAC as SMAC
+    from .tee import Tee as Tee
+    from .topk_voting_classifier import TopKVotingClassifier as TopKVotingClassifier
+
+# the exports listed above, by the module that defines them
+_lazy_exports = {
+    "Aggregate": "lale.lib.rasl",
+    "Alias": "lale.lib.rasl",
+    "Batching": "lale.lib.rasl",
+    "ConcatFeatures": "lale.lib.rasl",
+    "Filter": "lale.lib.rasl",
+    "GroupBy": "lale.lib.rasl",
+    "Join": "lale.lib.rasl",
+    "Map": "lale.lib.rasl",
+    "OrderBy": "lale.lib.rasl",
+    "Project": "lale.lib.rasl",
+    "Relational": "lale.lib.rasl",
+    "Scan": "lale.lib.rasl",
+    "SplitXy": "lale.lib.rasl",
+    "categorical": "lale.lib.rasl",
+    "date_time": "lale.lib.rasl",
+    "spark_explainer": "lale.lib.rasl",
+    "AutoPipeline": ".auto_pipeline",
+    "Both": ".both",
+    "GridSearchCV": ".grid_search_cv",
+    "HalvingGridSearchCV": ".halving_grid_search_cv",
+    "Hyperopt": ".hyperopt",
+    "IdentityWrapper": ".identity_wrapper",
+    "NoOp": ".no_op",
+    "Observing": ".observing",
+    "OptimizeLast": ".optimize_last",
+    "OptimizeSuffix": ".optimize_suffix",
+    "SampleBasedVoting": ".sample_based_voting",
+    "SMAC": ".smac",
+    "Tee": ".tee",
+    "TopKVotingClassifier": ".topk_voting_classifier",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _lazy_exports)
@@ -30,6 +30,7 @@ from lale.lib._common_schemas import (
     schema_max_opt_time,
     schema_scoring_single,
 )
+from lale.pruners import AllTrialsPruned, TrialPruned
 
 with warnings.catch_warnings():
     warnings.filterwarnings("ignore", category=FutureWarning)
@@ -116,6 +117,7 @@ class _AutoPipelineImpl:
         max_opt_time=600.0,
         max_eval_time=120.0,
         cv=5,
+        pruner=None,
     ):
         self.prediction_type = prediction_type
         self.max_opt_time = max_opt_time
@@ -129,6 +131,7 @@ class _AutoPipelineImpl:
         self.best_score = best_score
         self._summary = None
         self.cv = cv
+        self.pruner = pruner
 
     def _try_and_add(self, name, trainable, X, y):
         assert name not in self._pipelines
@@ -140,16 +143,23 @@ class _AutoPipelineImpl:
             cv = sklearn.model_selection.check_cv(
                 cv=self.cv, classifier=(self.prediction_type != "regression")
             )
-            (
-                cv_score,
-                logloss,
-                execution_time,
-            ) = lale.helpers.cross_val_score_track_trials(
-                trainable, X, y, self.scoring, cv
-            )
+            try:
+                (
+                    cv_score,
+                    logloss,
+                    execution_time,
+                ) = lale.helpers.cross_val_score_track_trials(
+                    trainable, X, y, self.scoring, cv, pruner=self.pruner
+                )
+                status = hyperopt.STATUS_OK
+            except TrialPruned as e:
+                cv_score, logloss, execution_time = e.score, e.log_loss, e.time
+                status = "pruned"
         loss = self.best_score - cv_score
-        if self._name_of_best is None or (
-            self._summary is None or loss < self._summary.at[self._name_of_best, "loss"]
+        if status == hyperopt.STATUS_OK and (
+            self._name_of_best is None
+            or self._summary is None
+            or loss < self._summary.at[self._name_of_best, "loss"]
         ):
             self._name_of_best = name
         record = {
@@ -157,7 +167,7 @@ class _AutoPipelineImpl:
             "loss": loss,
             "time": execution_time,
             "log_loss": logloss,
-            "status": hyperopt.STATUS_OK,
+            "status": status,
         }
         singleton_summary = pd.DataFrame.from_records([record], index="name")
         if self._summary is None:
@@ -239,8 +249,15 @@ class _AutoPipelineImpl:
             verbose=self.verbose,
             show_progressbar=False,
             cv=self.cv,
+            pruner=self.pruner,
         )
-        trained = trainable.fit(X, y)
+        try:
+            trained = trainable.fit(X, y)
+        except AllTrialsPruned as e:
+            # the pruner, which saw the candidates above, pruned every trial
+            if e.summary is not None:
+                self._summary = pd.concat([self._summary, e.summary])
+            return
         # The static types are not currently smart enough to verify
         # that the conditionally defined summary method is actually present
         # But it must be, since the hyperopt impl type provides it
@@ -250,7 +267,8 @@ class _AutoPipelineImpl:
         best_trial = trained._impl._trials.best_trial
         if "loss" in best_trial["result"]:
             if (
-                self._summary is None
+                self._name_of_best is None
+                or self._summary is None
                 or best_trial["result"]["loss"]
                 < self._summary.at[self._name_of_best, "loss"]
             ):
@@ -273,6 +291,11 @@ class _AutoPipelineImpl:
         self._fit_gbt_num(X, y)
         self._fit_gbt_all(X, y)
         self._fit_hyperopt(X, y)
+        if self._name_of_best is None:
+            raise AllTrialsPruned(
+                "AutoPipeline found no pipeline, all of the trials were pruned or timed out.",
+                self._summary,
+            )
         return self
 
     def predict(self, X, **predict_params):
@@ -363,6 +386,18 @@ This is also logged using logger.warning in Hyperopt.""",
                     "default": 120.0,
                 },
                 "cv": schema_cv,
+                "pruner": {
+                    "description": """Pruner that stops unpromising trials between cross-validation folds.
+
+Pruned trials have the status "pruned" in summary() and are not chosen
+as the best pipeline. If no trial finishes, fit raises
+lale.pruners.AllTrialsPruned.""",
+                    "anyOf": [
+                        {"description": "lale.pruners.Pruner"},
+                        {"description": "Finish all folds.", "enum": [None]},
+                    ],
+                    "default": None,
+                },
             },
         }
     ]
@@ -12,19 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Any, Dict, Optional
+import contextlib
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import sklearn.base
+import sklearn.model_selection
 
 import lale.docstrings
 import lale.helpers
 import lale.lib.sklearn
 import lale.operators
 import lale.search.lale_grid_search_cv
+import lale.settings
 import lale.sklearn_compat
 from lale.lib._common_schemas import (
     schema_cv,
     schema_estimator,
     schema_max_opt_time,
     schema_scoring_single,
+    schema_trial_cache,
+)
+from lale.trial_cache import (
+    TrialCache,
+    TrialResult,
+    get_trial_cache,
+    trial_evaluation,
+    trial_key,
 )
 
 from .observing import Observing
@@ -38,6 +52,74 @@ except ImportError:
     pass
 
 
+class _CachedGridSearch:
+    """Candidates of a grid, of which only the first one of each distinct
+    pipeline is evaluated, and only if it is not in the trial cache.
+
+    The keys of all candidates are computed up front, at a few
+    milliseconds each, even if the cache is empty, since grids often
+    instantiate the same pipeline several times, for instance when a
+    value equals the default."""
+
+    def __init__(
+        self,
+        observed_op,
+        hp_grid,
+        trial_cache: TrialCache,
+        evaluation: Optional[Dict[str, Any]],
+    ):
+        self._trial_cache = trial_cache
+        self._candidates = list(sklearn.model_selection.ParameterGrid(hp_grid))
+        self._keys: List[Optional[str]] = []
+        self._scores: Dict[int, float] = {}  # candidate index -> score
+        self._to_evaluate: List[int] = []
+        seen = set()
+        for i, params in enumerate(self._candidates):
+            key = None
+            if evaluation is not None:
+                trainable = observed_op.with_params(**params).hyperparams()["op"]
+                key = trial_key(trainable, evaluation)
+            self._keys.append(key)
+            if key is None:
+                self._to_evaluate.append(i)
+            elif key not in seen:
+                seen.add(key)
+                cached = trial_cache.get(key)
+                if cached is None:
+                    self._to_evaluate.append(i)
+                else:
+                    self._scores[i] = cached.score
+
+    @property
+    def param_grid(self) -> List[Dict[str, List[Any]]]:
+        """Grid of the candidates to evaluate, in order."""
+        return [
+            {k: [v] for k, v in self._candidates[i].items()} for i in self._to_evaluate
+        ]
+
+    def best_params(self, cv_results) -> Dict[str, Any]:
+        """Record the results of the evaluated candidates, if any, and
+        return the best candidate, the first one in case of ties."""
+        if cv_results is not None:
+            for j, i in enumerate(self._to_evaluate):
+                score = cv_results["mean_test_score"][j]
+                if np.isnan(score):
+                    continue
+                self._scores[i] = float(score)
+                key = self._keys[i]
+                if key is not None:
+                    time = (
+                        cv_results["mean_fit_time"][j]
+                        + cv_results["mean_score_time"][j]
+                    )
+                    result = TrialResult(float(score), float("nan"), float(time))
+                    self._trial_cache.put(key, result)
+        if not self._scores:
+            raise ValueError("None of the candidates of the grid could be evaluated.")
+        best = max(sorted(self._scores), key=self._scores.__getitem__)
+        return self._candidates[best]
+
+
 class _GridSearchCVImpl:
     _best_estimator: Optional[lale.operators.TrainedOperator] = None
 
@@ -55,6 +137,7 @@ class _GridSearchCVImpl:
         pgo=None,
         observer=None,
         max_opt_time=None,
+        trial_cache=None,
     ):
         if observer is not None and isinstance(observer, type):
             # if we are given a class name, instantiate it
@@ -81,6 +164,7 @@ class _GridSearchCVImpl:
             "hp_grid": param_grid,
             "observer": observer,
             "max_opt_time": max_opt_time,
+            "trial_cache": trial_cache,
         }
 
     def fit(self, X, y, **fit_params):
@@ -101,6 +185,11 @@ class _GridSearchCVImpl:
         observed_op = Observing(op=op, observer=obs)
 
         hp_grid = self._hyperparams["hp_grid"]
+        # grids compiled from the schemas hold valid hyperparameters by construction
+        if hp_grid is None:
+            trust = lale.settings.trusted_hyperparams
+        else:
+            trust = contextlib.nullcontext
         data_schema = {}
         try:
             data_schema = lale.helpers.fold_schema(
@@ -143,33 +232,61 @@ class _GridSearchCVImpl:
                     pgo=self._hyperparams["pgo"],
                 )
             try:
-                self.grid = lale.search.lale_grid_search_cv.get_lale_gridsearchcv_op(
-                    observed_op,
-                    hp_grid,
-                    cv=self._hyperparams["cv"],
-                    verbose=self._hyperparams["verbose"],
-                    scoring=self._hyperparams["scoring"],
-                    n_jobs=self._hyperparams["n_jobs"],
-                )
-                if self._hyperparams["max_opt_time"] is not None:
-                    if func_timeout_installed:
-                        try:
-                            func_timeout(
-                                self._hyperparams["max_opt_time"], self.grid.fit, (X, y)
+                cv = self._hyperparams["cv"]
+                trial_cache = get_trial_cache(self._hyperparams["trial_cache"])
+                search = None
+                if trial_cache is not None:
+                    # the splitter that sklearn would use
+                    cv = sklearn.model_selection.check_cv(
+                        cv, y, classifier=sklearn.base.is_classifier(observed_op)
+                    )
+                    evaluation = trial_evaluation(
+                        X, y, cv, self._hyperparams["scoring"], fit_params=fit_params
+                    )
+                    with trust():
+                        search = _CachedGridSearch(
+                            observed_op, hp_grid, trial_cache, evaluation
+                        )
+                    hp_grid = search.param_grid
+                self.grid = None
+                if hp_grid:
+                    self.grid = (
+                        lale.search.lale_grid_search_cv.get_lale_gridsearchcv_op(
+                            observed_op,
+                            hp_grid,
+                            cv=cv,
+                            verbose=self._hyperparams["verbose"],
+                            scoring=self._hyperparams["scoring"],
+                            n_jobs=self._hyperparams["n_jobs"],
+                            refit=search is None,
+                        )
+                    )
+                    if self._hyperparams["max_opt_time"] is not None:
+                        if func_timeout_installed:
+                            try:
+                                func_timeout(
+                                    self._hyperparams["max_opt_time"],
+                                    self.grid.fit,
+                                    (X, y),
+                                )
+                            except FunctionTimedOut as exc:
+                                raise BaseException(  # pylint:disable=broad-exception-raised
+                                    "GridSearchCV timed out."
+                                ) from exc
+                        else:
+                            raise ValueError(
+                                f"""max_opt_time is set to {self._hyperparams["max_opt_time"]} but the Python package
+                                required for timeouts is not installed. Please install `func_timeout` using `pip install func_timeout`
+                                or set max_opt_time to None."""
                             )
-                        except FunctionTimedOut as exc:
-                            raise BaseException(  # pylint:disable=broad-exception-raised
-                                "GridSearchCV timed out."
-                            ) from exc
                     else:
-                        raise ValueError(
-                            f"""max_opt_time is set to {self._hyperparams["max_opt_time"]} but the Python package
-                            required for timeouts is not installed. Please install `func_timeout` using `pip install func_timeout`
-                            or set max_opt_time to None."""
-                        )
+                        with trust():
+                            self.grid.fit(X, y, **fit_params)
+                if search is None:
+                    be = self.grid.best_estimator_
                 else:
-                    self.grid.fit(X, y, **fit_params)
-                be = self.grid.best_estimator_
+                    cv_results = None if self.grid is None else self.grid.cv_results_
+                    be = observed_op.with_params(**search.best_params(cv_results))
             except BaseException as e:
                 if obs is not None:
                     assert isinstance(obs, Observing)  # type: ignore
@@ -303,6 +420,7 @@ _hyperparams_schema = {
                     "description": "a class or object with callbacks for observing the state of the optimization",
                 },
                 "max_opt_time": schema_max_opt_time,
+                "trial_cache": schema_trial_cache,
             },
         }
     ]
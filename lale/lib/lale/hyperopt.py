@@ -12,14 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import copy
+import itertools
 import logging
 import multiprocessing
+import multiprocessing.connection
 import sys
 import time
 import traceback
 import warnings
-from typing import Any, Dict, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Set, Tuple, Union
 
 import hyperopt
 import numpy as np
@@ -35,6 +39,8 @@ import lale.pretty_print
 from lale.helpers import (
     create_instance_from_hyperopt_search_space,
     cross_val_score_track_trials,
+    effective_n_jobs,
+    split_with_schemas,
 )
 from lale.lib._common_schemas import (
     schema_best_score_single,
@@ -42,10 +48,14 @@ from lale.lib._common_schemas import (
     schema_estimator,
     schema_max_opt_time,
     schema_scoring_single,
+    schema_trial_cache,
 )
 from lale.lib.sklearn import LogisticRegression
+from lale.pruners import AllTrialsPruned, Pruner, TrialPruned
 from lale.search.op2hp import hyperopt_search_space
 from lale.search.PGO import PGO
+from lale.shared_data import SharedData, SharedDataHandle
+from lale.trial_cache import TrialResult, get_trial_cache, trial_evaluation, trial_key
 
 SEED = 42
 logger = logging.getLogger(__name__)
@@ -70,6 +80,12 @@ class _HyperoptImpl:
         max_opt_time=None,
         max_eval_time=None,
         pgo: Optional[PGO] = None,
+        n_jobs=None,
+        resource=None,
+        factor=3,
+        min_resources=None,
+        pruner: Optional[Pruner] = None,
+        trial_cache=None,
     ):
         self.max_evals = max_evals
         if estimator is None:
@@ -96,6 +112,15 @@ class _HyperoptImpl:
         self.max_opt_time = max_opt_time
         self.max_eval_time = max_eval_time
         self.pgo = pgo
+        self.n_jobs = n_jobs
+        self.resource = resource
+        self.factor = factor
+        self.min_resources = min_resources
+        self._halving: Optional[_SuccessiveHalving] = None
+        self.pruner = pruner
+        self.trial_cache = trial_cache
+        self._trial_cache = None
+        self._trial_evaluation: Optional[Dict[str, Any]] = None
         self.show_progressbar = show_progressbar
         if args_to_scorer is not None:
             self.args_to_scorer = args_to_scorer
@@ -115,6 +140,15 @@ class _HyperoptImpl:
             if not self.verbose:
                 print("Run with verbose=True to see per-trial exceptions.")
 
+    def _raise_none_succeeded(self, trials, exc):
+        results = [r for r in trials.results if r]
+        if results and all(r.get("pruned", False) for r in results):
+            raise AllTrialsPruned(
+                "Error from hyperopt, none of the trials succeeded, all of them were pruned.",
+                _summarize_trials(trials),
+            ) from exc
+        raise ValueError("Error from hyperopt, none of the trials succeeded.") from exc
+
     def fit(self, X_train, y_train, X_valid=None, y_valid=None, **fit_params):
         opt_start_time = time.time()
         is_clf = self.estimator.is_classifier()
@@ -124,8 +158,44 @@ class _HyperoptImpl:
             ), "cv should be None when using X_valid to pass validation dataset."
         else:
             self.cv = check_cv(self.cv, y=y_train, classifier=is_clf)
+        if self.resource is None:
+            self._halving = None
+        else:
+            if self.pruner is not None:
+                raise ValueError(
+                    "Early stopping with a resource and with a pruner cannot be combined."
+                )
+            if self.resource == "n_folds" and self.cv is None:
+                raise ValueError(
+                    "resource='n_folds' requires cross validation, so X_valid cannot be passed."
+                )
+            self._halving = _SuccessiveHalving(
+                self.resource,
+                self.factor,
+                self.min_resources,
+                None if self.cv is None else self.cv.get_n_splits(X_train, y_train),
+            )
+        self._trial_cache = get_trial_cache(self.trial_cache)
+        if self._trial_cache is not None:
+            self._trial_evaluation = trial_evaluation(
+                X_train,
+                y_train,
+                self.cv,
+                self.scoring,
+                self.args_to_scorer,
+                X_valid,
+                y_valid,
+                fit_params,
+            )
+        X_schema, y_schema = X_train, y_train
+        if self._halving is not None and self._halving.resource == "n_samples":
+            # the first rung trains on the smallest subsample, so the
+            # data constraints of the search space must hold for it
+            _, X_schema, y_schema = self._halving.fidelity(
+                0, self.estimator, self.cv, X_train, y_train
+            )
         try:
-            data_schema = lale.helpers.fold_schema(X_train, y_train, self.cv, is_clf)
+            data_schema = lale.helpers.fold_schema(X_schema, y_schema, self.cv, is_clf)
         except (
             BaseException
         ):  # we may not always be able to extract schema for the given data format.
@@ -158,7 +228,7 @@ class _HyperoptImpl:
             self.evals_with_defaults = 0
 
         def merge_trials(trials1, trials2):
-            max_tid = max(trial["tid"] for trial in trials1.trials)
+            max_tid = max((trial["tid"] for trial in trials1.trials), default=-1)
 
             for trial in trials2:
                 tid = trial["tid"] + max_tid + 1
@@ -192,37 +262,10 @@ class _HyperoptImpl:
             ):
                 # if max optimization time set, and we have crossed it, exit optimization completely
                 sys.exit(0)
-            if self.max_eval_time:
-                # Run hyperopt in a subprocess that can be interupted
-                manager = multiprocessing.Manager()
-                proc_dict: Dict[str, Any] = manager.dict()  # type: ignore
-                p = multiprocessing.Process(
-                    target=_proc_train_test,
-                    args=(
-                        self,
-                        params,
-                        X_train,
-                        y_train,
-                        X_valid,
-                        y_valid,
-                        fit_params,
-                        proc_dict,
-                    ),
-                )
-                p.start()
-                p.join(self.max_eval_time)
-                if p.is_alive():
-                    p.terminate()
-                    p.join()
-                    logger.warning(
-                        f"Maximum alloted evaluation time exceeded. with hyperparams: {params}, setting status to FAIL"
-                    )
-                    proc_dict["status"] = hyperopt.STATUS_FAIL
-                if "status" not in proc_dict:
-                    logger.warning("Corrupted results, setting status to FAIL")
-                    proc_dict["status"] = hyperopt.STATUS_FAIL
-            else:
-                proc_dict = {}
+            rungs = [None] if self._halving is None else range(self._halving.n_rungs)
+            result: Optional[Dict[str, Any]] = None
+            for rung in rungs:
+                proc_dict: Dict[str, Any] = {}
                 _proc_train_test(
                     self,
                     params,
@@ -232,21 +275,74 @@ class _HyperoptImpl:
                     y_valid,
                     fit_params,
                     proc_dict,
+                    rung,
                 )
-            return proc_dict
+                if self._halving is None:
+                    return proc_dict
+                result, promoted = self._halving.advance(rung, result, proc_dict)
+                if not promoted:
+                    break
+            return result
 
-        algo = getattr(hyperopt, self.algo)
-        # Search in the search space with defaults
-        if self.evals_with_defaults > 0:
-            try:
+        def run_fmin(space, max_evals, trials):
+            if pool is None:
                 hyperopt.fmin(
                     f,
-                    self.search_space_with_defaults,
+                    space,
+                    algo=algo.suggest,
+                    max_evals=max_evals,
+                    trials=trials,
+                    rstate=np.random.RandomState(SEED),
+                    show_progressbar=self.show_progressbar,
+                )
+            else:
+                _fmin_with_pool(
+                    pool,
+                    space,
                     algo=algo.suggest,
-                    max_evals=self.evals_with_defaults,
-                    trials=self._default_trials,
+                    max_evals=max_evals,
+                    trials=trials,
                     rstate=np.random.RandomState(SEED),
                     show_progressbar=self.show_progressbar,
+                    halving=self._halving,
+                    deadline=(
+                        None
+                        if self.max_opt_time is None
+                        else opt_start_time + self.max_opt_time
+                    ),
+                )
+
+        algo = getattr(hyperopt, self.algo)
+        n_jobs = effective_n_jobs(self.n_jobs)
+        pool = None
+        if n_jobs > 1 or self.max_eval_time:
+            # evaluate trials in worker processes, which can be interrupted
+            pool = _TrialWorkerPool(
+                n_jobs, self, X_train, y_train, X_valid, y_valid, fit_params
+            )
+        try:
+            # Search in the search space with defaults
+            if self.evals_with_defaults > 0:
+                try:
+                    run_fmin(
+                        self.search_space_with_defaults,
+                        self.evals_with_defaults,
+                        self._default_trials,
+                    )
+                except SystemExit:
+                    logger.warning(
+                        "Maximum alloted optimization time exceeded. Optimization exited prematurely"
+                    )
+                except AllTrialsFailed as exc:
+                    self._best_estimator = None
+                    if hyperopt.STATUS_OK not in self._trials.statuses():
+                        self._raise_none_succeeded(self._default_trials, exc)
+
+            try:
+                run_fmin(
+                    self.search_space,
+                    self.max_evals - self.evals_with_defaults,
+                    self._trials,
                 )
             except SystemExit:
                 logger.warning(
@@ -255,38 +351,18 @@ class _HyperoptImpl:
             except AllTrialsFailed as exc:
                 self._best_estimator = None
                 if hyperopt.STATUS_OK not in self._trials.statuses():
-                    raise ValueError(
-                        "Error from hyperopt, none of the trials succeeded."
-                    ) from exc
-
-        try:
-            hyperopt.fmin(
-                f,
-                self.search_space,
-                algo=algo.suggest,
-                max_evals=self.max_evals - self.evals_with_defaults,
-                trials=self._trials,
-                rstate=np.random.RandomState(SEED),
-                show_progressbar=self.show_progressbar,
-            )
-        except SystemExit:
-            logger.warning(
-                "Maximum alloted optimization time exceeded. Optimization exited prematurely"
-            )
-        except AllTrialsFailed as exc:
-            self._best_estimator = None
-            if hyperopt.STATUS_OK not in self._trials.statuses():
-                self._summarize_statuses()
-                raise ValueError(
-                    "Error from hyperopt, none of the trials succeeded."
-                ) from exc
+                    self._summarize_statuses()
+                    self._raise_none_succeeded(self._trials, exc)
+        finally:
+            if pool is not None:
+                pool.close()
         self._trials = merge_trials(self._trials, self._default_trials)
         if self.show_progressbar:
             self._summarize_statuses()
         try:
             best_trial = self._trials.best_trial
             val_loss = self._trials.best_trial["result"]["loss"]
-            if len(self._default_trials) > 0:
+            if hyperopt.STATUS_OK in self._default_trials.statuses():
                 default_val_loss = self._default_trials.best_trial["result"]["loss"]
                 if default_val_loss < val_loss:
                     best_trial = self._default_trials.best_trial
@@ -304,6 +380,50 @@ class _HyperoptImpl:
 
         return self
 
+    def _lookup_trial(
+        self, params, rung: Optional[int] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """The key of a trial in the trial cache, and its result if it
+        is there. The key is None if the trial cannot be cached."""
+        if self._trial_cache is None or self._trial_evaluation is None:
+            return None, None
+        try:
+            trainable = create_instance_from_hyperopt_search_space(
+                self.estimator, params
+            )
+        except BaseException:
+            return None, None
+        if trainable is None:
+            return None, None
+        fidelity = None
+        if rung is not None:
+            assert self._halving is not None
+            fidelity = [self._halving.resource, self._halving.resources[: rung + 1]]
+        key = trial_key(trainable, self._trial_evaluation, fidelity)
+        cached = None if key is None else self._trial_cache.get(key)
+        if cached is None:
+            return key, None
+        return_dict = {
+            "params": copy.deepcopy(params),
+            "loss": self.best_score - cached.score,
+            "time": cached.time,
+            "log_loss": cached.log_loss,
+            "status": hyperopt.STATUS_OK,
+            "cached": True,
+        }
+        return key, return_dict
+
+    def _store_trial(self, key: Optional[str], return_dict: Dict[str, Any]) -> None:
+        if key is None or self._trial_cache is None:
+            return
+        if return_dict.get("status") == hyperopt.STATUS_OK:
+            result = TrialResult(
+                float(self.best_score - return_dict["loss"]),
+                float(return_dict["log_loss"]),
+                float(return_dict["time"]),
+            )
+            self._trial_cache.put(key, result)
+
     def predict(self, X_eval, **predict_params):
         warnings.filterwarnings("ignore")
         if self._best_estimator is None:
@@ -325,23 +445,15 @@ class _HyperoptImpl:
     def summary(self):
         """Table summarizing the trial results (ID, loss, time, log_loss, status).
 
+        With early stopping (see the resource and pruner
+        hyperparameters), the status of trials that were stopped early
+        is "pruned", and their loss is the one at the rung or fold
+        where they were stopped.
+
         Returns
         -------
         result : DataFrame"""
-
-        def make_record(trial_dict):
-            return {
-                "name": f'p{trial_dict["tid"]}',
-                "tid": trial_dict["tid"],
-                "loss": trial_dict["result"].get("loss", float("nan")),
-                "time": trial_dict["result"].get("time", float("nan")),
-                "log_loss": trial_dict["result"].get("log_loss", float("nan")),
-                "status": trial_dict["result"]["status"],
-            }
-
-        records = [make_record(td) for td in self._trials.trials]
-        result = pd.DataFrame.from_records(records, index="name")
-        return result
+        return _summarize_trials(self._trials)
 
     def get_pipeline(
         self,
@@ -384,26 +496,54 @@ class _HyperoptImpl:
         return result.export_to_sklearn_pipeline()
 
 
+def _summarize_trials(trials) -> pd.DataFrame:
+    def make_record(trial_dict):
+        return {
+            "name": f'p{trial_dict["tid"]}',
+            "tid": trial_dict["tid"],
+            "loss": trial_dict["result"].get("loss", float("nan")),
+            "time": trial_dict["result"].get("time", float("nan")),
+            "log_loss": trial_dict["result"].get("log_loss", float("nan")),
+            "status": (
+                "pruned"
+                if trial_dict["result"].get("pruned", False)
+                else trial_dict["result"]["status"]
+            ),
+        }
+
+    records = [make_record(td) for td in trials.trials]
+    result = pd.DataFrame.from_records(records, index="name")
+    return result
+
+
 def _hyperopt_train_test(
-    hyperopt_impl, params, X_train, y_train, X_valid, y_valid, fit_params
+    hyperopt_impl, params, X_train, y_train, X_valid, y_valid, fit_params, rung=None
 ):
     warnings.filterwarnings("ignore")
 
     trainable = create_instance_from_hyperopt_search_space(
         hyperopt_impl.estimator, params
     )
-    if hyperopt_impl.cv is not None:
+    cv = hyperopt_impl.cv
+    if rung is not None:
+        cv, X_train, y_train = hyperopt_impl._halving.fidelity(
+            rung, hyperopt_impl.estimator, cv, X_train, y_train
+        )
+    if cv is not None:
         try:
             cv_score, logloss, execution_time = cross_val_score_track_trials(
                 trainable,
                 X_train,
                 y_train,
-                cv=hyperopt_impl.cv,
+                cv=cv,
                 scoring=hyperopt_impl.scoring,
                 args_to_scorer=hyperopt_impl.args_to_scorer,
+                pruner=hyperopt_impl.pruner,
                 **fit_params,
             )
             logger.debug(f"Successful trial of hyperopt with hyperparameters:{params}")
+        except TrialPruned:
+            raise
         except BaseException as e:
             # If there is any error in cross validation, use the score based on a random train-test split as the evaluation criterion
             if hyperopt_impl.handle_cv_failure and trainable is not None:
@@ -459,8 +599,20 @@ def _hyperopt_train_test(
 
 
 def _proc_train_test(
-    hyperopt_impl, params, X_train, y_train, X_valid, y_valid, fit_params, return_dict
+    hyperopt_impl,
+    params,
+    X_train,
+    y_train,
+    X_valid,
+    y_valid,
+    fit_params,
+    return_dict,
+    rung=None,
 ):
+    key, cached = hyperopt_impl._lookup_trial(params, rung)
+    if cached is not None:
+        return_dict.update(cached)
+        return
     return_dict["params"] = copy.deepcopy(params)
     try:
         score, logloss, execution_time = _hyperopt_train_test(
@@ -471,11 +623,19 @@ def _proc_train_test(
             X_valid=X_valid,
             y_valid=y_valid,
             fit_params=fit_params,
+            rung=rung,
         )
         return_dict["loss"] = hyperopt_impl.best_score - score
         return_dict["time"] = execution_time
         return_dict["log_loss"] = logloss
         return_dict["status"] = hyperopt.STATUS_OK
+    except TrialPruned as e:
+        logger.debug(f"{e} with hyperparameters:{params}")
+        return_dict["loss"] = hyperopt_impl.best_score - e.score
+        return_dict["time"] = e.time
+        return_dict["log_loss"] = e.log_loss
+        return_dict["status"] = hyperopt.STATUS_SUSPENDED
+        return_dict["pruned"] = True
     except BaseException as e:
         exception_type = f"{type(e).__module__}.{type(e).__name__}"
         try:
@@ -497,6 +657,429 @@ def _proc_train_test(
         return_dict["error_msg"] = error_msg
         if hyperopt_impl.verbose:
             print(return_dict["error_msg"])
+    hyperopt_impl._store_trial(key, return_dict)
+
+
+class _FoldRange:
+    """Splitter that yields a contiguous range of the splits of another."""
+
+    def __init__(self, cv, start: int, stop: int):
+        self._cv = cv
+        self._start = start
+        self._stop = stop
+
+    def get_n_splits(self, X=None, y=None, groups=None) -> int:
+        return self._stop - self._start
+
+    def split(self, X, y=None, **kwargs):
+        return itertools.islice(self._cv.split(X, y, **kwargs), self._start, self._stop)
+
+
+class _SuccessiveHalving:
+    """Rung schedule and promotion decisions for early stopping.
+
+    Rung i evaluates a trial with min_resources * factor**i of the
+    resource, up to all of it at the last rung. For n_folds, each rung
+    runs the folds that follow those of the rung below, and the loss is
+    the mean over all folds run so far. For n_samples, each rung
+    cross-validates on a random subsample of the training data, and the
+    subsamples of lower rungs are contained in those of higher ones.
+
+    Promotion is asynchronous: a trial that finishes a rung continues
+    right away if its loss is among the best 1/factor of the losses
+    recorded at that rung so far, or the best one while there are fewer
+    than factor of them, and is pruned otherwise. So trials never wait
+    for other trials to finish a rung."""
+
+    def __init__(
+        self,
+        resource: str,
+        factor: float,
+        min_resources: Optional[float],
+        n_folds: Optional[int],
+    ):
+        max_resources: Union[int, float]
+        if resource == "n_folds":
+            assert n_folds is not None
+            max_resources = n_folds
+            min_r = 1 if min_resources is None else min_resources
+            if min_r != int(min_r) or min_r < 1:
+                raise ValueError(
+                    f"min_resources must be a whole number of folds for resource='n_folds', got {min_resources}."
+                )
+        else:
+            max_resources = 1.0
+            min_r = factor**-2 if min_resources is None else min_resources
+        if not 0 < min_r <= max_resources:
+            raise ValueError(
+                f"min_resources must be positive and at most {max_resources} for resource={resource!r}, got {min_resources}."
+            )
+        resources: Set[Union[int, float]] = {max_resources}
+        r = min_r
+        while r < max_resources:
+            resources.add(round(r) if resource == "n_folds" else r)
+            r *= factor
+        self.resource = resource
+        self.factor = factor
+        self.resources = sorted(resources)
+        self._losses: List[List[float]] = [[] for _ in self.resources]
+        self._permutations: Dict[int, np.ndarray] = {}
+
+    @property
+    def n_rungs(self) -> int:
+        return len(self.resources)
+
+    def fidelity(self, rung: int, estimator, cv, X, y):
+        """The splitter and training data with which to evaluate a rung."""
+        if self.resource == "n_folds":
+            start = 0 if rung == 0 else self.resources[rung - 1]
+            return _FoldRange(cv, start, self.resources[rung]), X, y
+        fraction = self.resources[rung]
+        if fraction >= 1.0:
+            return cv, X, y
+        n_rows = X.shape[0] if hasattr(X, "shape") else len(X)
+        if n_rows not in self._permutations:
+            rng = np.random.RandomState(SEED)
+            self._permutations[n_rows] = rng.permutation(n_rows)
+        n_subsample = max(1, int(round(fraction * n_rows)))
+        indices = np.sort(self._permutations[n_rows][:n_subsample])
+        X_subsample, y_subsample = split_with_schemas(estimator, X, y, indices)
+        return cv, X_subsample, y_subsample
+
+    def prune(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        return dict(result, status=hyperopt.STATUS_SUSPENDED, pruned=True)
+
+    def advance(
+        self, rung: int, previous: Optional[Dict[str, Any]], return_dict
+    ) -> Tuple[Dict[str, Any], bool]:
+        """Combine the result of a trial at a rung with its results at
+        lower rungs, and decide whether the trial continues.
+
+        Returns
+        -------
+        tuple
+            The result of the trial so far, and whether to evaluate the
+            next rung. Pruned trials have status "suspended", which
+            keeps them out of the best trial, while their loss still
+            informs the search algorithm."""
+        if return_dict.get("status") != hyperopt.STATUS_OK:
+            return return_dict, False
+        result = return_dict
+        if self.resource == "n_folds" and previous is not None:
+            n_previous = self.resources[rung - 1]
+            n_folds = self.resources[rung]
+            result = dict(return_dict)
+            for key in ["loss", "time", "log_loss"]:
+                result[key] = (
+                    previous[key] * n_previous
+                    + return_dict[key] * (n_folds - n_previous)
+                ) / n_folds
+        if rung == self.n_rungs - 1:
+            return result, False
+        losses = self._losses[rung]
+        bisect.insort(losses, result["loss"])
+        n_promoted = max(1, int(len(losses) / self.factor))
+        if result["loss"] <= losses[n_promoted - 1]:
+            return result, True
+        return self.prune(result), False
+
+
+class _ReportingPruner(Pruner):
+    """Pruner of a worker process, which makes the decisions of the
+    pruner it was sent with the trial and keeps the report, so that the
+    worker can return it to the pruner of the parent process."""
+
+    def __init__(self, pruner: Pruner):
+        self._pruner = pruner
+        self.scores: Optional[List[float]] = None
+
+    def should_prune(self, fold: int, score: float) -> bool:
+        return self._pruner.should_prune(fold, score)
+
+    def report(self, scores: List[float]) -> None:
+        self.scores = scores
+
+
+def _trial_worker(conn, hyperopt_impl, data, fit_params):
+    if isinstance(data, SharedDataHandle):
+        data = data.load()
+    X_train, y_train, X_valid, y_valid = data
+    hyperopt_impl._trial_cache = None  # the parent looks up and stores trials
+    conn.send(None)  # ready
+    while True:
+        task = conn.recv()
+        if task is None:
+            break
+        tid, params, rung, pruner = task
+        if pruner is not None:
+            hyperopt_impl.pruner = _ReportingPruner(pruner)
+        return_dict: Dict[str, Any] = {}
+        _proc_train_test(
+            hyperopt_impl,
+            params,
+            X_train,
+            y_train,
+            X_valid,
+            y_valid,
+            copy.copy(fit_params),
+            return_dict,
+            rung,
+        )
+        if pruner is not None and hyperopt_impl.pruner.scores is not None:
+            return_dict["fold_scores"] = hyperopt_impl.pruner.scores
+        conn.send((tid, return_dict))
+
+
+class _TrialWorkerPool:
+    """Worker processes that evaluate trials for the duration of a fit.
+
+    Each worker receives the data once, when it starts, rather than with
+    every trial. Forked workers inherit it; otherwise, it is placed in
+    shared memory, so that workers map it instead of unpickling copies.
+    Trials are only sent to workers that are ready, so max_eval_time does
+    not include starting a worker. A worker whose trial exceeds it is
+    terminated and replaced by a new one. Trials are sent with the
+    current state of the pruner, and the reports of trials that finish
+    all their folds are returned to it. Trials found in the trial cache
+    are finished without a worker, and the results of the others are
+    stored in it."""
+
+    def __init__(
+        self, n_jobs, hyperopt_impl, X_train, y_train, X_valid, y_valid, fit_params
+    ):
+        data: Any = (X_train, y_train, X_valid, y_valid)
+        self._shared: Optional[SharedData] = None
+        if multiprocessing.get_start_method() != "fork":
+            self._shared = SharedData()
+            data = self._shared.share(data)
+        self._args = (hyperopt_impl, data, fit_params)
+        self._hyperopt_impl = hyperopt_impl
+        self._pruner: Optional[Pruner] = hyperopt_impl.pruner
+        self._max_eval_time = hyperopt_impl.max_eval_time
+        self._workers = [self._start_worker() for _ in range(n_jobs)]
+        self._ready: Set[int] = set()
+        # index of busy worker -> (tid, params, start time)
+        self._running: Dict[int, Tuple[int, Any, float]] = {}
+        self._keys: Dict[int, Optional[str]] = {}  # tid -> trial cache key
+        self._cached: List[Tuple[int, Dict[str, Any]]] = []
+
+    def _start_worker(self):
+        parent_conn, child_conn = multiprocessing.Pipe()
+        proc = multiprocessing.Process(
+            target=_trial_worker, args=(child_conn, *self._args), daemon=True
+        )
+        proc.start()
+        child_conn.close()
+        return proc, parent_conn
+
+    def _replace_worker(self, i: int) -> None:
+        proc, conn = self._workers[i]
+        proc.terminate()
+        proc.join()
+        conn.close()
+        self._ready.discard(i)
+        self._workers[i] = self._start_worker()
+
+    @property
+    def n_idle(self) -> int:
+        return len(self._ready) - len(self._running)
+
+    @property
+    def n_running(self) -> int:
+        return len(self._running) + len(self._cached)
+
+    def submit(self, tid: int, params, rung: Optional[int] = None) -> None:
+        key, cached = self._hyperopt_impl._lookup_trial(params, rung)
+        if cached is not None:
+            self._cached.append((tid, cached))
+            return
+        self._keys[tid] = key
+        i = next(i for i in sorted(self._ready) if i not in self._running)
+        self._workers[i][1].send((tid, params, rung, self._pruner))
+        self._running[i] = (tid, params, time.time())
+
+    def wait(self) -> List[Tuple[int, Dict[str, Any]]]:
+        """Block until a worker becomes ready or a running trial finishes
+        or times out.
+
+        Returns
+        -------
+        list of tuples
+            The trial ids and result dictionaries of the finished trials."""
+        if self._cached:
+            finished, self._cached = self._cached, []
+            return finished
+        timeout = None
+        if self._max_eval_time and self._running:
+            first_start = min(start for _, _, start in self._running.values())
+            timeout = max(0.0, first_start + self._max_eval_time - time.time())
+        conns = {
+            conn: i
+            for i, (_, conn) in enumerate(self._workers)
+            if i in self._running or i not in self._ready
+        }
+        finished = []
+        for conn in multiprocessing.connection.wait(list(conns), timeout):
+            i = conns[conn]
+            if i not in self._ready:
+                try:
+                    conn.recv()
+                except EOFError as exc:
+                    raise RuntimeError(
+                        "Hyperopt worker process exited while starting."
+                    ) from exc
+                self._ready.add(i)
+                continue
+            tid, params, _ = self._running.pop(i)
+            key = self._keys.pop(tid)
+            try:
+                _, return_dict = conn.recv()
+                fold_scores = return_dict.pop("fold_scores", None)
+                if fold_scores is not None and self._pruner is not None:
+                    self._pruner.report(fold_scores)
+                self._hyperopt_impl._store_trial(key, return_dict)
+            except EOFError:
+                logger.warning("Corrupted results, setting status to FAIL")
+                return_dict = {"params": params, "status": hyperopt.STATUS_FAIL}
+                self._replace_worker(i)
+            finished.append((tid, return_dict))
+        if self._max_eval_time:
+            now = time.time()
+            for i, (tid, params, start) in list(self._running.items()):
+                if now - start >= self._max_eval_time:
+                    logger.warning(
+                        f"Maximum alloted evaluation time exceeded. with hyperparams: {params}, setting status to FAIL"
+                    )
+                    del self._running[i]
+                    del self._keys[tid]
+                    self._replace_worker(i)
+                    return_dict = {"params": params, "status": hyperopt.STATUS_FAIL}
+                    finished.append((tid, return_dict))
+        return finished
+
+    def close(self) -> None:
+        for i, (proc, conn) in enumerate(self._workers):
+            if i in self._running or i not in self._ready:
+                proc.terminate()
+            else:
+                try:
+                    conn.send(None)
+                except (BrokenPipeError, OSError):
+                    proc.terminate()
+            proc.join()
+            conn.close()
+        self._workers = []
+        self._ready = set()
+        self._running = {}
+        self._keys = {}
+        self._cached = []
+        if self._shared is not None:
+            self._shared.close()
+
+
+def _fmin_with_pool(
+    pool,
+    space,
+    algo,
+    max_evals,
+    trials,
+    rstate,
+    show_progressbar,
+    deadline,
+    halving=None,
+):
+    """Like hyperopt.fmin, but evaluates trials in the worker pool.
+
+    Whenever a worker is idle, the algorithm suggests a new trial given
+    the finished ones and the ones still running, so all workers stay
+    busy. With early stopping, each rung of a trial is a separate task,
+    and trials promoted to their next rung take precedence over new
+    trials. Once the deadline has passed, no new trials or rungs are
+    started, trials waiting for promotion are pruned, and SystemExit is
+    raised after the running tasks finish."""
+    domain = hyperopt.Domain(lambda params: params, space)
+    progress_callback = (
+        hyperopt.progress.default_callback
+        if show_progressbar
+        else hyperopt.progress.no_progress_callback
+    )
+    docs = {}
+    # trial id -> (params, rung, result so far) of trials with more rungs to run
+    ladder: Dict[int, Tuple[Any, Optional[int], Optional[Dict[str, Any]]]] = {}
+    promoted: Deque[int] = deque()
+    n_started = 0
+    timed_out = False
+
+    def finish(tid, result):
+        doc = docs.pop(tid)
+        doc["result"] = domain.evaluate_async2(result, None)
+        doc["state"] = hyperopt.JOB_STATE_DONE
+        doc["refresh_time"] = hyperopt.utils.coarse_utcnow()
+        progress_ctx.update(1)
+
+    with progress_callback(initial=0, total=max_evals) as progress_ctx:
+        while True:
+            timed_out = timed_out or (deadline is not None and time.time() > deadline)
+            if timed_out:
+                while promoted:
+                    tid = promoted.popleft()
+                    _, _, result = ladder.pop(tid)
+                    assert result is not None
+                    finish(tid, halving.prune(result))
+            while not timed_out and pool.n_idle > 0 and promoted:
+                tid = promoted.popleft()
+                params, rung, _ = ladder[tid]
+                pool.submit(tid, params, rung)
+            while not timed_out and pool.n_idle > 0 and n_started < max_evals:
+                new_ids = trials.new_trial_ids(1)
+                trials.refresh()
+                new_trials = algo(new_ids, domain, trials, rstate.randint(2**31 - 1))
+                if len(new_trials) == 0:
+                    max_evals = n_started
+                    break
+                trials.insert_trial_docs(new_trials)
+                trials.refresh()
+                for doc in trials._dynamic_trials[-len(new_trials) :]:
+                    ctrl = hyperopt.Ctrl(trials, current_trial=doc)
+                    spec = hyperopt.base.spec_from_misc(doc["misc"])
+                    _, params = domain.evaluate_async(spec, ctrl)
+                    doc["state"] = hyperopt.JOB_STATE_RUNNING
+                    doc["book_time"] = doc["refresh_time"] = (
+                        hyperopt.utils.coarse_utcnow()
+                    )
+                    docs[doc["tid"]] = doc
+                    rung = None if halving is None else 0
+                    ladder[doc["tid"]] = (params, rung, None)
+                    pool.submit(doc["tid"], params, rung)
+                    n_started += 1
+            if (
+                pool.n_running == 0
+                and not promoted
+                and (timed_out or n_started >= max_evals)
+            ):
+                break
+            for tid, return_dict in pool.wait():
+                params, rung, result = ladder.pop(tid)
+                if halving is None:
+                    finish(tid, return_dict)
+                    continue
+                assert rung is not None
+                result, promote = halving.advance(rung, result, return_dict)
+                if promote:
+                    ladder[tid] = (params, rung + 1, result)
+                    promoted.append(tid)
+                else:
+                    finish(tid, result)
+            trials.refresh()
+            losses = [
+                r["loss"] for r in trials.results if r["status"] == hyperopt.STATUS_OK
+            ]
+            if losses:
+                progress_ctx.postfix = "best loss: " + str(min(losses))
+    if timed_out:
+        sys.exit(0)
+    if hyperopt.STATUS_OK not in trials.statuses():
+        raise AllTrialsFailed()
 
 
 _hyperparams_schema = {
@@ -590,8 +1173,111 @@ for (1-frac_evals_with_defaults) fraction of max_evals.""",
                     "anyOf": [{"description": "lale.search.PGO"}, {"enum": [None]}],
                     "default": None,
                 },
+                "n_jobs": {
+                    "description": """Number of trials to evaluate in parallel.
+
+Trials run in worker processes that receive the data once and live
+for the duration of fit. When a worker finishes, its result is
+recorded and the next trial is suggested given the finished trials
+and the ones still running.""",
+                    "anyOf": [
+                        {
+                            "description": "1, in the current process unless max_eval_time is set.",
+                            "enum": [None],
+                        },
+                        {"description": "Use all processors.", "enum": [-1]},
+                        {
+                            "description": "Number of worker processes.",
+                            "type": "integer",
+                            "minimum": 1,
+                        },
+                    ],
+                    "default": None,
+                },
+                "resource": {
+                    "description": """Resource for early stopping of poor trials by asynchronous successive halving (ASHA).
+
+Trials are evaluated in rungs with increasing amounts of the resource,
+and only the best 1/factor of the trials that reach a rung continue to
+the next one, the others are pruned. The best trial is chosen among
+the trials that reached the last rung. With n_jobs, the rungs of
+different trials run in parallel, and max_eval_time applies to each
+rung.""",
+                    "anyOf": [
+                        {
+                            "description": "No early stopping, every trial is evaluated on all folds and samples.",
+                            "enum": [None],
+                        },
+                        {
+                            "description": "Rungs run increasing numbers of the folds of cv, so the last rung computes the usual cross-validation score. Requires cv splits that are the same every time they are computed.",
+                            "enum": ["n_folds"],
+                        },
+                        {
+                            "description": "Rungs cross-validate on increasing random subsamples of the training data, up to all of it.",
+                            "enum": ["n_samples"],
+                        },
+                    ],
+                    "default": None,
+                },
+                "factor": {
+                    "description": "Ratio between the resources of consecutive rungs, and inverse of the fraction of trials promoted from one rung to the next.",
+                    "type": "number",
+                    "minimum": 1,
+                    "exclusiveMinimum": True,
+                    "default": 3,
+                },
+                "min_resources": {
+                    "description": "Resource of the first rung when resource is not None.",
+                    "anyOf": [
+                        {
+                            "description": "1 fold for n_folds and a fraction of 1/factor**2 of the samples for n_samples.",
+                            "enum": [None],
+                        },
+                        {
+                            "description": "Number of folds for n_folds, or fraction of the samples for n_samples.",
+                            "type": "number",
+                            "minimum": 0,
+                            "exclusiveMinimum": True,
+                        },
+                    ],
+                    "default": None,
+                },
+                "pruner": {
+                    "description": """Pruner that stops unpromising trials between cross-validation folds.
+
+Pruned trials are recorded with the mean score of their finished folds
+and the status "pruned" in summary(), and are not chosen as the best
+trial. Trials that finish all folds have the same results as without a
+pruner. Cannot be combined with resource.""",
+                    "anyOf": [
+                        {"description": "lale.pruners.Pruner"},
+                        {"description": "Finish all folds.", "enum": [None]},
+                    ],
+                    "default": None,
+                },
+                "trial_cache": schema_trial_cache,
             },
-        }
+        },
+        {
+            "description": "For resource='n_folds', min_resources is a whole number of folds.",
+            "anyOf": [
+                {
+                    "type": "object",
+                    "properties": {"resource": {"not": {"enum": ["n_folds"]}}},
+                },
+                {
+                    "type": "object",
+                    "properties": {
+                        "min_resources": {
+                            "anyOf": [
+                                {"enum": [None]},
+                                {"type": "integer", "minimum": 1},
+                            ]
+                        }
+                    },
+                },
+            ],
+        },
     ]
 }
 
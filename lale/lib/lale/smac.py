@@ -32,8 +32,11 @@ from lale.lib._common_schemas import (
     schema_estimator,
     schema_max_opt_time,
     schema_scoring_single,
+    schema_trial_cache,
 )
 from lale.lib.sklearn import LogisticRegression
+from lale.pruners import TrialPruned
+from lale.trial_cache import TrialResult, get_trial_cache, trial_evaluation, trial_key
 
 try:
     # Import ConfigSpace and different types of parameters
@@ -71,6 +74,8 @@ class _SMACImpl:
         max_evals=50,
         max_opt_time=None,
         lale_num_grids=None,
+        pruner=None,
+        trial_cache=None,
     ):
         assert smac_installed, """Your Python environment does not have smac installed. You can install it with
     pip install smac<=0.10.0
@@ -95,6 +100,8 @@ or with
         self.cv = cv
         self.max_opt_time = max_opt_time
         self.lale_num_grids = lale_num_grids
+        self.pruner = pruner
+        self.trial_cache = trial_cache
         self.trials = None
 
     def fit(self, X_train, y_train, **fit_params):
@@ -119,13 +126,24 @@ or with
         self.cv = check_cv(
             self.cv, y=y_train, classifier=self.estimator.is_classifier()
         )
+        trial_cache = get_trial_cache(self.trial_cache)
+        evaluation = None
+        if trial_cache is not None:
+            evaluation = trial_evaluation(X_train, y_train, self.cv, self.scoring)
 
         def smac_train_test(trainable, X_train, y_train):
             try:
                 cv_score, logloss, execution_time = cross_val_score_track_trials(
-                    trainable, X_train, y_train, cv=self.cv, scoring=self.scoring
+                    trainable,
+                    X_train,
+                    y_train,
+                    cv=self.cv,
+                    scoring=self.scoring,
+                    pruner=self.pruner,
                 )
                 logger.debug("Successful trial of SMAC")
+            except TrialPruned:
+                raise
             except BaseException as e:
                 # If there is any error in cross validation, use the score based on a random train-test split as the evaluation criterion
                 if self.handle_cv_failure:
@@ -152,6 +170,12 @@ or with
             return cv_score, logloss, execution_time
 
         def f(trainable):
+            key = None
+            if trial_cache is not None and evaluation is not None:
+                key = trial_key(trainable, evaluation)
+                cached = None if key is None else trial_cache.get(key)
+                if cached is not None:
+                    return self.best_score - cached.score
             return_dict = {}
             try:
                 score, logloss, execution_time = smac_train_test(
@@ -162,6 +186,12 @@ or with
                     "time": execution_time,
                     "log_loss": logloss,
                 }
+                if key is not None:
+                    trial_cache.put(key, TrialResult(score, logloss, execution_time))
+            except TrialPruned as e:
+                # SMAC has no status for pruned runs, so it gets the partial loss
+                logger.debug(f"{e} in SMAC")
+                return self.best_score - e.score
             except BaseException as e:
                 logger.warning(
                     f"Exception caught in SMACCV:{type(e)}, {traceback.format_exc()}, SMAC will set a cost_for_crash to MAXINT."
@@ -268,6 +298,17 @@ validation part. If False, terminate the trial with FAIL status.""",
                     "description": "Number of trials of SMAC search i.e. runcount_limit of SMAC.",
                 },
                 "max_opt_time": schema_max_opt_time,
+                "pruner": {
+                    "description": """Pruner that stops unpromising trials between cross-validation folds.
+
+SMAC receives the loss of the folds that a pruned trial finished.""",
+                    "anyOf": [
+                        {"description": "lale.pruners.Pruner"},
+                        {"description": "Finish all folds.", "enum": [None]},
+                    ],
+                    "default": None,
+                },
+                "trial_cache": schema_trial_cache,
                 "lale_num_grids": {
                     "anyOf": [
                         {"description": "If not set, keep all grids.", "enum": [None]},
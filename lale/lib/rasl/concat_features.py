@@ -63,6 +63,23 @@ def _gen_table_name(avoid, cpt=0):
         return name
 
 
+def _to_2d(dataset, keep_sparse: bool):
+    if _is_pandas(dataset):
+        np_dataset = dataset.values
+    elif _is_spark_df(dataset):
+        np_dataset = dataset.toPandas().values
+    elif scipy.sparse.issparse(dataset):
+        np_dataset = dataset if keep_sparse else dataset.toarray()
+    elif torch_installed and isinstance(dataset, torch.Tensor):
+        np_dataset = dataset.detach().cpu().numpy()
+    else:
+        np_dataset = dataset
+    if hasattr(np_dataset, "shape"):
+        if len(np_dataset.shape) == 1:  # To handle numpy column vectors
+            np_dataset = np.reshape(np_dataset, (np_dataset.shape[0], 1))
+    return np_dataset
+
+
 class _ConcatFeaturesImpl:
     def transform(self, X):
         if all(_is_pandas(d) for d in X):
@@ -112,24 +129,14 @@ class _ConcatFeaturesImpl:
         elif all(_is_pandas(d) or _is_spark_df(d) for d in X):
             X = [d.toPandas() if _is_spark_df(d) else d for d in X]
             result = self.transform(X)
+        elif any(scipy.sparse.issparse(d) for d in X):
+            # stay sparse, densifying e.g. TF-IDF features would blow up memory
+            return scipy.sparse.hstack(
+                [_to_2d(d, keep_sparse=True) for d in X], format="csr"
+            )
         else:
-            np_datasets = []
             # Preprocess the datasets to convert them to 2-d numpy arrays
-            for dataset in X:
-                if _is_pandas(dataset):
-                    np_dataset = dataset.values
-                elif _is_spark_df(dataset):
-                    np_dataset = dataset.toPandas().values
-                elif isinstance(dataset, scipy.sparse.csr_matrix):
-                    np_dataset = dataset.toarray()
-                elif torch_installed and isinstance(dataset, torch.Tensor):
-                    np_dataset = dataset.detach().cpu().numpy()
-                else:
-                    np_dataset = dataset
-                if hasattr(np_dataset, "shape"):
-                    if len(np_dataset.shape) == 1:  # To handle numpy column vectors
-                        np_dataset = np.reshape(np_dataset, (np_dataset.shape[0], 1))
-                np_datasets.append(np_dataset)
+            np_datasets = [_to_2d(dataset, keep_sparse=False) for dataset in X]
             result = np.concatenate(np_datasets, axis=1)
         name = reduce(
             (
@@ -253,8 +253,15 @@ class _ProjectImpl:
             cols = [
                 X.columns[x] if isinstance(x, int) else x for x in self._fit_columns
             ]
-            exprs = {c: it[c] for c in cols}
-            m = Map(columns=exprs)
+            # reuse the Map operator across calls with the same column
+            # layout, so scoring small batches does not pay for configuring
+            # a fresh operator every time
+            cached = getattr(self, "_cached_map", None)
+            if cached is None or cached[0] != cols:
+                exprs = {c: it[c] for c in cols}
+                cached = (cols, Map(columns=exprs))
+                self._cached_map = cached
+            m = cached[1]
             assert isinstance(m, lale.operators.TrainedOperator)
             result = m.transform(X)
         # elif isinstance(X, pd.DataFrame):
@@ -264,9 +271,14 @@ class _ProjectImpl:
         #         result = X[self._fit_columns]
         # else:
         #     raise TypeError(f"type {type(X)}")
-        s_X = lale.datasets.data_schemas._to_schema(X)
-        s_result = self._transform_schema_nocheck(s_X)
-        result = lale.datasets.data_schemas.add_schema(result, s_result, recalc=True)
+        from lale.settings import disable_data_schema_validation
+
+        if not disable_data_schema_validation:
+            s_X = lale.datasets.data_schemas._to_schema(X)
+            s_result = self._transform_schema_nocheck(s_X)
+            result = lale.datasets.data_schemas.add_schema(
+                result, s_result, recalc=True
+            )
         result = lale.datasets.data_schemas.add_table_name(
             result, lale.datasets.data_schemas.get_table_name(X)
         )
@@ -161,86 +161,157 @@ Clustering:
 .. _`StackingRegressor`: lale.lib.sklearn.stacking_regressor.html
 """
 
-from packaging import version
+from typing import TYPE_CHECKING
 
 from lale import register_lale_wrapper_modules
-from lale.operators import sklearn_version
+from lale.lib._lazy_imports import attach
 
 # Note: all imports should be done as
 # from .xxx import XXX as XXX
 # this ensures that pyright considers them to be publicly available
 # and not private imports (this affects lale users that use pyright)
-from .ada_boost_classifier import AdaBoostClassifier as AdaBoostClassifier
-from .ada_boost_regressor import AdaBoostRegressor as AdaBoostRegressor
-from .bagging_classifier import BaggingClassifier as BaggingClassifier
-from .bagging_regressor import BaggingRegressor as BaggingRegressor
-from .column_transformer import ColumnTransformer as ColumnTransformer
-from .decision_tree_classifier import DecisionTreeClassifier as DecisionTreeClassifier
-from .decision_tree_regressor import DecisionTreeRegressor as DecisionTreeRegressor
-from .dummy_classifier import DummyClassifier as DummyClassifier
-from .dummy_regressor import DummyRegressor as DummyRegressor
-from .extra_trees_classifier import ExtraTreesClassifier as ExtraTreesClassifier
-from .extra_trees_regressor import ExtraTreesRegressor as ExtraTreesRegressor
-from .feature_agglomeration import FeatureAgglomeration as FeatureAgglomeration
-from .function_transformer import FunctionTransformer as FunctionTransformer
-from .gaussian_nb import GaussianNB as GaussianNB
-from .gradient_boosting_classifier import (
-    GradientBoostingClassifier as GradientBoostingClassifier,
-)
-from .gradient_boosting_regressor import (
-    GradientBoostingRegressor as GradientBoostingRegressor,
-)
-from .isolation_forest import IsolationForest as IsolationForest
-from .isomap import Isomap as Isomap
-from .k_means import KMeans as KMeans
-from .k_neighbors_classifier import KNeighborsClassifier as KNeighborsClassifier
-from .k_neighbors_regressor import KNeighborsRegressor as KNeighborsRegressor
-from .linear_regression import LinearRegression as LinearRegression
-from .linear_svc import LinearSVC as LinearSVC
-from .linear_svr import LinearSVR as LinearSVR
-from .logistic_regression import LogisticRegression as LogisticRegression
-from .min_max_scaler import MinMaxScaler as MinMaxScaler
-from .missing_indicator import MissingIndicator as MissingIndicator
-from .mlp_classifier import MLPClassifier as MLPClassifier
-from .multi_output_regressor import MultiOutputRegressor as MultiOutputRegressor
-from .multinomial_nb import MultinomialNB as MultinomialNB
-from .nmf import NMF as NMF
-from .normalizer import Normalizer as Normalizer
-from .nystroem import Nystroem as Nystroem
-from .one_hot_encoder import OneHotEncoder as OneHotEncoder
-from .ordinal_encoder import OrdinalEncoder as OrdinalEncoder
-from .passive_aggressive_classifier import (
-    PassiveAggressiveClassifier as PassiveAggressiveClassifier,
-)
-from .pca import PCA as PCA
-from .perceptron import Perceptron as Perceptron
-from .pipeline import Pipeline as Pipeline
-from .polynomial_features import PolynomialFeatures as PolynomialFeatures
-from .quadratic_discriminant_analysis import (
-    QuadraticDiscriminantAnalysis as QuadraticDiscriminantAnalysis,
-)
-from .quantile_transformer import QuantileTransformer as QuantileTransformer
-from .random_forest_classifier import RandomForestClassifier as RandomForestClassifier
-from .random_forest_regressor import RandomForestRegressor as RandomForestRegressor
-from .rfe import RFE as RFE
-from .ridge import Ridge as Ridge
-from .ridge_classifier import RidgeClassifier as RidgeClassifier
-from .robust_scaler import RobustScaler as RobustScaler
-from .select_k_best import SelectKBest as SelectKBest
-from .sgd_classifier import SGDClassifier as SGDClassifier
-from .sgd_regressor import SGDRegressor as SGDRegressor
-from .simple_imputer import SimpleImputer as SimpleImputer
-from .standard_scaler import StandardScaler as StandardScaler
-from .svc import SVC as SVC
-from .svr import SVR as SVR
-from .target_encoder import TargetEncoder as TargetEncoder
-from .tfidf_vectorizer import TfidfVectorizer as TfidfVectorizer
-from .variance_threshold import VarianceThreshold as VarianceThreshold
-from .voting_classifier import VotingClassifier as VotingClassifier
-
-if sklearn_version >= version.Version("0.21"):
+if TYPE_CHECKING:
+    from .ada_boost_classifier import AdaBoostClassifier as AdaBoostClassifier
+    from .ada_boost_regressor import AdaBoostRegressor as AdaBoostRegressor
+    from .bagging_classifier import BaggingClassifier as BaggingClassifier
+    from .bagging_regressor import BaggingRegressor as BaggingRegressor
+    from .column_transformer import ColumnTransformer as ColumnTransformer
+    from .decision_tree_classifier import (
+        DecisionTreeClassifier as DecisionTreeClassifier,
+    )
+    from .decision_tree_regressor import DecisionTreeRegressor as DecisionTreeRegressor
+    from .dummy_classifier import DummyClassifier as DummyClassifier
+    from .dummy_regressor import DummyRegressor as DummyRegressor
+    from .extra_trees_classifier import ExtraTreesClassifier as ExtraTreesClassifier
+    from .extra_trees_regressor import ExtraTreesRegressor as ExtraTreesRegressor
+    from .feature_agglomeration import FeatureAgglomeration as FeatureAgglomeration
+    from .function_transformer import FunctionTransformer as FunctionTransformer
+    from .gaussian_nb import GaussianNB as GaussianNB
+    from .gradient_boosting_classifier import (
+        GradientBoostingClassifier as GradientBoostingClassifier,
+    )
+    from .gradient_boosting_regressor import (
+        GradientBoostingRegressor as GradientBoostingRegressor,
+    )
+    from .isolation_forest import IsolationForest as IsolationForest
+    from .isomap import Isomap as Isomap
+    from .k_means import KMeans as KMeans
+    from .k_neighbors_classifier import KNeighborsClassifier as KNeighborsClassifier
+    from .k_neighbors_regressor import KNeighborsRegressor as KNeighborsRegressor
+    from .linear_regression import LinearRegression as LinearRegression
+    from .linear_svc import LinearSVC as LinearSVC
+    from .linear_svr import LinearSVR as LinearSVR
+    from .logistic_regression import LogisticRegression as LogisticRegression
+    from .min_max_scaler import MinMaxScaler as MinMaxScaler
+    from .missing_indicator import MissingIndicator as MissingIndicator
+    from .mlp_classifier import MLPClassifier as MLPClassifier
+    from .multi_output_regressor import MultiOutputRegressor as MultiOutputRegressor
+    from .multinomial_nb import MultinomialNB as MultinomialNB
+    from .nmf import NMF as NMF
+    from .normalizer import Normalizer as Normalizer
+    from .nystroem import Nystroem as Nystroem
+    from .one_hot_encoder import OneHotEncoder as OneHotEncoder
+    from .ordinal_encoder import OrdinalEncoder as OrdinalEncoder
+    from .passive_aggressive_classifier import (
+        PassiveAggressiveClassifier as PassiveAggressiveClassifier,
+    )
+    from .pca import PCA as PCA
+    from .perceptron import Perceptron as Perceptron
+    from .pipeline import Pipeline as Pipeline
+    from .polynomial_features import PolynomialFeatures as PolynomialFeatures
+    from .quadratic_discriminant_analysis import (
+        QuadraticDiscriminantAnalysis as QuadraticDiscriminantAnalysis,
+    )
+    from .quantile_transformer import QuantileTransformer as QuantileTransformer
+    from .random_forest_classifier import (
+        RandomForestClassifier as RandomForestClassifier,
+    )
+    from .random_forest_regressor import RandomForestRegressor as RandomForestRegressor
+    from .rfe import RFE as RFE
+    from .ridge import Ridge as Ridge
+    from .ridge_classifier import RidgeClassifier as RidgeClassifier
+    from .robust_scaler import RobustScaler as RobustScaler
+    from .select_k_best import SelectKBest as SelectKBest
+    from .sgd_classifier import SGDClassifier as SGDClassifier
+    from .sgd_regressor import SGDRegressor as SGDRegressor
+    from .simple_imputer import SimpleImputer as SimpleImputer
     from .stacking_classifier import StackingClassifier as StackingClassifier
     from .stacking_regressor import StackingRegressor as StackingRegressor
+    from .standard_scaler import StandardScaler as StandardScaler
+    from .svc import SVC as SVC
+    from .svr import SVR as SVR
+    from .target_encoder import TargetEncoder as TargetEncoder
+    from .tfidf_vectorizer import TfidfVectorizer as TfidfVectorizer
+    from .variance_threshold import VarianceThreshold as VarianceThreshold
+    from .voting_classifier import VotingClassifier as VotingClassifier
     from .voting_regressor import VotingRegressor as VotingRegressor
 
+# the exports listed above, by the module that defines them
+_lazy_exports = {
+    "AdaBoostClassifier": ".ada_boost_classifier",
+    "AdaBoostRegressor": ".ada_boost_regressor",
+    "BaggingClassifier": ".bagging_classifier",
+    "BaggingRegressor": ".bagging_regressor",
+    "ColumnTransformer": ".column_transformer",
+    "DecisionTreeClassifier": ".decision_tree_classifier",
+    "DecisionTreeRegressor": ".decision_tree_regressor",
+    "DummyClassifier": ".dummy_classifier",
+    "DummyRegressor": ".dummy_regressor",
+    "ExtraTreesClassifier": ".extra_trees_classifier",
+    "ExtraTreesRegressor": ".extra_trees_regressor",
+    "FeatureAgglomeration": ".feature_agglomeration",
+    "FunctionTransformer": ".function_transformer",
+    "GaussianNB": ".gaussian_nb",
+    "GradientBoostingClassifier": ".gradient_boosting_classifier",
+    "GradientBoostingRegressor": ".gradient_boosting_regressor",
+    "IsolationForest": ".isolation_forest",
+    "Isomap": ".isomap",
+    "KMeans": ".k_means",
+    "KNeighborsClassifier": ".k_neighbors_classifier",
+    "KNeighborsRegressor": ".k_neighbors_regressor",
+    "LinearRegression": ".linear_regression",
+    "LinearSVC": ".linear_svc",
+    "LinearSVR": ".linear_svr",
+    "LogisticRegression": ".logistic_regression",
+    "MinMaxScaler": ".min_max_scaler",
+    "MissingIndicator": ".missing_indicator",
+    "MLPClassifier": ".mlp_classifier",
+    "MultiOutputRegressor": ".multi_output_regressor",
+    "MultinomialNB": ".multinomial_nb",
+    "NMF": ".nmf",
+    "Normalizer": ".normalizer",
+    "Nystroem": ".nystroem",
+    "OneHotEncoder": ".one_hot_encoder",
+    "OrdinalEncoder": ".ordinal_encoder",
+    "PassiveAggressiveClassifier": ".passive_aggressive_classifier",
+    "PCA": ".pca",
+    "Perceptron": ".perceptron",
+    "Pipeline": ".pipeline",
+    "PolynomialFeatures": ".polynomial_features",
+    "QuadraticDiscriminantAnalysis": ".quadratic_discriminant_analysis",
+    "QuantileTransformer": ".quantile_transformer",
+    "RandomForestClassifier": ".random_forest_classifier",
+    "RandomForestRegressor": ".random_forest_regressor",
+    "RFE": ".rfe",
+    "Ridge": ".ridge",
+    "RidgeClassifier": ".ridge_classifier",
+    "RobustScaler": ".robust_scaler",
+    "SelectKBest": ".select_k_best",
+    "SGDClassifier": ".sgd_classifier",
+    "SGDRegressor": ".sgd_regressor",
+    "SimpleImputer": ".simple_imputer",
+    "StackingClassifier": ".stacking_classifier",
+    "StackingRegressor": ".stacking_regressor",
+    "StandardScaler": ".standard_scaler",
+    "SVC": ".svc",
+    "SVR": ".svr",
+    "TargetEncoder": ".target_encoder",
+    "TfidfVectorizer": ".tfidf_vectorizer",
+    "VarianceThreshold": ".variance_threshold",
+    "VotingClassifier": ".voting_classifier",
+    "VotingRegressor": ".voting_regressor",
+}
+
+__getattr__, __dir__, __all__ = attach(__name__, _lazy_exports)
+
 register_lale_wrapper_modules(__name__)
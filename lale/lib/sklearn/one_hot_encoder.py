@@ -150,6 +150,15 @@ class _OneHotEncoderImpl:
 
     def transform(self, X):
         result = self._wrapped_model.transform(X)
+        return self._to_output(X, result)
+
+    def fit_transform(self, X, y=None):
+        result = self._wrapped_model.fit_transform(X, y)
+        if isinstance(X, pd.DataFrame):
+            self._X_columns = X.columns
+        return self._to_output(X, result)
+
+    def _to_output(self, X, result):
         if isinstance(X, pd.DataFrame):
             if sklearn_version >= version.Version("1.0"):
                 columns = self._wrapped_model.get_feature_names_out(X.columns)
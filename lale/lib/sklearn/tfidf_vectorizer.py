@@ -39,6 +39,11 @@ class _TfidfVectorizerImpl:
             X = X.squeeze().astype("U")
         return self._wrapped_model.transform(X)
 
+    def fit_transform(self, X, y=None):
+        if isinstance(X, (np.ndarray, pd.DataFrame)):
+            X = X.squeeze().astype("U")
+        return self._wrapped_model.fit_transform(X, y)
+
 
 _hyperparams_schema = {
     "description": "Convert a collection of raw documents to a matrix of TF-IDF features.",
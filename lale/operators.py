@@ -35,11 +35,13 @@ operators, pipelines, and operator choices.
 
 - Function `make_operator`_ creates an individual Lale operator from a
   schema and an implementation class or object. This is called for each
-  of the operators in module lale.lib when it is being imported.
+  of the operators in module lale.lib when it is first accessed.
 
 - Functions `get_available_operators`_, `get_available_estimators`_,
   and `get_available_transformers`_ return lists of individual
-  operators previously registered by `make_operator`.
+  operators previously registered by `make_operator`, plus the
+  operators with matching tags in the imported packages of lale.lib,
+  which are looked up in a precomputed catalog and loaded on demand.
 
 .. _make_operator: lale.operators.html#lale.operators.make_operator
 .. _get_available_operators: lale.operators.html#lale.operators.get_available_operators
@@ -145,6 +147,7 @@ Since lale supports richer structures, we conservatively extend this scheme as f
 
 """
 
+import concurrent.futures
 import copy
 import difflib
 import enum as enumeration
@@ -152,16 +155,17 @@ import importlib
 import inspect
 import itertools
 import logging
-import os
 import warnings
 from abc import abstractmethod
 from types import MappingProxyType
 from typing import (
     AbstractSet,
     Any,
+    Callable,
     Dict,
     Generic,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -194,10 +198,11 @@ from lale.datasets.data_schemas import (
     strip_schema,
 )
 from lale.helpers import (
-    append_batch,
     are_hyperparameters_equal,
     assignee_name,
     astype_type,
+    concat_batches,
+    effective_n_jobs,
     fold_schema,
     get_name_and_index,
     is_empty_dict,
@@ -207,15 +212,20 @@ from lale.helpers import (
     nest_HPparams,
     partition_sklearn_choice_params,
     partition_sklearn_params,
+    prefer_type,
     structure_type_name,
     to_graphviz,
     val_wrapper,
+    write_batch_output_to_file,
 )
 from lale.json_operator import JSON_TYPE
+from lale.schema_interning import intern_schema, thaw_schema
 from lale.schemas import Schema
 from lale.search.PGO import remove_defaults_dict
 from lale.type_checking import (
     SubschemaError,
+    dtypes_satisfy_schema,
+    first_violated_constraint,
     get_default_schema,
     has_data_constraints,
     is_subschema,
@@ -1446,10 +1456,11 @@ class IndividualOp(Operator):
         """
         self._name = _lale_name
         self._enum_attributes = None
+        # interned schemas are shared by all clones and copies of the operator
         if _lale_schemas:
-            self._schemas = _lale_schemas
+            self._schemas = intern_schema(_lale_schemas)
         else:
-            self._schemas = get_default_schema(_lale_impl)
+            self._schemas = intern_schema(get_default_schema(_lale_impl))
 
         # if we are given a class instance, we need to preserve it
         # so that get_params can return the same exact one that we got
@@ -1814,6 +1825,16 @@ class IndividualOp(Operator):
             state.pop(k, None)
         return state
 
+    def __deepcopy__(self, memo):
+        # the interned schemas are immutable, so the copy shares them
+        schemas = self.__dict__.get("_schemas")
+        if schemas is not None:
+            memo[id(schemas)] = schemas
+        result = type(self).__new__(type(self))
+        memo[id(self)] = result
+        result.__dict__.update(copy.deepcopy(self.__getstate__(), memo))
+        return result
+
     def get_schema(self, schema_kind: str) -> Dict[str, Any]:
         """Return a schema of the operator.
 
@@ -2116,7 +2137,7 @@ class IndividualOp(Operator):
                 result = {**schema}
                 if schema["type"] in ["number", "integer"]:
                     if "default" not in schema:
-                        schema["default"] = None
+                        result["default"] = None
                     if "minimumForOptimizer" not in schema:
                         result["minimumForOptimizer"] = minimum
                     if "maximumForOptimizer" not in schema:
@@ -2366,11 +2387,34 @@ class IndividualOp(Operator):
     MAX_FIX_SUGGESTIONS: int = 3
 
     def _validate_hyperparams(self, hp_explicit, hp_all, hp_schema, class_):
-        from lale.settings import disable_hyperparams_schema_validation
+        from lale.settings import (
+            _trusted_hyperparams,
+            disable_hyperparams_schema_validation,
+        )
 
         if disable_hyperparams_schema_validation:
             return
 
+        if _trusted_hyperparams.get():
+            self._validate_hyperparam_constraints(hp_explicit, hp_all, hp_schema)
+        else:
+            self._validate_hyperparams_with_fixes(hp_explicit, hp_all, hp_schema)
+        user_validator = getattr(class_, "validate_hyperparams", None)
+        if user_validator:
+            user_validator(**hp_all)
+
+    def _validate_hyperparam_constraints(self, hp_explicit, hp_all, hp_schema):
+        # Each hyperparameter came from a search space compiled from its
+        # own schema, so only the side constraints among them need checking.
+        constraint = first_violated_constraint(hp_all, hp_schema)
+        if constraint is not None:
+            hps = lale.pretty_print.hyperparams_to_string(hp_explicit or {})
+            descr = constraint.get("description", "")
+            raise jsonschema.ValidationError(
+                f"Invalid configuration for {self.name()}({hps}) due to constraint {descr}"
+            )
+
+    def _validate_hyperparams_with_fixes(self, hp_explicit, hp_all, hp_schema):
         try:
             validate_schema_directly(hp_all, hp_schema)
         except jsonschema.ValidationError as e_orig:
@@ -2470,9 +2514,6 @@ class IndividualOp(Operator):
                 + f"Invalid value: {e.instance}"
             )
             raise jsonschema.ValidationError(msg)
-        user_validator = getattr(class_, "validate_hyperparams", None)
-        if user_validator:
-            user_validator(**hp_all)
 
     def validate_schema(self, X: Any, y: Any = None):
         if self.has_method("fit"):
@@ -2514,9 +2555,11 @@ class IndividualOp(Operator):
             else:
                 raise ValueError(f"Unexpected method argument: {method}")
             if "properties" in schema and arg_name in schema["properties"]:
+                sup: JSON_TYPE = schema["properties"][arg_name]
+                if dtypes_satisfy_schema(arg, sup):
+                    return arg
                 arg = add_schema(arg)
                 try:
-                    sup: JSON_TYPE = schema["properties"][arg_name]
                     validate_schema(arg, sup)
                 except SubschemaError as e:
                     sub_str: str = lale.pretty_print.json_to_string(e.sub)
@@ -2554,6 +2597,8 @@ class IndividualOp(Operator):
         else:
             raise ValueError(f"Unexpected method argument: {method}")
 
+        if dtypes_satisfy_schema(result, schema):
+            return result
         result = add_schema(result)
         try:
             validate_schema(result, schema)
@@ -2849,6 +2894,62 @@ class TrainableIndividualOp(PlannedIndividualOp, TrainableOperator):
         # the trainableshould be used as the trained impl as well
         if trained_impl is None:
             trained_impl = trainable_impl
+        result = self._to_trained(trained_impl)
+        # logger.info("%s exit  fit %s", time.asctime(), self.name())
+        return result
+
+    def _has_fused_fit_transform(self) -> bool:
+        """Whether _fit_transform can train and transform in one call to
+        the impl.  Already trained operators keep the separate calls,
+        since their fit may be a no-op or update the impl in place."""
+        if isinstance(self, TrainedIndividualOp) or not self.has_method("fit"):
+            return False
+        if self.has_method("transform_X_y"):
+            return self.has_method("fit_transform_X_y")
+        return self.is_transformer() and self.has_method("fit_transform")
+
+    def _fit_transform(
+        self, X: Any, y: Any = None, **fit_params
+    ) -> Tuple["TrainedIndividualOp", Any]:
+        """Train this transformer and transform the training data.
+
+        Uses the fused fit_transform (or fit_transform_X_y) of the impl
+        when it has one, saving a pass over the data, and falls back to
+        fit followed by transform (or transform_X_y) otherwise.
+
+        Returns
+        -------
+        result : Tuple[TrainedIndividualOp, Any]
+            The trained operator and its output, which is a tuple of
+            features and labels for operators with transform_X_y.
+        """
+        if not self._has_fused_fit_transform():
+            trained = self.fit(X, y, **fit_params)
+            if trained.has_method("transform_X_y"):
+                return trained, trained.transform_X_y(X, y)
+            return trained, trained.transform(X, y)
+        X = self._validate_input_schema("X", X, "fit")
+        y = self._validate_input_schema("y", y, "fit")
+        self._validate_hyperparam_data_constraints(X, y)
+        filtered_fit_params = _fixup_hyperparams_dict(fit_params)
+        if filtered_fit_params is None:
+            filtered_fit_params = {}
+        trainable_impl = self._clone_impl()
+        if self.has_method("transform_X_y"):
+            output_X, output_y = trainable_impl.fit_transform_X_y(
+                X, y, **filtered_fit_params
+            )
+            trained = self._to_trained(trainable_impl)
+            output = trained._validate_output_schema(
+                (output_X, output_y), "transform_X_y"
+            )
+        else:
+            raw_result = trainable_impl.fit_transform(X, y, **filtered_fit_params)
+            trained = self._to_trained(trainable_impl)
+            output = trained._validate_output_schema(raw_result, "transform")
+        return trained, output
+
+    def _to_trained(self, trained_impl) -> "TrainedIndividualOp":
         hps = self._trained_hyperparams(trained_impl)
         frozen: Optional[List[str]] = list(hps.keys()) if hps is not None else None
         if hps is None:
@@ -2863,7 +2964,6 @@ class TrainableIndividualOp(PlannedIndividualOp, TrainableOperator):
         )
         if not isinstance(self, TrainedIndividualOp):
             self._trained = result
-        # logger.info("%s exit  fit %s", time.asctime(), self.name())
         return result
 
     def partial_fit(self, X: Any, y: Any = None, **fit_params) -> "TrainedIndividualOp":
@@ -3545,7 +3645,11 @@ def get_op_from_lale_lib(impl_class, wrapper_modules=None) -> Optional[Individua
                 result = getattr(module, impl_class.__name__)
             except (ModuleNotFoundError, AttributeError):
                 if wrapper_modules is not None:
+                    from lale.lib._catalog import may_define
+
                     for wrapper_module in wrapper_modules:
+                        if not may_define(wrapper_module, impl_class.__name__):
+                            continue
                         try:
                             module = importlib.import_module(wrapper_module)
                             result = getattr(module, impl_class.__name__)
@@ -3642,6 +3746,9 @@ def get_available_operators(
         tags_set = {tag for prefix in tags_dict for tag in tags_dict[prefix]}
         return tags.issubset(tags_set)
 
+    from lale.lib._catalog import load_operators_with_tags
+
+    load_operators_with_tags(tags)
     return [op for op in _all_available_operators if filter_by_tags(op)]
 
 
@@ -3668,6 +3775,8 @@ class BasePipeline(Operator, Generic[OpType_co]):
     _steps: List[OpType_co]
     _preds: Dict[OpType_co, List[OpType_co]]
     _cached_preds: Optional[Dict[int, List[int]]]
+    _cached_inference_plans: Optional[Dict[str, Optional["_InferencePlan"]]]
+    _cached_sink_input_pipeline: Optional["TrainedPipeline"]
     _name: str
 
     def _steps_to_indices(self) -> Dict[OpType_co, int]:
@@ -3971,6 +4080,8 @@ class BasePipeline(Operator, Generic[OpType_co]):
             self._preds = {
                 m.get(k, k): [m.get(s, s) for s in v] for k, v in self._preds.items()
             }
+            self._cached_inference_plans = None
+            self._cached_sink_input_pipeline = None
 
     def __sort_topologically(self) -> None:
         class state(enumeration.Enum):
@@ -4098,11 +4209,15 @@ class BasePipeline(Operator, Generic[OpType_co]):
             old_clf = modified_pipeline._steps[-1]
             modified_pipeline._steps.remove(old_clf)
             del modified_pipeline._preds[old_clf]
+            modified_pipeline._cached_inference_plans = None
+            modified_pipeline._cached_sink_input_pipeline = None
             return modified_pipeline
         else:
             old_clf = self._steps[-1]
             self._steps.remove(old_clf)
             del self._preds[old_clf]
+            self._cached_inference_plans = None
+            self._cached_sink_input_pipeline = None
             return self
 
     def get_last(self) -> Optional[OpType_co]:
@@ -4295,6 +4410,314 @@ TrainableOpType_co = TypeVar(
 )
 
 
+def _schedule_steps(
+    steps: List[Any],
+    preds: Mapping[Any, List[Any]],
+    prepare: Callable[[Any], Tuple[Callable[..., Any], Tuple[Any, ...]]],
+    finish: Callable[[Any, Any], None],
+    n_jobs: Optional[int] = None,
+    prefer: prefer_type = "threads",
+) -> None:
+    """Run one task per pipeline step, respecting the edges of the DAG.
+
+    For each step, `prepare` returns a function and its arguments, and
+    `finish` receives the step and the result of calling that function.
+    Both are always called on the calling thread, in an order where all
+    predecessors of a step are finished before the step is prepared.
+    With more than one worker, every step whose predecessors are
+    finished runs concurrently on a thread or process pool, so the
+    function must be picklable when prefer is "processes"."""
+    workers = effective_n_jobs(n_jobs)
+    if workers == 1 or len(steps) <= 1:
+        for step in steps:
+            fn, args = prepare(step)
+            finish(step, fn(*args))
+        return
+    remaining = {step: len(preds[step]) for step in steps}
+    succs: Dict[Any, List[Any]] = {step: [] for step in steps}
+    for step in steps:
+        for pred in preds[step]:
+            succs[pred].append(step)
+    executor: concurrent.futures.Executor
+    if prefer == "processes":
+        executor = concurrent.futures.ProcessPoolExecutor(max_workers=workers)
+    elif prefer == "threads":
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=workers)
+    else:
+        raise ValueError(f"prefer must be 'threads' or 'processes', got {prefer}")
+    with executor:
+        pending: Dict[concurrent.futures.Future, Any] = {}
+
+        def submit(step):
+            fn, args = prepare(step)
+            pending[executor.submit(fn, *args)] = step
+
+        for step in steps:
+            if remaining[step] == 0:
+                submit(step)
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for future in done:
+                step = pending.pop(future)
+                try:
+                    result = future.result()
+                except BaseException:
+                    for other in pending:
+                        other.cancel()
+                    raise
+                finish(step, result)
+                for succ in succs[step]:
+                    remaining[succ] -= 1
+                    if remaining[succ] == 0:
+                        submit(succ)
+
+
+def _count_consumers(
+    steps: List[Any], preds: Mapping[Any, List[Any]]
+) -> Dict[Any, int]:
+    """Number of successors that still have to read the output of each step."""
+    result = {step: 0 for step in steps}
+    for step in steps:
+        for pred in preds[step]:
+            result[pred] += 1
+    return result
+
+
+def _release_consumed(preds, consumers, *step_outputs: Dict[Any, Any]) -> None:
+    """Drop the outputs of the given predecessors once their last consumer
+    has read them, so that peak memory is bounded by the live frontier of
+    the pipeline instead of by all intermediate results."""
+    for pred in preds:
+        consumers[pred] -= 1
+        if consumers[pred] == 0:
+            for step_output in step_outputs:
+                step_output.pop(pred, None)
+
+
+def _merge_meta_data(preds, meta_outputs) -> Dict[str, Any]:
+    # Note that if multiple previous steps generate the same key, it will retain only one of those.
+    return {
+        key: meta_outputs[pred][key]
+        for pred in preds
+        if meta_outputs[pred] is not None
+        for key in meta_outputs[pred]
+    }
+
+
+def _fit_pipeline_step(
+    trainable: TrainableIndividualOp,
+    input_X: Any,
+    input_y: Any,
+    meta_data_inputs: Dict[str, Any],
+    needs_output: bool,
+) -> Tuple[TrainedIndividualOp, Any, Dict[str, Any]]:
+    """Train one step of a pipeline and, unless it is a sink, compute
+    its output for the successor steps.  This is a module-level function
+    so that it can be shipped to a process pool."""
+    if trainable.has_method("set_meta_data"):
+        trainable._impl_instance().set_meta_data(meta_data_inputs)
+    meta_output: Dict[str, Any] = {}
+    trained: TrainedIndividualOp
+    output = None
+    if needs_output and trainable._has_fused_fit_transform():
+        # train and transform in one pass over the data, like sklearn's Pipeline
+        if trainable.has_method("transform_X_y"):
+            trained, output = trainable._fit_transform(input_X, input_y)
+        else:
+            fit_y = input_y if trainable.is_supervised() else None
+            trained, output_X = trainable._fit_transform(input_X, fit_y)
+            output = output_X, input_y
+    elif trainable.is_supervised():
+        trained = trainable.fit(input_X, input_y)
+    else:
+        trained = trainable.fit(input_X)
+    if needs_output:
+        if trained.is_transformer():
+            if output is None:
+                if trained.has_method("transform_X_y"):
+                    output = trained.transform_X_y(input_X, input_y)
+                else:
+                    output = trained.transform(input_X), input_y
+            if trained.has_method("get_transform_meta_output"):
+                meta_output = trained._impl_instance().get_transform_meta_output()
+        else:
+            # This is ok because trainable pipelines steps
+            # must only be individual operators
+            if trained.has_method("predict_proba"):  # type: ignore
+                output = trained.predict_proba(input_X), input_y
+            elif trained.has_method("decision_function"):  # type: ignore
+                output = trained.decision_function(input_X), input_y
+            else:
+                output = trained._predict(input_X), input_y
+            if trained.has_method("get_predict_meta_output"):
+                meta_output = trained._impl_instance().get_predict_meta_output()
+    return trained, output, meta_output
+
+
+def _predict_pipeline_step(
+    operator: TrainedIndividualOp,
+    input_X: Any,
+    input_y: Any,
+    meta_data_inputs: Dict[str, Any],
+    is_sink: bool,
+    impl_method_name: str,
+    operator_method_name: str,
+    kwargs: Dict[str, Any],
+) -> Tuple[Any, Dict[str, Any]]:
+    """Run one step of a trained pipeline, calling the requested method
+    on sinks and the transform-like method on all other steps."""
+    if operator.has_method("set_meta_data"):
+        operator._impl_instance().set_meta_data(meta_data_inputs)
+    meta_output: Dict[str, Any] = {}
+    if is_sink:
+        if operator.has_method(
+            impl_method_name
+        ):  # Since this is pipeline's predict, we should invoke predict from sink nodes
+            method_to_call_on_operator = getattr(operator, operator_method_name)
+            if operator_method_name == "score":
+                output = (
+                    method_to_call_on_operator(input_X, input_y, **kwargs),
+                    input_y,
+                )
+            elif operator_method_name == "transform_X_y":
+                output = method_to_call_on_operator(input_X, input_y, **kwargs)
+            else:
+                output = method_to_call_on_operator(input_X, **kwargs), input_y
+        else:
+            raise AttributeError(
+                f"The sink node {type(operator.impl)} of the pipeline does not support {operator_method_name}"
+            )
+    elif operator.is_transformer():
+        if operator.has_method("transform_X_y"):
+            output = operator.transform_X_y(input_X, input_y)
+        else:
+            output = operator.transform(input_X), input_y
+        if hasattr(operator._impl, "get_transform_meta_output"):
+            meta_output = operator._impl_instance().get_transform_meta_output()
+    elif operator.has_method(
+        "predict_proba"
+    ):  # For estimator as a transformer, use predict_proba if available
+        output = operator.predict_proba(input_X), input_y
+    elif operator.has_method(
+        "decision_function"
+    ):  # For estimator as a transformer, use decision_function if available
+        output = operator.decision_function(input_X), input_y
+    else:
+        output = operator._predict(input_X), input_y
+        if operator.has_method("get_predict_meta_output"):
+            meta_output = operator._impl_instance().get_predict_meta_output()
+    return output, meta_output
+
+
+# (operator, impl method, calling convention, predecessor indices, indices to release)
+_PlanEntry = Tuple[TrainedIndividualOp, str, str, List[int], List[int]]
+
+
+class _InferencePlan:
+    """Precomputed schedule for running a trained pipeline with one method.
+
+    Building the plan resolves everything that does not depend on the
+    data: the topological order, which implementation method each step
+    calls and how, the wiring of predecessor outputs, and when each
+    output can be released.  Running it then only calls the underlying
+    implementations.  It skips data schema validation and metadata
+    propagation, so it must only be used when validation is disabled,
+    and it is not built for pipelines whose steps exchange metadata."""
+
+    def __init__(self, entries: List[_PlanEntry], returns_y: bool):
+        self._entries = entries
+        self._returns_y = returns_y
+
+    @classmethod
+    def build(
+        cls,
+        pipeline: "TrainedPipeline",
+        impl_method_name: str,
+        operator_method_name: str,
+    ) -> Optional["_InferencePlan"]:
+        steps = pipeline.steps_list()
+        indices = {step: i for i, step in enumerate(steps)}
+        sink_nodes = pipeline._find_sink_nodes()
+        last_consumer: Dict[int, int] = {}
+        for i, step in enumerate(steps):
+            for pred in pipeline._preds[step]:
+                last_consumer[indices[pred]] = i
+        entries: List[_PlanEntry] = []
+        for i, operator in enumerate(steps):
+            if (
+                operator.has_method("set_meta_data")
+                or operator.has_method("get_transform_meta_output")
+                or operator.has_method("get_predict_meta_output")
+            ):
+                return None
+            operator._impl_instance()
+            if operator in sink_nodes:
+                if not operator.has_method(impl_method_name):
+                    raise AttributeError(
+                        f"The sink node {type(operator.impl)} of the pipeline does not support {operator_method_name}"
+                    )
+                if operator_method_name == "score":
+                    method, kind = "score", "X_y"
+                elif operator_method_name == "transform_X_y":
+                    method, kind = "transform_X_y", "X_y_to_X_y"
+                elif operator_method_name == "_predict":
+                    method, kind = "predict", "X"
+                elif operator_method_name == "transform":
+                    method, kind = "transform", cls._transform_kind(operator)
+                else:
+                    method, kind = operator_method_name, "X"
+            elif operator.is_transformer():
+                if operator.has_method("transform_X_y"):
+                    method, kind = "transform_X_y", "X_y_to_X_y"
+                else:
+                    method, kind = "transform", cls._transform_kind(operator)
+            elif operator.has_method("predict_proba"):
+                method, kind = "predict_proba", "X"
+            elif operator.has_method("decision_function"):
+                method, kind = "decision_function", "X"
+            else:
+                method, kind = "predict", "X"
+            preds = [indices[pred] for pred in pipeline._preds[operator]]
+            releases = [p for p in preds if last_consumer[p] == i]
+            entries.append((operator, method, kind, preds, releases))
+        return cls(entries, operator_method_name == "transform_X_y")
+
+    @staticmethod
+    def _transform_kind(operator: TrainedIndividualOp) -> str:
+        required = operator.input_schema_transform().get("required", [])
+        if "y" in [required_property.lower() for required_property in required]:
+            return "X_y"
+        return "X"
+
+    def __call__(self, X: Any, y: Any, kwargs: Dict[str, Any]) -> Any:
+        outputs: List[Any] = [None] * len(self._entries)
+        last = len(self._entries) - 1
+        for i, (operator, method, kind, preds, releases) in enumerate(self._entries):
+            if len(preds) == 0:
+                input_X, input_y = X, y
+            elif len(preds) == 1:
+                input_X, input_y = outputs[preds[0]]
+            else:
+                input_X = [outputs[pred][0] for pred in preds]
+                input_y = outputs[preds[0]][1]
+            for pred in releases:
+                outputs[pred] = None
+            impl_method = getattr(operator._impl, method)
+            extra = kwargs if i == last else {}
+            if kind == "X":
+                outputs[i] = impl_method(input_X, **extra), input_y
+            elif kind == "X_y":
+                outputs[i] = impl_method(input_X, input_y, **extra), input_y
+            else:
+                outputs[i] = impl_method(input_X, input_y, **extra)
+        result_X, result_y = outputs[last]
+        if self._returns_y:
+            return result_X, result_y
+        return result_X
+
+
 class TrainablePipeline(PlannedPipeline[TrainableOpType_co], TrainableOperator):
     def __init__(
         self,
@@ -4314,92 +4737,102 @@ class TrainablePipeline(PlannedPipeline[TrainableOpType_co], TrainableOperator):
         return pipe
 
     def fit(
-        self, X: Any, y: Any = None, **fit_params
+        self,
+        X: Any,
+        y: Any = None,
+        n_jobs: Optional[int] = None,
+        prefer: prefer_type = "threads",
+        **fit_params,
     ) -> "TrainedPipeline[TrainedIndividualOp]":
+        """Train the learnable coefficients of all steps of this pipeline.
+
+        Parameters
+        ----------
+        X:
+            Features that conform to the X property of input_schema_fit.
+        y: optional
+            Labels that conform to the y property of input_schema_fit.
+            Default is None.
+        n_jobs: optional
+            Number of steps to train concurrently. Steps whose
+            predecessors have all been trained run in parallel, so
+            independent branches of the pipeline overlap.
+            None or 1 trains steps one at a time in topological order,
+            -1 uses all processors.
+            Default is None.
+        prefer: "threads" or "processes", optional
+            Whether concurrent steps run on a thread pool or on a
+            process pool. Threads avoid copying the data and work well
+            for implementations that release the GIL; processes
+            require steps and data to be picklable.
+            Default is "threads".
+        fit_params: Dictionary, optional
+            A dictionary of keyword parameters to be used during training.
+
+        Returns
+        -------
+        TrainedPipeline
+            A new copy of this pipeline whose steps are all trained.
+        """
         # filtered_fit_params = _fixup_hyperparams_dict(fit_params)
         X = add_schema(X)
         y = add_schema(y)
         self.validate_schema(X, y)
-        trained_steps: List[TrainedIndividualOp] = []
         outputs: Dict[Operator, Tuple[Any, Any]] = {}
         meta_outputs: Dict[Operator, Any] = {}
         edges: List[Tuple[TrainableOpType_co, TrainableOpType_co]] = self.edges()
         trained_map: Dict[TrainableOpType_co, TrainedIndividualOp] = {}
 
         sink_nodes = self._find_sink_nodes()
-        for operator in self._steps:
+        consumers = _count_consumers(self._steps, self._preds)
+        meta_inputs: Dict[Operator, Dict[str, Any]] = {}
+
+        def prepare(operator):
             preds = self._preds[operator]
             if len(preds) == 0:
                 inputs = [(X, y)]
-                meta_data_inputs: Dict[Operator, Any] = {}
+                meta_data_inputs: Dict[str, Any] = {}
             else:
                 inputs = [outputs[pred] for pred in preds]
                 # we create meta_data_inputs as a dictionary with metadata from all previous steps
-                # Note that if multiple previous steps generate the same key, it will retain only one of those.
-
-                meta_data_inputs = {
-                    key: meta_outputs[pred][key]
-                    for pred in preds
-                    if meta_outputs[pred] is not None
-                    for key in meta_outputs[pred]
-                }
-            trainable = operator
+                meta_data_inputs = _merge_meta_data(preds, meta_outputs)
+                _release_consumed(preds, consumers, outputs, meta_outputs)
+            meta_inputs[operator] = meta_data_inputs
             assert isinstance(inputs, list) and len(inputs) >= 1
             if len(inputs) == 1:
                 input_X, input_y = inputs[0]
             else:
                 input_X = [iX for iX, _ in inputs]
                 input_y = next(iy for _, iy in inputs)
-            if operator.has_method("set_meta_data"):
-                operator._impl_instance().set_meta_data(meta_data_inputs)
-            meta_output: Dict[Operator, Any] = {}
-            trained: TrainedOperator
-            if trainable.is_supervised():
-                trained = trainable.fit(input_X, input_y)
-            else:
-                trained = trainable.fit(input_X)
+            # There is no need to transform/predict on the last node during fit
+            needs_output = operator not in sink_nodes
+            args = (operator, input_X, input_y, meta_data_inputs, needs_output)
+            return _fit_pipeline_step, args
+
+        def finish(operator, result):
+            trained, output, meta_output = result
+            if not isinstance(operator, TrainedIndividualOp):
+                # a process pool trains a copy, so record the result here as well
+                operator._trained = trained
             trained_map[operator] = trained
-            trained_steps.append(trained)
-            if (
-                trainable not in sink_nodes
-            ):  # There is no need to transform/predict on the last node during fit
-                if trained.is_transformer():
-                    if trained.has_method("transform_X_y"):
-                        output = trained.transform_X_y(input_X, input_y)
-                    else:
-                        output = trained.transform(input_X), input_y
-                    if trained.has_method("get_transform_meta_output"):
-                        meta_output = (
-                            trained._impl_instance().get_transform_meta_output()
-                        )
-                else:
-                    # This is ok because trainable pipelines steps
-                    # must only be individual operators
-                    if trained.has_method("predict_proba"):  # type: ignore
-                        output = trained.predict_proba(input_X), input_y
-                    elif trained.has_method("decision_function"):  # type: ignore
-                        output = trained.decision_function(input_X), input_y
-                    else:
-                        output = trained._predict(input_X), input_y
-                    if trained.has_method("get_predict_meta_output"):
-                        meta_output = trained._impl_instance().get_predict_meta_output()
+            meta_output_so_far = dict(meta_inputs.pop(operator))
+            if operator not in sink_nodes:
                 outputs[operator] = output
-                meta_output_so_far = {
-                    key: meta_outputs[pred][key]
-                    for pred in preds
-                    if meta_outputs[pred] is not None
-                    for key in meta_outputs[pred]
-                }
                 meta_output_so_far.update(
                     meta_output
                 )  # So newest gets preference in case of collisions
                 meta_outputs[operator] = meta_output_so_far
 
+        _schedule_steps(self._steps, self._preds, prepare, finish, n_jobs, prefer)
+
+        trained_steps = [trained_map[operator] for operator in self._steps]
         trained_edges = [(trained_map[a], trained_map[b]) for a, b in edges]
 
         result: TrainedPipeline[TrainedIndividualOp] = TrainedPipeline(
             trained_steps, trained_edges, ordered=True, _lale_trained=True
         )
+        if isinstance(X, pd.DataFrame):
+            result._fit_columns = tuple(X.columns)
         self._trained = result
         return result
 
@@ -4677,36 +5110,265 @@ class TrainedPipeline(TrainablePipeline[TrainedOpType_co], TrainedOperator):
         assert isinstance(pipe, TrainedPipeline)
         return pipe
 
-    def _predict(self, X: Any, y: Any = None, **predict_params):
+    def _predict(
+        self, X: Any, y: Any = None, n_jobs: Optional[int] = None, **predict_params
+    ):
         return self._predict_based_on_type(
-            "predict", "_predict", X, y, **predict_params
+            "predict", "_predict", X, y, n_jobs=n_jobs, **predict_params
         )
 
-    def predict(self, X, **predict_params) -> Any:
-        result = self._predict(X, **predict_params)
+    def predict(self, X, n_jobs: Optional[int] = None, **predict_params) -> Any:
+        """Make predictions.
+
+        Parameters
+        ----------
+        X :
+            Features; see input_predict schema of the first steps.
+        n_jobs: optional
+            Number of steps to run concurrently on a thread pool.
+            Steps whose predecessors are done run in parallel, so the
+            latency of a pipeline with independent branches approaches
+            that of its longest branch. None or 1 runs steps one at a
+            time, -1 uses all processors.
+            Default is None.
+        predict_params:
+            Additional parameters that should be passed to the predict method
+            of the final estimator.
+
+        Returns
+        -------
+        result :
+            Predictions; see output_predict schema of the final estimator.
+        """
+        result = self._predict(X, n_jobs=n_jobs, **predict_params)
         if isinstance(result, NDArrayWithSchema):
             return strip_schema(result)  # otherwise scorers return zero-dim array
         return result
 
+    def _fitted_columns(self) -> Optional[Tuple[Any, ...]]:
+        """The columns of the data frame the pipeline was trained on, if known."""
+        result = getattr(self, "_fit_columns", None)
+        if result is None:
+            names = set()
+            for step in self._find_source_nodes():
+                impl = step.impl if isinstance(step, IndividualOp) else None
+                model = getattr(impl, "_wrapped_model", impl)
+                step_names = getattr(model, "feature_names_in_", None)
+                if step_names is None:
+                    return None
+                names.add(tuple(step_names))
+            if len(names) == 1:
+                result = names.pop()
+        return result
+
+    def _records_to_dataframe(
+        self,
+        records: List[Dict[str, Any]],
+        layout: Tuple[Any, ...],
+        strict: bool,
+    ) -> pd.DataFrame:
+        try:
+            data = {c: [r[c] for r in records] for c in layout}
+        except KeyError as exc:
+            raise ValueError(
+                f"record is missing column {exc.args[0]!r}, expected columns {list(layout)}"
+            ) from exc
+        if strict and any(len(r) != len(layout) for r in records):
+            expected = set(layout)
+            unexpected = sorted(
+                {str(k) for r in records for k in r if k not in expected}
+            )
+            raise ValueError(
+                f"record has unexpected columns {unexpected}, expected columns {list(layout)}"
+            )
+        return pd.DataFrame(data)
+
+    def predict_records(
+        self,
+        records: Union[Dict[str, Any], List[Dict[str, Any]]],
+        columns: Optional[List[str]] = None,
+        **predict_params,
+    ) -> Any:
+        """Make predictions for a few records with low per-call overhead.
+
+        Intended for real-time scoring of one or a handful of rows.
+        The column layout is taken from the columns argument, from the
+        columns the pipeline was trained on, or else from the keys of
+        the first record, and reused on later calls once a prediction
+        with it succeeded, so records are turned into a dataframe
+        without inspecting them. Records must have exactly the columns
+        of the layout, unless the columns argument selects them.
+        With data schema validation disabled (the default), the
+        prediction runs on the cached inference plan of the pipeline.
+
+        Parameters
+        ----------
+        records :
+            A dictionary mapping column names to values, or a list of them.
+        columns: optional
+            Column names in the order expected by the first step; other
+            keys of the records are ignored. Replaces the cached column
+            layout if the prediction succeeds.
+            Default is None.
+        predict_params:
+            Additional parameters that should be passed to the predict method
+            of the final estimator.
+
+        Returns
+        -------
+        result :
+            One prediction per record; see output_predict schema of the final estimator.
+        """
+        if isinstance(records, dict):
+            records = [records]
+        if columns is not None:
+            layout = tuple(columns)
+        else:
+            layout = getattr(self, "_record_columns", None)
+            if layout is None:
+                layout = self._fitted_columns()
+            if layout is None:
+                if len(records) == 0:
+                    raise ValueError(
+                        "predict_records needs either columns or at least one record"
+                    )
+                layout = tuple(records[0].keys())
+        X = self._records_to_dataframe(records, layout, strict=columns is None)
+        result = self.predict(X, **predict_params)
+        self._record_columns = layout
+        return result
+
+    def predict_one(self, record: Dict[str, Any], **predict_params) -> Any:
+        """Make a prediction for a single record.
+
+        Parameters
+        ----------
+        record :
+            A dictionary mapping column names to values; see predict_records.
+        predict_params:
+            Additional parameters that should be passed to the predict method
+            of the final estimator.
+
+        Returns
+        -------
+        result :
+            The prediction for the record.
+        """
+        return self.predict_records(record, **predict_params)[0]
+
+    def _sink_input_pipeline(self) -> Optional["TrainedPipeline"]:
+        """The pipeline with its sink replaced by a NoOp, whose transform
+        returns what the sink would receive (a list for several preds)."""
+        result = getattr(self, "_cached_sink_input_pipeline", None)
+        if result is None:
+            sink_nodes = self._find_sink_nodes()
+            if len(sink_nodes) != 1 or len(self._steps) < 2:
+                return None
+            from lale.lib.lale.no_op import NoOp
+
+            sink = sink_nodes[0]
+            no_op = NoOp()
+            steps = [no_op if s is sink else s for s in self._steps]
+            edges = [
+                (pred, no_op if s is sink else s)
+                for s in self._steps
+                for pred in self._preds[s]
+            ]
+            result = TrainedPipeline(steps, edges, ordered=True, _lale_trained=True)
+            self._cached_sink_input_pipeline = result
+        return result
+
+    def predict_many(
+        self,
+        X: Any,
+        methods: Optional[List[str]] = None,
+        n_jobs: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """Apply several methods of the final estimator while running the
+        preceding steps only once.
+
+        Parameters
+        ----------
+        X :
+            Features; see input schemas of the first steps.
+        methods: optional
+            Names of methods of the final estimator, for instance
+            "predict", "predict_proba", or "decision_function".
+            Default is ["predict", "predict_proba"].
+        n_jobs: optional
+            Number of steps to run concurrently; see `predict`.
+            Default is None.
+
+        Returns
+        -------
+        result : Dict[str, Any]
+            Output of each method, keyed by method name.
+        """
+        if methods is None:
+            methods = ["predict", "predict_proba"]
+        sink = self.get_last()
+        for method in methods:
+            if sink is None or not sink.has_method(method):
+                raise AttributeError(
+                    f"The sink node of the pipeline does not support {method}"
+                )
+        prefix = self._sink_input_pipeline()
+        if prefix is None:  # single-step pipeline, nothing to share
+            return {m: getattr(self, m)(X, n_jobs=n_jobs) for m in methods}
+        sink_input = prefix.transform(X, n_jobs=n_jobs)
+        return {m: getattr(sink, m)(sink_input) for m in methods}
+
     @available_if(_final_impl_has("transform"))
-    def transform(self, X: Any, y: Any = None) -> Any:
+    def transform(self, X: Any, y: Any = None, n_jobs: Optional[int] = None) -> Any:
         # TODO: What does a transform on a pipeline mean, if the last step is not a transformer
         # can it be just the output of predict of the last step?
         # If this implementation changes, check to make sure that the implementation of
         # self.is_transformer is kept in sync with the new assumptions.
-        return self._predict_based_on_type("transform", "transform", X, y)
+        return self._predict_based_on_type(
+            "transform", "transform", X, y, n_jobs=n_jobs
+        )
 
     @available_if(_final_impl_has("transform_X_y"))
-    def transform_X_y(self, X: Any, y: Any = None) -> Any:
-        return self._predict_based_on_type("transform_X_y", "transform_X_y", X, y)
+    def transform_X_y(self, X: Any, y: Any = None, n_jobs: Optional[int] = None) -> Any:
+        return self._predict_based_on_type(
+            "transform_X_y", "transform_X_y", X, y, n_jobs=n_jobs
+        )
+
+    def _inference_plan(
+        self, impl_method_name: str, operator_method_name: str
+    ) -> Optional[_InferencePlan]:
+        plans = getattr(self, "_cached_inference_plans", None)
+        if plans is None:
+            plans = {}
+            self._cached_inference_plans = plans
+        if operator_method_name not in plans:
+            plans[operator_method_name] = _InferencePlan.build(
+                self, impl_method_name, operator_method_name
+            )
+        return plans[operator_method_name]
 
     def _predict_based_on_type(
-        self, impl_method_name, operator_method_name, X=None, y=None, **kwargs
+        self,
+        impl_method_name,
+        operator_method_name,
+        X=None,
+        y=None,
+        n_jobs: Optional[int] = None,
+        **kwargs,
     ):
+        from lale.settings import disable_data_schema_validation
+
+        if disable_data_schema_validation and effective_n_jobs(n_jobs) == 1:
+            plan = self._inference_plan(impl_method_name, operator_method_name)
+            if plan is not None:
+                return plan(X, y, kwargs)
         outputs = {}
         meta_outputs = {}
         sink_nodes = self._find_sink_nodes()
-        for operator in self._steps:
+        consumers = _count_consumers(self._steps, self._preds)
+        meta_inputs: Dict[Operator, Dict[str, Any]] = {}
+
+        def prepare(operator):
             preds = self._preds[operator]
             if len(preds) == 0:
                 inputs = [(X, y)]
@@ -4714,107 +5376,83 @@ class TrainedPipeline(TrainablePipeline[TrainedOpType_co], TrainedOperator):
             else:
                 inputs = [outputs[pred] for pred in preds]
                 # we create meta_data_inputs as a dictionary with metadata from all previous steps
-                # Note that if multiple previous steps generate the same key, it will retain only one of those.
-
-                meta_data_inputs = {
-                    key: meta_outputs[pred][key]
-                    for pred in preds
-                    if meta_outputs[pred] is not None
-                    for key in meta_outputs[pred]
-                }
+                meta_data_inputs = _merge_meta_data(preds, meta_outputs)
+                _release_consumed(preds, consumers, outputs, meta_outputs)
+            meta_inputs[operator] = meta_data_inputs
             assert isinstance(inputs, list) and len(inputs) >= 1
             if len(inputs) == 1:
                 input_X, input_y = inputs[0]
             else:
                 input_X = [iX for iX, _ in inputs]
                 input_y = next(iy for _, iy in inputs)
-            if operator.has_method("set_meta_data"):
-                operator._impl_instance().set_meta_data(meta_data_inputs)
-            meta_output = {}
-            if operator in sink_nodes:
-                if operator.has_method(
-                    impl_method_name
-                ):  # Since this is pipeline's predict, we should invoke predict from sink nodes
-                    method_to_call_on_operator = getattr(operator, operator_method_name)
-                    if operator_method_name == "score":
-                        output = (
-                            method_to_call_on_operator(input_X, input_y, **kwargs),
-                            input_y,
-                        )
-                    elif operator_method_name == "transform_X_y":
-                        output = method_to_call_on_operator(input_X, input_y, **kwargs)
-                    else:
-                        output = method_to_call_on_operator(input_X, **kwargs), input_y
-                else:
-                    raise AttributeError(
-                        f"The sink node {type(operator.impl)} of the pipeline does not support {operator_method_name}"
-                    )
-            elif operator.is_transformer():
-                if operator.has_method("transform_X_y"):
-                    output = operator.transform_X_y(input_X, input_y)
-                else:
-                    output = operator.transform(input_X), input_y
-                if hasattr(operator._impl, "get_transform_meta_output"):
-                    meta_output = operator._impl_instance().get_transform_meta_output()
-            elif operator.has_method(
-                "predict_proba"
-            ):  # For estimator as a transformer, use predict_proba if available
-                output = operator.predict_proba(input_X), input_y
-            elif operator.has_method(
-                "decision_function"
-            ):  # For estimator as a transformer, use decision_function if available
-                output = operator.decision_function(input_X), input_y
-            else:
-                output = operator._predict(input_X), input_y
-                if operator.has_method("get_predict_meta_output"):
-                    meta_output = operator._impl_instance().get_predict_meta_output()
+            args = (
+                operator,
+                input_X,
+                input_y,
+                meta_data_inputs,
+                operator in sink_nodes,
+                impl_method_name,
+                operator_method_name,
+                kwargs,
+            )
+            return _predict_pipeline_step, args
+
+        def finish(operator, result):
+            output, meta_output = result
             outputs[operator] = output
-            meta_output_so_far = {
-                key: meta_outputs[pred][key]
-                for pred in preds
-                if meta_outputs[pred] is not None
-                for key in meta_outputs[pred]
-            }
+            meta_output_so_far = dict(meta_inputs.pop(operator))
             meta_output_so_far.update(
                 meta_output
             )  # So newest gets preference in case of collisions
             meta_outputs[operator] = meta_output_so_far
+
+        # Inference always uses threads, since shipping the data and the
+        # trained steps to other processes would cost more than it saves.
+        _schedule_steps(self._steps, self._preds, prepare, finish, n_jobs, "threads")
         result_X, result_y = outputs[self._steps[-1]]
         if operator_method_name == "transform_X_y":
             return result_X, result_y
         return result_X
 
     @available_if(_final_impl_has("predict_proba"))
-    def predict_proba(self, X: Any):
+    def predict_proba(self, X: Any, n_jobs: Optional[int] = None):
         """Probability estimates for all classes.
 
         Parameters
         ----------
         X :
             Features; see input_predict_proba schema of the operator.
+        n_jobs: optional
+            Number of steps to run concurrently; see `predict`.
 
         Returns
         -------
         result :
             Probabilities; see output_predict_proba schema of the operator.
         """
-        return self._predict_based_on_type("predict_proba", "predict_proba", X)
+        return self._predict_based_on_type(
+            "predict_proba", "predict_proba", X, n_jobs=n_jobs
+        )
 
     @available_if(_final_impl_has("decision_function"))
-    def decision_function(self, X: Any):
+    def decision_function(self, X: Any, n_jobs: Optional[int] = None):
         """Confidence scores for all classes.
 
         Parameters
         ----------
         X :
             Features; see input_decision_function schema of the operator.
+        n_jobs: optional
+            Number of steps to run concurrently; see `predict`.
 
         Returns
         -------
         result :
             Confidences; see output_decision_function schema of the operator.
         """
-        return self._predict_based_on_type("decision_function", "decision_function", X)
+        return self._predict_based_on_type(
+            "decision_function", "decision_function", X, n_jobs=n_jobs
+        )
 
     @available_if(_final_impl_has("score"))
     def score(self, X: Any, y: Any, **score_params):
@@ -4837,165 +5475,192 @@ class TrainedPipeline(TrainablePipeline[TrainedOpType_co], TrainedOperator):
         return self._predict_based_on_type("score", "score", X, y)
 
     @available_if(_final_impl_has("score_samples"))
-    def score_samples(self, X: Any = None):
+    def score_samples(self, X: Any = None, n_jobs: Optional[int] = None):
         """Scores for each sample in X. There type of scores is based on the last operator in the pipeline.
 
         Parameters
         ----------
         X :
             Features.
+        n_jobs: optional
+            Number of steps to run concurrently; see `predict`.
 
         Returns
         -------
         result :
             Scores per sample.
         """
-        return self._predict_based_on_type("score_samples", "score_samples", X)
+        return self._predict_based_on_type(
+            "score_samples", "score_samples", X, n_jobs=n_jobs
+        )
 
     @available_if(_final_impl_has("predict_log_proba"))
-    def predict_log_proba(self, X: Any):
+    def predict_log_proba(self, X: Any, n_jobs: Optional[int] = None):
         """Predicted class log-probabilities for X.
 
         Parameters
         ----------
         X :
             Features.
+        n_jobs: optional
+            Number of steps to run concurrently; see `predict`.
 
         Returns
         -------
         result :
             Class log probabilities.
         """
-        return self._predict_based_on_type("predict_log_proba", "predict_log_proba", X)
+        return self._predict_based_on_type(
+            "predict_log_proba", "predict_log_proba", X, n_jobs=n_jobs
+        )
 
-    def transform_with_batches(self, X: Any, y: Any = None, serialize: bool = True):
-        """[summary]
+    def _transform_batch(self, batch_X: Any, batch_y: Any, sink_nodes) -> Any:
+        outputs: Dict[TrainedOpType_co, Any] = {}
+        consumers = _count_consumers(self._steps, self._preds)
+        inputs: Any
+        batch_output = None
+        for operator in self._steps:
+            preds = self._preds[operator]
+            if len(preds) == 0:
+                inputs = batch_X
+            else:
+                inputs = [
+                    (
+                        outputs[pred][0]
+                        if isinstance(outputs[pred], tuple)
+                        else outputs[pred]
+                    )
+                    for pred in preds
+                ]
+                _release_consumed(preds, consumers, outputs)
+            if len(inputs) == 1:
+                inputs = inputs[0]
+            trained = operator
+            if trained.is_transformer():
+                assert not trained.has_method("transform_X_y"), "TODO"
+                batch_output = trained.transform(inputs, batch_y)
+            else:
+                if trained in sink_nodes:
+                    batch_output = trained._predict(
+                        X=inputs
+                    )  # We don't support y for predict yet as there is no compelling case
+                else:
+                    # This is ok because trainable pipelines steps
+                    # must only be individual operators
+                    if trained.has_method("predict_proba"):  # type: ignore
+                        batch_output = trained.predict_proba(X=inputs)
+                    elif trained.has_method("decision_function"):  # type: ignore
+                        batch_output = trained.decision_function(X=inputs)
+                    else:
+                        batch_output = trained._predict(X=inputs)
+            outputs[operator] = batch_output
+        return outputs[sink_nodes[0]]
+
+    def transform_batches(self, X: Any) -> Iterator[Any]:
+        """Lazily transform a stream of batches, one batch at a time.
+
+        Only the current batch and its intermediate results are held in
+        memory, so arbitrarily large datasets can be scored in constant
+        memory by consuming the generator incrementally.
 
         Parameters
         ----------
-        X : Any
-            [description]
-        y : [type], optional
-            by default None
-        serialize: boolean
-            should data be serialized if needed
-        Returns
-        -------
-        [type]
-            [description]
+        X : Iterable
+            Batches, for instance a torch DataLoader. Each batch is
+            either the features or a tuple of features and labels.
+
+        Yields
+        ------
+        batch_output :
+            The output of the sink step for each batch, in order.
         """
-        outputs: Dict[TrainedOpType_co, tuple] = {}
-        serialization_out_dir: str = ""
-        if serialize:
-            serialization_out_dir = os.path.join(
-                os.path.dirname(__file__), "temp_serialized"
-            )
-            if not os.path.exists(serialization_out_dir):
-                os.mkdir(serialization_out_dir)
+        for _, batch_output in self._transform_batches_with_inputs(X):
+            yield batch_output
 
+    def _transform_batches_with_inputs(self, X: Any) -> Iterator[Tuple[Any, Any]]:
         sink_nodes = self._find_sink_nodes()
-        sink_node = sink_nodes[0]
-        operator_idx = 0
-        inputs: Any
-        output = None
-
         for batch_data in X:  # batching_transformer will output only one obj
             if isinstance(batch_data, tuple):
                 batch_X, batch_y = batch_data
             else:
                 batch_X = batch_data
                 batch_y = None
+            yield batch_X, self._transform_batch(batch_X, batch_y, sink_nodes)
 
-            for operator in self._steps:
-                preds = self._preds[operator]
-                if len(preds) == 0:
-                    inputs = batch_X
-                else:
-                    inputs = [
-                        (
-                            outputs[pred][0]
-                            if isinstance(outputs[pred], tuple)
-                            else outputs[pred]
-                        )
-                        for pred in preds
-                    ]
-                if len(inputs) == 1:
-                    inputs = inputs[0]
-                trained = operator
-                if trained.is_transformer():
-                    assert not trained.has_method("transform_X_y"), "TODO"
-                    batch_output = trained.transform(inputs, batch_y)
-                else:
-                    if trained in sink_nodes:
-                        batch_output = trained._predict(
-                            X=inputs
-                        )  # We don't support y for predict yet as there is no compelling case
-                    else:
-                        # This is ok because trainable pipelines steps
-                        # must only be individual operators
-                        if trained.has_method("predict_proba"):  # type: ignore
-                            batch_output = trained.predict_proba(X=inputs)
-                        elif trained.has_method("decision_function"):  # type: ignore
-                            batch_output = trained.decision_function(X=inputs)
-                        else:
-                            batch_output = trained._predict(X=inputs)
-                if trained == sink_node:
-                    if isinstance(batch_output, tuple):
-                        output = append_batch(
-                            output, (batch_output[0], batch_output[1])
-                        )
-                    else:
-                        output = append_batch(output, batch_output)
-                outputs[operator] = batch_output
-                operator_idx += 1
-
-            #     if serialize:
-            #         output = lale.helpers.write_batch_output_to_file(
-            #             output,
-            #             os.path.join(
-            #                 serialization_out_dir,
-            #                 "fit_with_batches" + str(operator_idx) + ".hdf5",
-            #             ),
-            #             len(inputs.dataset),
-            #             batch_idx,
-            #             batch_X,
-            #             batch_y,
-            #             batch_out_X,
-            #             batch_out_y,
-            #         )
-            #     else:
-            #         if batch_out_y is not None:
-            #             output = lale.helpers.append_batch(
-            #                 output, (batch_output, batch_out_y)
-            #             )
-            #         else:
-            #             output = lale.helpers.append_batch(output, batch_output)
-            # if serialize:
-            #     output.close()  # type: ignore
-            #     output = lale.helpers.create_data_loader(
-            #         os.path.join(
-            #             serialization_out_dir,
-            #             "fit_with_batches" + str(operator_idx) + ".hdf5",
-            #         ),
-            #         batch_size=inputs.batch_size,
-            #     )
-            # else:
-            #     if isinstance(output, tuple):
-            #         output = lale.helpers.create_data_loader(
-            #             X=output[0], y=output[1], batch_size=inputs.batch_size
-            #         )
-            #     else:
-            #         output = lale.helpers.create_data_loader(
-            #             X=output, y=None, batch_size=inputs.batch_size
-            #         )
-            # outputs[operator] = output
-            # operator_idx += 1
-
-        return_data = output  # outputs[self._steps[-1]]#.dataset.get_data()
-        # if serialize:
-        #     shutil.rmtree(serialization_out_dir)
-
-        return return_data
+    def transform_with_batches(
+        self,
+        X: Any,
+        y: Any = None,
+        serialize: bool = True,
+        output_file: Optional[str] = None,
+        n_rows: Optional[int] = None,
+    ):
+        """Transform a stream of batches and collect the outputs.
+
+        Parameters
+        ----------
+        X : Iterable
+            Batches, for instance a torch DataLoader; see transform_batches.
+        y : [type], optional
+            Ignored, the labels come with the batches. By default None
+        serialize: boolean
+            Ignored, kept for backward compatibility; use output_file.
+        output_file: str, optional
+            If given, the output of each batch is written into a file
+            preallocated for n_rows rows as soon as it is computed,
+            instead of being kept in memory. Paths ending in ".npy"
+            produce a numpy memmap, other paths an HDF5 file.
+        n_rows: int, optional
+            Number of input rows over all batches, needed with output_file
+            unless X has a dataset with a length (as a DataLoader does).
+
+        Returns
+        -------
+        result :
+            The concatenated outputs of all batches; with output_file, a
+            numpy memmap for ".npy" files (or a tuple of
+            memmaps for outputs and labels) and the path of the HDF5
+            file otherwise.
+        """
+        if output_file is None:
+            return concat_batches(list(self.transform_batches(X)))
+        if n_rows is None:
+            dataset = getattr(X, "dataset", None)
+            if dataset is None or not hasattr(dataset, "__len__"):
+                raise ValueError(
+                    "transform_with_batches needs n_rows to preallocate output_file"
+                )
+            n_rows = len(dataset)
+        file_obj = None
+        row_offset = 0
+        batches = self._transform_batches_with_inputs(X)
+        for batch_idx, (batch_X, batch_output) in enumerate(batches):
+            if isinstance(batch_output, tuple):
+                batch_out_X, batch_out_y = batch_output
+            else:
+                batch_out_X, batch_out_y = batch_output, None
+            file_obj = write_batch_output_to_file(
+                file_obj,
+                output_file,
+                n_rows,
+                batch_idx,
+                batch_X,
+                None,
+                batch_out_X,
+                batch_out_y,
+                row_offset=row_offset,
+            )
+            row_offset += len(batch_out_X)
+        if file_obj is None:
+            raise ValueError("transform_with_batches got no batches")
+        if isinstance(file_obj, dict):
+            for memmap in file_obj.values():
+                memmap.flush()
+            if "y" in file_obj:
+                return file_obj["X"], file_obj["y"]
+            return file_obj["X"]
+        file_obj.close()
+        return output_file
 
     def freeze_trainable(self) -> "TrainedPipeline":
         result = super().freeze_trainable()
@@ -5471,6 +6136,7 @@ def customize_schema(  # pylint: disable=differing-param-doc,differing-type-doc
         pass
     # TODO: why are we doing a deeopcopy here?
     op = copy.deepcopy(op)
+    op._schemas = thaw_schema(op._schemas)
     methods = ["fit", "transform", "predict", "predict_proba", "decision_function"]
     # explicitly enable the hyperparams schema check because it is important
     from lale.settings import (
@@ -5484,9 +6150,11 @@ def customize_schema(  # pylint: disable=differing-param-doc,differing-type-doc
     set_disable_hyperparams_schema_validation(False)
 
     if schemas is not None:
-        schemas.schema["$schema"] = "http://json-schema.org/draft-04/schema#"
-        validate_is_schema(schemas.schema)
-        op._schemas = schemas.schema
+        op._schemas = {
+            **schemas.schema,
+            "$schema": "http://json-schema.org/draft-04/schema#",
+        }
+        validate_is_schema(op._schemas)
     else:
         if relevantToOptimizer is not None:
             assert isinstance(relevantToOptimizer, list)
@@ -5534,6 +6202,7 @@ def customize_schema(  # pylint: disable=differing-param-doc,differing-type-doc
                 op._schemas["properties"]["hyperparams"]["allOf"][0]["properties"][
                     arg
                 ] = value
+    op._schemas = intern_schema(op._schemas)
     # since the schema has changed, we need to invalidate any
     # cached enum attributes
     op._invalidate_enum_attributes()
@@ -0,0 +1,186 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Fold-level pruning of unpromising trials.
+
+A pruner is consulted by lale.helpers.cross_val_score_track_trials
+after each fold except the last, with the mean score of the folds
+finished so far (greater is better). If it answers True, the remaining
+folds are skipped and TrialPruned is raised with the partial results.
+Trials that finish all folds are reported to the pruner, so that
+statistical pruners compare later trials with earlier ones, and their
+results are the same as without a pruner.
+
+.. code-block:: python
+
+    from lale.lib.lale import Hyperopt
+    from lale.pruners import MedianPruner
+
+    Hyperopt(estimator=planned, cv=5, pruner=MedianPruner())
+"""
+
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+class TrialPruned(Exception):
+    """Raised when a pruner stops a trial between folds.
+
+    Attributes
+    ----------
+    score : float
+        Mean score of the folds that were finished.
+
+    log_loss : float
+        Mean log loss of those folds, or NaN if it could not be computed.
+
+    time : float
+        Mean time in seconds of those folds.
+
+    n_folds : int
+        Number of folds that were finished."""
+
+    def __init__(self, score: float, log_loss: float, time: float, n_folds: int):
+        super().__init__(f"Trial pruned with mean score {score} after {n_folds} folds.")
+        self.score = score
+        self.log_loss = log_loss
+        self.time = time
+        self.n_folds = n_folds
+
+
+class AllTrialsPruned(ValueError):
+    """Raised by Hyperopt when every trial was pruned, so that none of
+    them finished and there is no best pipeline.
+
+    Attributes
+    ----------
+    summary : DataFrame or None
+        Summary of the pruned trials, as returned by summary() of the
+        optimizer, if any."""
+
+    def __init__(self, message: str, summary: Optional[Any] = None):
+        super().__init__(message)
+        self.summary = summary
+
+
+class Pruner:
+    """Base class of pruners, which never prunes."""
+
+    def should_prune(self, fold: int, score: float) -> bool:
+        """Whether to stop the trial after the given fold.
+
+        Parameters
+        ----------
+        fold : int
+            Index of the fold that was just finished, starting at 0.
+
+        score : float
+            Mean score of folds 0 to fold of the trial.
+
+        Returns
+        -------
+        bool
+            True to skip the remaining folds."""
+        return False
+
+    def report(self, scores: List[float]) -> None:
+        """Record a trial that finished all its folds.
+
+        Parameters
+        ----------
+        scores : list of float
+            Mean score of folds 0 to i of the trial, for each fold i."""
+
+
+class ThresholdPruner(Pruner):
+    """Prunes trials whose mean score falls below a fixed threshold.
+
+    Parameters
+    ----------
+    lower : float
+        Trials with a lower mean score are pruned.
+
+    n_warmup_folds : int, default 1
+        Number of folds that every trial finishes before it can be
+        pruned."""
+
+    def __init__(self, lower: float, n_warmup_folds: int = 1):
+        self.lower = lower
+        self.n_warmup_folds = n_warmup_folds
+
+    def should_prune(self, fold: int, score: float) -> bool:
+        return fold + 1 >= self.n_warmup_folds and score < self.lower
+
+
+class PercentilePruner(Pruner):
+    """Prunes trials that score below a percentile of earlier trials.
+
+    After fold i, a trial is pruned if its mean score is below the
+    given percentile of the mean scores after fold i of the trials
+    that finished all their folds.
+
+    Parameters
+    ----------
+    percentile : float
+        Between 0 and 100. Higher values prune more trials.
+
+    n_startup_trials : int, default 5
+        Number of trials that must have finished all their folds
+        before any trial is pruned.
+
+    n_warmup_folds : int, default 1
+        Number of folds that every trial finishes before it can be
+        pruned."""
+
+    def __init__(
+        self, percentile: float, n_startup_trials: int = 5, n_warmup_folds: int = 1
+    ):
+        if not 0.0 <= percentile <= 100.0:
+            raise ValueError(f"percentile must be between 0 and 100, got {percentile}")
+        self.percentile = percentile
+        self.n_startup_trials = n_startup_trials
+        self.n_warmup_folds = n_warmup_folds
+        self._scores: List[List[float]] = []  # fold -> scores of finished trials
+
+    def should_prune(self, fold: int, score: float) -> bool:
+        if fold + 1 < self.n_warmup_folds or fold >= len(self._scores):
+            return False
+        scores = self._scores[fold]
+        if len(scores) < max(1, self.n_startup_trials):
+            return False
+        return bool(score < np.percentile(scores, self.percentile))
+
+    def report(self, scores: List[float]) -> None:
+        for fold, score in enumerate(scores):
+            if fold == len(self._scores):
+                self._scores.append([])
+            self._scores[fold].append(score)
+
+
+class MedianPruner(PercentilePruner):
+    """Prunes trials that score below the median of earlier trials.
+
+    Parameters
+    ----------
+    n_startup_trials : int, default 5
+        Number of trials that must have finished all their folds
+        before any trial is pruned.
+
+    n_warmup_folds : int, default 1
+        Number of folds that every trial finishes before it can be
+        pruned."""
+
+    def __init__(self, n_startup_trials: int = 5, n_warmup_folds: int = 1):
+        super().__init__(50.0, n_startup_trials, n_warmup_folds)
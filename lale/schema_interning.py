@@ -0,0 +1,220 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Hash-consed, immutable JSON schemas.
+
+intern_schema turns a JSON schema into a tree of InternedDict and
+InternedList nodes. Nodes are subclasses of dict and list, so they can
+be used wherever a schema is expected, but they cannot be modified,
+and structurally equal nodes are the same object. Hence operators that
+share subschemas share their memory, sklearn's clone returns the node
+itself, and equality and hashing take constant time. Use thaw_schema,
+copy, or deepcopy to get a mutable copy.
+"""
+
+import hashlib
+import json
+import numbers
+import threading
+import weakref
+from typing import Any, Optional, Tuple
+
+import numpy as np
+
+# Interned nodes by the kind of node and the keys of their children,
+# which are values for JSON scalars and identities otherwise.  Children
+# are kept alive by their parents, so identities are not reused while a
+# parent is in the table.
+_interned: "weakref.WeakValueDictionary[Tuple[Any, ...], Any]" = (
+    weakref.WeakValueDictionary()
+)
+_interned_lock = threading.Lock()
+
+_scalar_types = (str, int, float, bool, type(None))
+
+
+def _is_scalar(value: Any) -> bool:
+    # numpy scalars are compared by value like Python numbers
+    return type(value) in _scalar_types or (
+        isinstance(value, (numbers.Number, np.generic))
+        and getattr(value, "__hash__", None) is not None
+    )
+
+
+def _child_key(value: Any) -> Tuple[Any, ...]:
+    if _is_scalar(value):
+        return (type(value), value)
+    if type(value) is tuple:
+        return (tuple,) + tuple(_child_key(v) for v in value)
+    return (id(value),)
+
+
+def _child_hash_key(value: Any) -> Tuple[Any, ...]:
+    # equal nodes can differ in the order of keys or in the types of
+    # equal numbers, but not in hashes
+    if isinstance(value, _Interned):
+        return (_Interned, value._hash)
+    if type(value) is tuple:
+        return (tuple,) + tuple(_child_hash_key(v) for v in value)
+    if _is_scalar(value):
+        return (value,)
+    return ()  # other values, such as operators, are compared by __eq__
+
+
+def _immutable(self, *args, **kwargs):
+    raise TypeError(
+        f"{type(self).__name__} is immutable, use lale.schema_interning.thaw_schema to get a mutable copy"
+    )
+
+
+class _Interned:
+    _hash: int
+    _digest: Optional[bytes] = None
+    _is_schema: bool = False  # validated against the JSON meta-schema
+
+    def __deepcopy__(self, memo):
+        result = thaw_schema(self)
+        memo[id(self)] = result
+        return result
+
+    def __sklearn_clone__(self):
+        return self
+
+
+class InternedDict(_Interned, dict):
+    """Immutable dictionary node of an interned schema."""
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, InternedDict) and self._hash != other._hash:
+            return False
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __copy__(self):
+        return dict(self)
+
+    def __reduce__(self):
+        return (intern_schema, (dict(self),))
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = __ior__ = _immutable
+
+
+class InternedList(_Interned, list):
+    """Immutable list node of an interned schema."""
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if isinstance(other, InternedList) and self._hash != other._hash:
+            return False
+        return list.__eq__(self, other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __copy__(self):
+        return list(self)
+
+    def __reduce__(self):
+        return (intern_schema, (list(self),))
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = clear = extend = insert = pop = remove = reverse = sort = _immutable
+
+
+def _intern_node(cls, key: Tuple[Any, ...], contents, hash_key) -> Any:
+    with _interned_lock:
+        node = _interned.get(key)
+        if node is None:
+            node = cls(contents)
+            node._hash = hash(hash_key)
+            _interned[key] = node
+        return node
+
+
+def intern_schema(schema: Any) -> Any:
+    """Return the interned, immutable version of the schema.
+
+    Parameters
+    ----------
+    schema : JSON schema
+        Dictionaries and lists are interned recursively, and the
+        elements of tuples are interned. Other values, such as strings,
+        numbers, or operators in enumerations, are kept as is.
+
+    Returns
+    -------
+    JSON schema
+        Equal to the given schema, and identical to the results of
+        interning all other equal schemas that are still alive.
+    """
+    if isinstance(schema, _Interned):
+        return schema
+    if isinstance(schema, dict):
+        items = {k: intern_schema(v) for k, v in schema.items()}
+        # the order of keys is kept, but does not affect equality
+        key = (dict,) + tuple((k,) + _child_key(v) for k, v in items.items())
+        hash_key = frozenset((k,) + _child_hash_key(v) for k, v in items.items())
+        return _intern_node(InternedDict, key, items, hash_key)
+    if type(schema) is tuple:
+        return tuple(intern_schema(v) for v in schema)
+    if isinstance(schema, list):
+        elems = [intern_schema(v) for v in schema]
+        key = (list,) + tuple(_child_key(v) for v in elems)
+        hash_key = tuple(_child_hash_key(v) for v in elems)
+        return _intern_node(InternedList, key, elems, hash_key)
+    return schema
+
+
+def thaw_schema(schema: Any) -> Any:
+    """Return a mutable deep copy of an interned (or plain) schema."""
+    if isinstance(schema, dict):
+        return {k: thaw_schema(v) for k, v in schema.items()}
+    if isinstance(schema, list):
+        return [thaw_schema(v) for v in schema]
+    if type(schema) is tuple:
+        return tuple(thaw_schema(v) for v in schema)
+    return schema
+
+
+def interned_count() -> int:
+    """Number of distinct interned nodes that are currently alive."""
+    with _interned_lock:
+        return len(_interned)
+
+
+def schema_digest(schema: Any) -> Optional[bytes]:
+    """Digest of the canonical JSON encoding of the schema, or None if
+    the schema is not JSON. It is computed once per interned node."""
+    digest = getattr(schema, "_digest", None)
+    if digest is None:
+        try:
+            encoded = json.dumps(schema, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+        if isinstance(schema, _Interned):
+            schema._digest = digest
+    return digest
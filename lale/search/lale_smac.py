@@ -24,6 +24,7 @@ from ConfigSpace.hyperparameters import (
 )
 from smac.configspace import ConfigurationSpace
 
+import lale.settings
 from lale.search.PGO import PGO
 from lale.search.search_space import (
     SearchSpace,
@@ -48,7 +49,8 @@ def lale_op_smac_tae(op: "Ops.PlannedOperator", f_min):
 
         wrapped_op = clone(op_compat)
         cfg2 = smac_fixup_params(cfg)
-        trainable = wrapped_op.set_params(**cfg2)
+        with lale.settings.trusted_hyperparams():
+            trainable = wrapped_op.set_params(**cfg2)
 
         return f_min(trainable)
 
@@ -64,7 +66,8 @@ def lale_trainable_op_from_config(
 
     wrapped_op = clone(op_compat)
     cfg2 = smac_fixup_params(cfg)
-    trainable = wrapped_op.with_params(**cfg2)
+    with lale.settings.trusted_hyperparams():
+        trainable = wrapped_op.with_params(**cfg2)
     return trainable
 
 
@@ -12,7 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import copy
+import hashlib
+import json
 import logging
+import threading
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import jsonschema
@@ -93,6 +98,63 @@ def op_to_search_space(
     return search_space
 
 
+# Simplified hyperparameter schemas and search spaces of individual
+# operators, keyed by a digest of the canonical JSON encoding of the
+# schema (which reflects bound hyperparameters and the data schema),
+# the operator names, and its PGO frequencies, in least-recently-used
+# order.  Hits return deep copies, since callers extend search spaces
+# in place.
+_search_space_cache: (
+    "collections.OrderedDict[bytes, Tuple[Optional[JsonSchema], Optional[SearchSpace]]]"
+) = collections.OrderedDict()
+_search_space_cache_lock = threading.Lock()
+_search_space_cache_hits = 0
+_search_space_cache_misses = 0
+search_space_cache_size: int = 1024
+
+SearchSpaceCacheInfo = collections.namedtuple(
+    "SearchSpaceCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+def search_space_cache_info() -> SearchSpaceCacheInfo:
+    """Hit and miss counts of the cache of per-operator search spaces.
+
+    Returns
+    -------
+    SearchSpaceCacheInfo
+        Named tuple of hits, misses, maxsize, and currsize, like
+        the cache_info of functools.lru_cache.
+    """
+    with _search_space_cache_lock:
+        return SearchSpaceCacheInfo(
+            _search_space_cache_hits,
+            _search_space_cache_misses,
+            search_space_cache_size,
+            len(_search_space_cache),
+        )
+
+
+def clear_search_space_cache() -> None:
+    """Forget all cached search spaces and reset the counters."""
+    global _search_space_cache_hits, _search_space_cache_misses
+    with _search_space_cache_lock:
+        _search_space_cache.clear()
+        _search_space_cache_hits = 0
+        _search_space_cache_misses = 0
+
+
+def _search_space_cache_key(
+    longName: str, name: str, schema: JsonSchema, freqs: Any
+) -> Optional[bytes]:
+    # schemas that refer to operators or other objects are not cached
+    try:
+        encoded = json.dumps([longName, name, schema, freqs], sort_keys=True)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded.encode(), digest_size=16).digest()
+
+
 def get_default(schema) -> Optional[Any]:
     d = schema.get("default", None)
     if d is not None:
@@ -525,7 +587,7 @@ class SearchSpaceOperatorVisitor(Visitor):
                     if k in anys:
                         logger.info(f"Ignoring Duplicate SearchSpace entry {k}")
                     anys[k] = o_choice
-                return SearchSpaceObject(longName, all_keys, anys.values())
+                return SearchSpaceObject(longName, all_keys, list(anys.values()))
             else:
                 return SearchSpaceObject(longName, [], [])
 
@@ -588,6 +650,30 @@ class SearchSpaceOperatorVisitor(Visitor):
 
     def schemaToSimplifiedAndSearchSpace(
         self, longName: str, name: str, schema: JsonSchema
+    ) -> Tuple[Optional[JsonSchema], Optional[SearchSpace]]:
+        global _search_space_cache_hits, _search_space_cache_misses
+        key = None
+        if search_space_cache_size > 0:
+            freqs = None if self.pgo is None else self.pgo.get(name, None)
+            key = _search_space_cache_key(longName, name, schema, freqs)
+        if key is not None:
+            with _search_space_cache_lock:
+                entry = _search_space_cache.get(key)
+                if entry is not None:
+                    _search_space_cache.move_to_end(key)
+                    _search_space_cache_hits += 1
+                    return copy.deepcopy(entry)
+                _search_space_cache_misses += 1
+        result = self._schemaToSimplifiedAndSearchSpace(longName, name, schema)
+        if key is not None:
+            with _search_space_cache_lock:
+                _search_space_cache[key] = copy.deepcopy(result)
+                while len(_search_space_cache) > search_space_cache_size:
+                    _search_space_cache.popitem(last=False)
+        return result
+
+    def _schemaToSimplifiedAndSearchSpace(
+        self, longName: str, name: str, schema: JsonSchema
     ) -> Tuple[Optional[JsonSchema], Optional[SearchSpace]]:
         schema = narrowToRelevantConstraints(schema)
         relevantFields = findRelevantFields(schema)
@@ -1,6 +1,15 @@
+import contextlib
+import contextvars
+
 disable_hyperparams_schema_validation = False
 disable_data_schema_validation = True
 
+# Set while configuring operators with hyperparameters that an optimizer
+# drew from a search space compiled from the operators' own schemas.
+_trusted_hyperparams: "contextvars.ContextVar[bool]" = contextvars.ContextVar(
+    "lale_trusted_hyperparams", default=False
+)
+
 
 def set_disable_data_schema_validation(flag: bool):
     """Lale can validate the input and output data used for fit, predict, predict_proba etc.
@@ -30,3 +39,22 @@ def set_disable_hyperparams_schema_validation(flag: bool):
     """
     global disable_hyperparams_schema_validation  # pylint:disable=global-statement
     disable_hyperparams_schema_validation = flag
+
+
+@contextlib.contextmanager
+def trusted_hyperparams():
+    """Context manager under which hyperparameters are treated as valid by construction.
+
+    Optimizers such as Hyperopt, SMAC, and GridSearchCV draw hyperparameters
+    from a search space that Lale compiles from the schemas of the operators,
+    so each value already satisfies the schema of its own hyperparameter.
+    Inside this context, configuring an operator only checks the side
+    constraints among hyperparameters and skips proposing fixes on failure,
+    which lowers the per-trial overhead when running many cheap trials.
+    It has no effect if hyperparameter schema validation is disabled.
+    """
+    token = _trusted_hyperparams.set(True)
+    try:
+        yield
+    finally:
+        _trusted_hyperparams.reset(token)
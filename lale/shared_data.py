@@ -0,0 +1,270 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Zero-copy handoff of datasets to worker processes.
+
+SharedData writes the buffers of numpy arrays, pandas data frames and
+series, and scipy CSR matrices once to memory-mapped files in a
+temporary directory (under /dev/shm where it exists, so the files live
+in shared memory), and returns a small handle that pickles in constant
+time. Loading the handle in a worker process maps the files and
+rebuilds the data as copy-on-write views of them, so all workers share
+one copy of the data, and pages that a worker modifies become private
+to that worker. Values without a fixed-size buffer, such as lists,
+object columns, or pandas extension arrays, are pickled with the
+handle as usual.
+
+.. code-block:: python
+
+    with SharedData() as shared:
+        handle = shared.share((X, y))
+        # send handle to workers, which call
+        X, y = handle.load()
+"""
+
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.sparse import csr_matrix
+
+from lale.datasets.data_schemas import add_schema, add_table_name, get_table_name
+
+# smaller buffers are pickled with the handle
+min_shared_nbytes: int = 1 << 16
+
+_SHM_DIR = "/dev/shm"  # nosec B108
+
+
+def _default_temp_dir() -> Optional[str]:
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return None
+
+
+def _is_shareable_dtype(dtype) -> bool:
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufcmMSU"
+
+
+class SharedDataHandle:
+    """Picklable reference to data placed in shared memory by SharedData."""
+
+    def __init__(self, path: str, spec: Any):
+        self._path = path
+        self._spec = spec
+
+    def load(self) -> Any:
+        """Rebuild the data as copy-on-write views of the shared buffers.
+
+        Returns
+        -------
+        Any
+            Equal to the data given to SharedData.share, with the same
+            types, index, columns, table name, and schema."""
+        return self._load(self._spec)
+
+    def _array(self, name: str) -> np.ndarray:
+        return np.load(os.path.join(self._path, name), mmap_mode="c")
+
+    def _load(self, spec) -> Any:
+        kind = spec[0]
+        if kind == "value":
+            value = spec[1]
+            if isinstance(value, np.ndarray):
+                # small, and unpickled arrays can be views of immutable bytes
+                value = value.copy()
+            return value
+        if kind == "array":
+            return self._array(spec[1])
+        if kind == "tuple":
+            return tuple(self._load(s) for s in spec[1])
+        if kind == "index":
+            return pd.Index(self._load(spec[1]), name=spec[2], copy=False)
+        if kind == "metadata":
+            _, data, table_name, json_schema = spec
+            result = self._load(data)
+            if json_schema is not None:
+                result = add_schema(result, json_schema)
+            return add_table_name(result, table_name)
+        if kind == "csr":
+            _, data, indices, indptr, shape = spec
+            return csr_matrix(
+                (self._load(data), self._load(indices), self._load(indptr)),
+                shape=shape,
+                copy=False,
+            )
+        if kind == "series":
+            _, values, index, name = spec
+            return pd.Series(
+                self._load(values), index=self._load(index), name=name, copy=False
+            )
+        if kind == "frame":
+            _, block, index, columns = spec
+            return pd.DataFrame(
+                self._load(block),
+                index=self._load(index),
+                columns=columns,
+                copy=False,
+            )
+        if kind == "frame_columns":
+            _, blocks, others, index, columns = spec
+            arrays: Dict[int, Any] = dict(others)
+            for block_spec, positions in blocks:
+                block = self._load(block_spec)
+                for j, position in enumerate(positions):
+                    arrays[position] = block[:, j]
+            result = pd.DataFrame(
+                {i: arrays[i] for i in range(len(columns))},
+                index=self._load(index),
+                copy=False,
+            )
+            result.columns = columns
+            return result
+        assert False, f"unexpected kind {kind}"
+
+
+class SharedData:
+    """Owner of the shared buffers of one or more datasets.
+
+    Parameters
+    ----------
+    temp_dir : string, optional, default None
+        Directory in which to create the memory-mapped files, /dev/shm
+        if it exists and the default temporary directory otherwise.
+
+    Use as a context manager or call close, which deletes the files.
+    Worker processes that still map them keep their views."""
+
+    def __init__(self, temp_dir: Optional[str] = None):
+        if temp_dir is None:
+            temp_dir = _default_temp_dir()
+        self._path: Optional[str] = tempfile.mkdtemp(prefix="lale-", dir=temp_dir)
+        self._n_files = 0
+
+    def __enter__(self) -> "SharedData":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._path is not None:
+            shutil.rmtree(self._path, ignore_errors=True)
+            self._path = None
+
+    def share(self, data: Any) -> SharedDataHandle:
+        """Place the buffers of the data in shared memory.
+
+        Parameters
+        ----------
+        data : Any
+            A numpy array, pandas data frame or series, CSR matrix, or
+            tuple of those. Other values are kept as they are.
+
+        Returns
+        -------
+        SharedDataHandle
+            Handle whose load method rebuilds the data."""
+        assert self._path is not None, "SharedData is closed"
+        return SharedDataHandle(self._path, self._share(data))
+
+    def _write(self, array: np.ndarray, fortran_order: bool = False) -> Tuple:
+        name = f"{self._n_files}.npy"
+        self._n_files += 1
+        assert self._path is not None
+        mapped = np.lib.format.open_memmap(
+            os.path.join(self._path, name),
+            mode="w+",
+            dtype=array.dtype,
+            shape=array.shape,
+            fortran_order=fortran_order,
+        )
+        mapped[...] = array
+        mapped.flush()
+        del mapped
+        return ("array", name)
+
+    def _share_array(self, array: np.ndarray) -> Tuple:
+        if not _is_shareable_dtype(array.dtype) or array.nbytes < min_shared_nbytes:
+            return ("value", array)
+        return self._write(array)
+
+    def _share_index(self, index: pd.Index) -> Tuple:
+        if isinstance(index, pd.RangeIndex) or not _is_shareable_dtype(index.dtype):
+            return ("value", index)
+        values = self._share_array(index.to_numpy())
+        if values[0] == "value":
+            return ("value", index)
+        return ("index", values, index.name)
+
+    def _share(self, data: Any) -> Tuple:
+        if type(data) is tuple:  # pylint:disable=unidiomatic-typecheck
+            return ("tuple", [self._share(d) for d in data])
+        if isinstance(data, (np.ndarray, pd.Series, pd.DataFrame)):
+            table_name = get_table_name(data)
+            json_schema = getattr(data, "json_schema", None)
+            spec = self._share_data(data)
+            if table_name is None and json_schema is None:
+                return spec
+            return ("metadata", spec, table_name, json_schema)
+        return self._share_data(data)
+
+    def _share_data(self, data: Any) -> Tuple:
+        if isinstance(data, np.ndarray):
+            return self._share_array(np.asarray(data))
+        if isinstance(data, csr_matrix):
+            return (
+                "csr",
+                self._share_array(data.data),
+                self._share_array(data.indices),
+                self._share_array(data.indptr),
+                data.shape,
+            )
+        if isinstance(data, pd.Series) and _is_shareable_dtype(data.dtype):
+            return (
+                "series",
+                self._share_array(data.to_numpy()),
+                self._share_index(data.index),
+                data.name,
+            )
+        if isinstance(data, pd.DataFrame):
+            return self._share_frame(data)
+        return ("value", data)
+
+    def _share_frame(self, df: pd.DataFrame) -> Tuple:
+        dtypes = list(df.dtypes)
+        index = self._share_index(df.index)
+        if len(set(dtypes)) == 1 and _is_shareable_dtype(dtypes[0]):
+            block = self._share_array(df.to_numpy())
+            return ("frame", block, index, df.columns)
+        groups: Dict[Any, List[int]] = {}
+        others = []
+        for position, dtype in enumerate(dtypes):
+            if _is_shareable_dtype(dtype):
+                groups.setdefault(dtype, []).append(position)
+            else:
+                others.append((position, df.iloc[:, position].array))
+        blocks = []
+        for dtype, positions in groups.items():
+            # in Fortran order, so that the columns are contiguous views
+            block = np.asfortranarray(df.iloc[:, positions].to_numpy(dtype=dtype))
+            if block.nbytes < min_shared_nbytes:
+                block_spec: Tuple = ("value", block)
+            else:
+                block_spec = self._write(block, fortran_order=True)
+            blocks.append((block_spec, positions))
+        return ("frame_columns", blocks, others, index, df.columns)
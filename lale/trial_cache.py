@@ -0,0 +1,420 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deduplication of optimizer trials.
+
+Search algorithms often propose configurations that instantiate the
+same pipeline, for instance when they differ only in hyperparameters of
+an operator that a choice did not pick, or in values that are equal
+to the defaults. A TrialCache keeps the cross-validation results of
+trials keyed by trial_key, which is a digest of the canonical JSON of
+the instantiated pipeline (see to_json) and of how it was evaluated:
+a fingerprint of the data, the splitter, and the scoring. Hyperopt,
+SMAC, and GridSearchCV look up trials in the cache given as their
+trial_cache hyperparameter before evaluating them, so a repeated
+pipeline is evaluated once. Results can be persisted in a directory,
+to be reused by later fits and other processes.
+
+.. code-block:: python
+
+    from lale.lib.lale import Hyperopt
+
+    Hyperopt(estimator=planned, cv=5, trial_cache=True)  # in this process
+    Hyperopt(estimator=planned, cv=5, trial_cache="~/.cache/lale-trials")
+"""
+
+import collections
+import hashlib
+import json
+import logging
+import numbers
+import os
+import tempfile
+import threading
+from typing import Any, Dict, NamedTuple, Optional, Union
+
+import numpy as np
+import pandas as pd
+import scipy.sparse
+import sklearn
+
+import lale
+from lale.json_operator import _init_gensym, _op_to_json_rec
+
+logger = logging.getLogger(__name__)
+
+
+class TrialResult(NamedTuple):
+    """Cross-validation result of a trial."""
+
+    score: float
+    log_loss: float
+    time: float
+
+
+TrialCacheInfo = collections.namedtuple(
+    "TrialCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+class _NotCanonical(Exception):
+    pass
+
+
+def _canonical_value(value: Any) -> Any:
+    if value is None or isinstance(value, str):
+        return value
+    if isinstance(value, (bool, np.bool_)):
+        return bool(value)
+    if isinstance(value, numbers.Integral):
+        return int(value)
+    if isinstance(value, numbers.Real):
+        # json keeps 1.0 apart from 1, which sklearn can read differently
+        return float(value)
+    if isinstance(value, dict):
+        return {str(k): _canonical_value(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_canonical_value(v) for v in value]
+    if isinstance(value, np.ndarray):
+        return {"ndarray": _fingerprint(value)}
+    qualname = getattr(value, "__qualname__", None)
+    if qualname is not None:
+        # lambdas and local functions with the same name can differ
+        if "<" in qualname:
+            raise _NotCanonical(qualname)
+        return {"callable": f"{getattr(value, '__module__', '')}.{qualname}"}
+    result = repr(value)
+    if " at 0x" in result:
+        raise _NotCanonical(result)
+    return {"repr": result}
+
+
+def _operator_json(op) -> Dict[str, Any]:
+    # like to_json, but without labels from the variables of the caller,
+    # which would change the names of steps, and without validation
+    _, jso = _op_to_json_rec(op, {}, _init_gensym(op, {}), False)
+    return jso
+
+
+def _canonical_operator(jso: Dict[str, Any]) -> Dict[str, Any]:
+    if jso.get("state") == "trained" and jso.get("coefs") is not None:
+        # the JSON does not include what was learned
+        raise _NotCanonical(jso.get("class"))
+    result = {}
+    for k, v in jso.items():
+        if k in ("label", "documentation_url"):
+            continue
+        if k == "steps":
+            result[k] = {name: _canonical_operator(s) for name, s in v.items()}
+        elif k == "hyperparams" and v is not None:
+            result[k] = _canonical_value(v)
+        else:
+            result[k] = v
+    return result
+
+
+def _update(h, data: Any) -> None:
+    if data is None or isinstance(data, (bool, numbers.Number, str)):
+        h.update(repr((type(data).__name__, data)).encode())
+    elif isinstance(data, (list, tuple)):
+        h.update(f"{type(data).__name__}:{len(data)}".encode())
+        for d in data:
+            _update(h, d)
+    elif isinstance(data, dict):
+        h.update(f"dict:{len(data)}".encode())
+        for k in sorted(data, key=repr):
+            h.update(repr(k).encode())
+            _update(h, data[k])
+    elif isinstance(data, pd.DataFrame):
+        dtypes = [str(t) for t in data.dtypes]
+        h.update(f"frame:{data.shape}:{list(data.columns)!r}:{dtypes}".encode())
+        h.update(pd.util.hash_pandas_object(data, index=True).to_numpy())
+    elif isinstance(data, pd.Series):
+        h.update(f"series:{data.name!r}:{data.dtype}".encode())
+        h.update(pd.util.hash_pandas_object(data, index=True).to_numpy())
+    elif isinstance(data, np.ndarray):
+        h.update(f"ndarray:{data.dtype.str}:{data.shape}".encode())
+        if data.dtype.kind == "O":
+            h.update(pd.util.hash_array(data.ravel()))
+        else:
+            h.update(np.ascontiguousarray(data))
+    elif scipy.sparse.issparse(data):
+        csr = data.tocsr()
+        h.update(f"sparse:{csr.dtype.str}:{csr.shape}".encode())
+        for array in (csr.data, csr.indices, csr.indptr):
+            _update(h, array)
+    else:
+        raise _NotCanonical(type(data).__name__)
+
+
+def _fingerprint(data: Any) -> str:
+    h = hashlib.blake2b(digest_size=16)
+    try:
+        _update(h, data)
+    except TypeError as exc:  # for instance, unhashable objects in columns
+        raise _NotCanonical(str(exc)) from exc
+    return h.hexdigest()
+
+
+def data_fingerprint(data: Any) -> Optional[str]:
+    """Digest of the contents of the data, or None if they are of a
+    type that is not supported.
+
+    Parameters
+    ----------
+    data : Any
+        Numpy arrays, pandas data frames and series, scipy sparse
+        matrices, JSON scalars, and lists, tuples, and dictionaries of
+        those. The index and column names of data frames are included."""
+    try:
+        return _fingerprint(data)
+    except _NotCanonical:
+        return None
+
+
+def trial_evaluation(
+    X,
+    y,
+    cv,
+    scoring,
+    args_to_scorer: Optional[Dict[str, Any]] = None,
+    X_valid=None,
+    y_valid=None,
+    fit_params: Optional[Dict[str, Any]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Description of how the trials of an optimizer are evaluated.
+
+    Computed once per fit, since it includes the fingerprint of the
+    data. Pass cv after sklearn.model_selection.check_cv, so that an
+    integer and the splitter it stands for give the same description.
+
+    Returns
+    -------
+    dict or None
+        To be passed to trial_key, or None if the data cannot be
+        fingerprinted."""
+    data = data_fingerprint((X, y, X_valid, y_valid, fit_params or {}))
+    if data is None:
+        return None
+    return {
+        "data": data,
+        "cv": cv,
+        "scoring": scoring,
+        "args_to_scorer": args_to_scorer or {},
+    }
+
+
+def trial_key(op, evaluation: Dict[str, Any], fidelity: Any = None) -> Optional[str]:
+    """Key of the trial that evaluates the operator as described.
+
+    Parameters
+    ----------
+    op : lale.operators.Operator
+        The pipeline instantiated by the trial.
+
+    evaluation : dict
+        Returned by trial_evaluation.
+
+    fidelity : JSON, optional, default None
+        Distinguishes partial evaluations, such as the rungs of
+        successive halving.
+
+    Returns
+    -------
+    string or None
+        Hexadecimal digest, or None if the operator or evaluation
+        cannot be described canonically, for instance because the
+        pipeline has trained steps or the scoring is a lambda."""
+    try:
+        encoded = json.dumps(
+            [
+                _canonical_operator(_operator_json(op)),
+                _canonical_value(evaluation),
+                _canonical_value(fidelity),
+                [lale.__version__, sklearn.__version__],
+            ],
+            sort_keys=True,
+        )
+    except (_NotCanonical, TypeError, ValueError):
+        return None
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+class TrialCache:
+    """Results of trials by trial_key.
+
+    Parameters
+    ----------
+    path : string, optional, default None
+        Directory in which to persist the results, one JSON file per
+        trial, so that they can be shared across fits and processes.
+        If None, results are only kept in memory.
+
+    max_size : integer, default 4096
+        Maximum number of results kept in memory, in least-recently-used
+        order. Results in the directory are kept until clear is called.
+
+    Only trials that finished all folds are recorded, since failures
+    can be transient and pruning depends on the other trials. Pickled
+    caches start with no results in memory, but share the directory."""
+
+    def __init__(self, path: Optional[str] = None, max_size: int = 4096):
+        self.path = path
+        self.max_size = max_size
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+        self._results: "collections.OrderedDict[str, TrialResult]" = (
+            collections.OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        # optimizers clone their hyperparameters, which should share the cache
+        return self
+
+    def __getstate__(self):
+        return {"path": self.path, "max_size": self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def get(self, key: str) -> Optional[TrialResult]:
+        """The result of the trial, or None if it is not in the cache."""
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._results.move_to_end(key)
+                self._hits += 1
+                return result
+        result = self._load(key)
+        with self._lock:
+            if result is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._remember(key, result)
+        return result
+
+    def put(self, key: str, result: TrialResult) -> None:
+        """Record the result of the trial."""
+        with self._lock:
+            self._remember(key, result)
+        if self.path is not None:
+            self._store(key, result)
+
+    def cache_info(self) -> TrialCacheInfo:
+        """Hit and miss counts of the cache.
+
+        Returns
+        -------
+        TrialCacheInfo
+            Named tuple of hits, misses, maxsize, and currsize, like
+            the cache_info of functools.lru_cache, where currsize
+            counts the results in memory."""
+        with self._lock:
+            return TrialCacheInfo(
+                self._hits, self._misses, self.max_size, len(self._results)
+            )
+
+    def clear(self) -> None:
+        """Forget all results, including those in the directory, and
+        reset the counters."""
+        with self._lock:
+            self._results.clear()
+            self._hits = 0
+            self._misses = 0
+            if self.path is not None:
+                for name in os.listdir(self.path):
+                    if name.endswith(".json"):
+                        os.remove(os.path.join(self.path, name))
+
+    def _remember(self, key: str, result: TrialResult) -> None:
+        self._results[key] = result
+        self._results.move_to_end(key)
+        while len(self._results) > self.max_size:
+            self._results.popitem(last=False)
+
+    def _file(self, key: str) -> str:
+        assert self.path is not None
+        return os.path.join(self.path, key + ".json")
+
+    def _load(self, key: str) -> Optional[TrialResult]:
+        if self.path is None:
+            return None
+        try:
+            with open(self._file(key), encoding="utf-8") as f:
+                return TrialResult(**json.load(f))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            logger.warning(f"Lale:Ignoring unreadable trial cache entry {key}: {e}")
+            return None
+
+    def _store(self, key: str, result: TrialResult) -> None:
+        assert self.path is not None
+        try:
+            # write and rename, so that readers never see partial files
+            fd, temp_file = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(result._asdict(), f)
+            os.replace(temp_file, self._file(key))
+        except OSError as e:
+            logger.warning(f"Lale:Could not persist trial cache entry {key}: {e}")
+
+
+_shared_caches: Dict[Optional[str], TrialCache] = {}
+_shared_caches_lock = threading.Lock()
+
+
+def get_trial_cache(
+    trial_cache: Union[None, bool, str, TrialCache]
+) -> Optional[TrialCache]:
+    """The cache denoted by the trial_cache hyperparameter of optimizers.
+
+    Parameters
+    ----------
+    trial_cache : union type
+
+        - None or False
+            No cache.
+
+        - True
+            The in-memory cache shared by all optimizers of this process.
+
+        - string
+            The cache persisted in this directory, shared by all
+            optimizers of this process that name the same directory.
+
+        - TrialCache
+            This cache.
+
+    Returns
+    -------
+    TrialCache or None"""
+    if trial_cache is None or trial_cache is False:
+        return None
+    if isinstance(trial_cache, TrialCache):
+        return trial_cache
+    path = None
+    if trial_cache is not True:
+        path = os.path.abspath(os.path.expanduser(trial_cache))
+    with _shared_caches_lock:
+        if path not in _shared_caches:
+            _shared_caches[path] = TrialCache(path)
+        return _shared_caches[path]
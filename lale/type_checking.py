@@ -30,8 +30,10 @@ as the right side succeed. This is specified using ``{'laleType': 'Any'}``.
 .. _subschema: https://arxiv.org/abs/1911.12651
 """
 
+import collections
 import functools
 import inspect
+import threading
 from collections.abc import Iterable
 from typing import Any, Dict, List, Optional, Tuple, overload
 
@@ -41,12 +43,14 @@ import jsonschema.validators
 import jsonsubschema
 import numpy as np
 import numpy.random
+import pandas as pd
 import sklearn.base
 
 import lale.datasets.data_schemas
 import lale.expressions
 import lale.helpers
 import lale.operators
+from lale.schema_interning import _Interned, schema_digest
 
 JSON_TYPE = Dict[str, Any]
 
@@ -105,9 +109,50 @@ _lale_validator = jsonschema.validators.extend(
 )
 
 
+# Validators compiled from interned schemas, keyed by the identity of the
+# schema object, in least-recently-used order.  Each entry keeps a
+# reference to its schema, so the id cannot be reused by another object
+# while cached.  Equal interned schemas are not always the same object,
+# for instance enums of 1 and True, so they are not keyed by value.
+# Other schemas can be mutated in place, so they are compiled every time.
+_validator_cache: "collections.OrderedDict[int, Tuple[Any, Any]]" = (
+    collections.OrderedDict()
+)
+_validator_cache_lock = threading.Lock()
+validator_cache_size: int = 512
+
+
+def clear_validator_cache() -> None:
+    """Forget all validators compiled by always_validate_schema."""
+    with _validator_cache_lock:
+        _validator_cache.clear()
+
+
+def _cached_validator(schema: JSON_TYPE):
+    if not isinstance(schema, _Interned):
+        return _lale_validator(lale.helpers.data_to_json(schema, False))
+    key = id(schema)
+    with _validator_cache_lock:
+        entry = _validator_cache.get(key)
+        if entry is not None and entry[0] is schema:
+            _validator_cache.move_to_end(key)
+            return entry[1]
+    validator = _lale_validator(lale.helpers.data_to_json(schema, False))
+    with _validator_cache_lock:
+        _validator_cache[key] = (schema, validator)
+        while len(_validator_cache) > validator_cache_size:
+            _validator_cache.popitem(last=False)
+    return validator
+
+
 def always_validate_schema(value: Any, schema: JSON_TYPE, subsample_array: bool = True):
     """Validate that the value is an instance of the schema.
 
+    The validator compiled for an interned schema (see
+    lale.schema_interning) is cached, keyed by the identity of the schema
+    object and bounded by validator_cache_size, so repeated checks
+    against the same schema skip the compilation.
+
     Parameters
     ----------
     value: JSON (int, float, str, list, dict) or JSON-like (tuple, np.ndarray, pd.DataFrame ...).
@@ -125,14 +170,55 @@ def always_validate_schema(value: Any, schema: JSON_TYPE, subsample_array: bool
         The value was invalid for the schema.
     """
     json_value = lale.helpers.data_to_json(value, subsample_array)
-    sch: Any = lale.helpers.data_to_json(schema, False)
     try:
-        validator = _lale_validator(sch)
+        validator = _cached_validator(schema)
         validator.validate(json_value)
     except Exception:
+        sch: Any = lale.helpers.data_to_json(schema, False)
         jsonschema.validate(json_value, sch, _lale_validator)
 
 
+def first_violated_constraint(
+    hyperparams: Dict[str, Any], hp_schema: JSON_TYPE
+) -> Optional[JSON_TYPE]:
+    """Check hyperparams against the side constraints of hp_schema only.
+
+    The side constraints are the elements of ``hp_schema["allOf"]`` after
+    the first, which lists the hyperparameters one at a time. This is the
+    cheap check for hyperparameters that are valid by construction with
+    respect to their own schemas, see lale.settings.trusted_hyperparams.
+
+    Parameters
+    ----------
+    hyperparams: dict
+        All hyperparameters of an operator, including defaults.
+
+    hp_schema: JSON schema
+        Hyperparameter schema of the operator.
+
+    Returns
+    -------
+    JSON schema or None
+        The first side constraint that hyperparams violate, if any.
+    """
+    constraints = hp_schema.get("allOf", [])[1:]
+    if not constraints:
+        return None
+    json_value = lale.helpers.data_to_json(hyperparams)
+    for constraint in constraints:
+        try:
+            valid = _cached_validator(constraint).is_valid(json_value)
+        except Exception:
+            try:
+                always_validate_schema(hyperparams, constraint)
+                valid = True
+            except jsonschema.ValidationError:
+                valid = False
+        if not valid:
+            return constraint
+    return None
+
+
 def validate_schema_directly(
     value: Any, schema: JSON_TYPE, subsample_array: bool = True
 ):
@@ -178,9 +264,13 @@ def validate_is_schema(value: Dict[str, Any]):
     if disable_hyperparams_schema_validation:
         return
 
+    if getattr(value, "_is_schema", False):
+        return  # interned schemas are immutable, so they are still valid
     if "$schema" in value:
         assert value["$schema"] == _JSON_META_SCHEMA_URL
     _validator.validate(value)
+    if isinstance(value, _Interned):
+        value._is_schema = True
 
 
 def is_schema(value) -> bool:
@@ -222,6 +312,60 @@ def _json_replace(subject, old, new):
     return subject  # nothing changed so share original object (not a copy)
 
 
+# Verdicts of is_subschema, keyed by a digest of the canonical JSON
+# encoding of both schemas, in least-recently-used order.  Unlike the
+# validator cache, this is keyed on content rather than identity, since
+# data schemas are recomputed for every dataset an operator sees.
+_subschema_cache: "collections.OrderedDict[bytes, bool]" = collections.OrderedDict()
+_subschema_cache_lock = threading.Lock()
+_subschema_cache_hits = 0
+_subschema_cache_misses = 0
+subschema_cache_size: int = 4096
+
+SubschemaCacheInfo = collections.namedtuple(
+    "SubschemaCacheInfo", ["hits", "misses", "maxsize", "currsize"]
+)
+
+
+def subschema_cache_info() -> SubschemaCacheInfo:
+    """Hit and miss counts of the cache used by is_subschema.
+
+    Returns
+    -------
+    SubschemaCacheInfo
+        Named tuple of hits, misses, maxsize, and currsize, like
+        the cache_info of functools.lru_cache.
+    """
+    with _subschema_cache_lock:
+        return SubschemaCacheInfo(
+            _subschema_cache_hits,
+            _subschema_cache_misses,
+            subschema_cache_size,
+            len(_subschema_cache),
+        )
+
+
+def clear_subschema_cache() -> None:
+    """Forget all verdicts cached by is_subschema and reset the counters."""
+    global _subschema_cache_hits, _subschema_cache_misses
+    with _subschema_cache_lock:
+        _subschema_cache.clear()
+        _subschema_cache_hits = 0
+        _subschema_cache_misses = 0
+
+
+def _subschema_cache_key(
+    sub_schema: JSON_TYPE, super_schema: JSON_TYPE
+) -> Optional[bytes]:
+    # digests of interned schemas, such as those of operators, are
+    # computed once rather than on every check
+    sub_digest = schema_digest(sub_schema)
+    super_digest = schema_digest(super_schema)
+    if sub_digest is None or super_digest is None:
+        return None
+    return sub_digest + super_digest
+
+
 def is_subschema(sub_schema: JSON_TYPE, super_schema: JSON_TYPE) -> bool:
     """Is sub_schema a subschema of super_schema?
 
@@ -242,15 +386,37 @@ def is_subschema(sub_schema: JSON_TYPE, super_schema: JSON_TYPE) -> bool:
     ------
     jsonschema.ValueError
         An error occured while checking the subschema relation
-    """
 
+    Notes
+    -----
+    Verdicts are cached across operators in a bounded LRU cache keyed
+    on the content of both schemas, see subschema_cache_info.
+    """
+    global _subschema_cache_hits, _subschema_cache_misses
+    key = None
+    if subschema_cache_size > 0:
+        key = _subschema_cache_key(sub_schema, super_schema)
+    if key is not None:
+        with _subschema_cache_lock:
+            result = _subschema_cache.get(key)
+            if result is not None:
+                _subschema_cache.move_to_end(key)
+                _subschema_cache_hits += 1
+                return result
+            _subschema_cache_misses += 1
     new_sub = _json_replace(sub_schema, {"laleType": "Any"}, {"not": {}})
     try:
-        return jsonsubschema.isSubschema(new_sub, super_schema)
+        result = jsonsubschema.isSubschema(new_sub, super_schema)
     except Exception as e:
         raise ValueError(
             f"unexpected internal error checking ({new_sub} <: {super_schema})"
         ) from e
+    if key is not None:
+        with _subschema_cache_lock:
+            _subschema_cache[key] = result
+            while len(_subschema_cache) > subschema_cache_size:
+                _subschema_cache.popitem(last=False)
+    return result
 
 
 class SubschemaError(Exception):
@@ -279,6 +445,96 @@ def _validate_subschema(
         raise SubschemaError(sub, sup, sub_name, sup_name)
 
 
+# JSON types that the schema of a column with the given dtype kind, as
+# computed by lale.datasets.data_schemas, is a subschema of.
+_dtype_kind_to_types = {
+    "b": {"boolean"},
+    "i": {"integer", "number"},
+    "u": {"integer", "number"},
+    "f": {"number"},
+    "c": {"number"},
+    "O": {"string"},
+    "S": {"string"},
+    "U": {"string"},
+}
+
+
+def _dtypes_satisfy(schema: JSON_TYPE, shape: Tuple[int, ...], dtypes) -> bool:
+    if not isinstance(schema, dict):
+        return False
+    keys = schema.keys() - {"description"}
+    if not keys:
+        return True
+    if keys == {"laleType"}:
+        return schema["laleType"] == "Any"
+    if not shape and len(dtypes) > 1:
+        # each column on its own, so that anyOf may pick different branches
+        return all(_dtypes_satisfy(schema, shape, [dtype]) for dtype in dtypes)
+    if keys == {"anyOf"}:
+        return any(_dtypes_satisfy(s, shape, dtypes) for s in schema["anyOf"])
+    if not shape:
+        if keys != {"type"}:
+            return False
+        types = schema["type"]
+        types = {types} if isinstance(types, str) else set(types)
+        return all(
+            not types.isdisjoint(_dtype_kind_to_types.get(dtype.kind, ()))
+            for dtype in dtypes
+        )
+    if (
+        keys <= {"type", "items", "minItems", "maxItems"}
+        and schema.get("type") == "array"
+        and isinstance(schema.get("items"), dict)
+    ):
+        n_items = shape[0]
+        if n_items < schema.get("minItems", 0):
+            return False
+        if n_items > schema.get("maxItems", n_items):
+            return False
+        return _dtypes_satisfy(schema["items"], shape[1:], dtypes)
+    return False
+
+
+def dtypes_satisfy_schema(value: Any, schema: JSON_TYPE) -> bool:
+    """Can value be shown to satisfy schema from its shape and dtypes alone?
+
+    This is a fast path for validating pandas and numpy data against
+    common schemas such as arrays of arrays of numbers. It takes time
+    linear in the number of columns and does not materialize a JSON
+    schema of the data. Values that carry a schema of their own (see
+    lale.datasets.data_schemas.add_schema) are not handled here.
+
+    Parameters
+    ----------
+    value: Any
+        A pandas DataFrame or Series or a numpy ndarray.
+
+    schema: JSON schema
+        Schema that the value is expected to satisfy.
+
+    Returns
+    -------
+    bool
+        True if value is known to satisfy the schema. False if that
+        could not be decided this way, in which case the caller should
+        fall back to validate_schema.
+    """
+    if getattr(value, "json_schema", None) is not None:
+        return False
+    if isinstance(value, pd.DataFrame):
+        dtypes = list(set(value.dtypes))
+    elif isinstance(value, (pd.Series, np.ndarray)):
+        dtypes = [value.dtype]
+    else:
+        return False
+    if not all(
+        isinstance(dtype, np.dtype) and dtype.fields is None and dtype.shape == ()
+        for dtype in dtypes
+    ):
+        return False
+    return _dtypes_satisfy(schema, value.shape, dtypes)
+
+
 def validate_schema(lhs: Any, super_schema: JSON_TYPE):
     """Validate that lhs is an instance of or a subschema of super_schema.
 
@@ -302,6 +558,8 @@ def validate_schema(lhs: Any, super_schema: JSON_TYPE):
 
     if disable_data_schema_validation:
         return  # If schema validation is disabled, always return as valid
+    if dtypes_satisfy_schema(lhs, super_schema):
+        return
     sub_schema: Optional[JSON_TYPE]
 
     try:
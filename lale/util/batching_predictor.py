@@ -0,0 +1,232 @@
+# Copyright 2024 IBM Corporation
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+# http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import concurrent.futures
+import logging
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import lale.operators
+
+logger = logging.getLogger(__name__)
+
+_Request = Tuple[Any, int, "asyncio.Future[Any]"]
+
+
+def _num_rows(X) -> int:
+    if isinstance(X, dict):
+        return 1
+    return len(X)
+
+
+def _concat_requests(requests: List[_Request]):
+    inputs = [X for X, _, _ in requests]
+    if all(isinstance(X, dict) for X in inputs):
+        return pd.DataFrame(inputs)
+    if any(isinstance(X, dict) for X in inputs):
+        raise ValueError("cannot mix single records and batches in one request")
+    if all(isinstance(X, pd.DataFrame) for X in inputs):
+        return pd.concat(inputs, ignore_index=True)
+    return np.concatenate([np.asarray(X) for X in inputs])
+
+
+def _slice_rows(result, start: int, stop: int):
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.iloc[start:stop]
+    return result[start:stop]
+
+
+def _first_row(result):
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        return result.iloc[0]
+    return result[0]
+
+
+class BatchingPredictor:
+    """Asynchronous wrapper that coalesces concurrent requests into micro-batches.
+
+    Each call to predict is queued; a background task collects queued
+    requests until max_batch_size rows are pending or max_wait seconds
+    have passed since the first one arrived, runs the trained pipeline
+    once on the concatenated batch on an executor, and hands each
+    caller its own rows of the result. This amortizes the per-call
+    overhead of the pipeline when serving many small requests.
+
+    Parameters
+    ----------
+    trained : TrainedOperator
+        The trained pipeline or operator used for scoring.
+    max_batch_size : int, optional
+        Maximum number of rows in one batch. A single request larger
+        than this is still scored as a batch of its own.
+        Default is 64.
+    max_wait : float, optional
+        Maximum number of seconds to wait for more requests after the
+        first request of a batch arrived.
+        Default is 0.002.
+    method : str, optional
+        Name of the method of trained to call on each batch, for
+        instance "predict_proba" or "transform".
+        Default is "predict".
+    executor : concurrent.futures.Executor, optional
+        Where to run the pipeline. If None, a single-thread executor is
+        created and shut down by close.
+        Default is None.
+
+    Examples
+    --------
+    >>> async def serve(trained, rows):
+    ...     async with BatchingPredictor(trained) as predictor:
+    ...         return await asyncio.gather(*[predictor.predict(r) for r in rows])
+    """
+
+    def __init__(
+        self,
+        trained: lale.operators.TrainedOperator,
+        max_batch_size: int = 64,
+        max_wait: float = 0.002,
+        method: str = "predict",
+        executor: Optional[concurrent.futures.Executor] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+        if max_wait < 0:
+            raise ValueError(f"max_wait must be non-negative, got {max_wait}")
+        self._trained = trained
+        self._method = getattr(trained, method)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._owns_executor = executor is None
+        self._executor = executor
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._carried: Optional[_Request] = None
+        self.n_batches = 0
+        self.n_requests = 0
+
+    def _start(self):
+        if self._worker is None:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def predict(self, X) -> Any:
+        """Score X as part of the next micro-batch.
+
+        Parameters
+        ----------
+        X : dict, array-like, or dataframe
+            Either a single record as a dictionary from column names
+            to values, or a batch of rows. All requests that end up in
+            the same batch must be of compatible kinds.
+
+        Returns
+        -------
+        result :
+            The prediction for a single record, or the rows of the
+            batch result that belong to X.
+        """
+        self._start()
+        assert self._queue is not None
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((X, _num_rows(X), future))
+        return await future
+
+    async def _next_batch(self, first: Optional[_Request]) -> List[_Request]:
+        assert self._queue is not None
+        if first is None:
+            first = await self._queue.get()
+        batch = [first]
+        n_rows = first[1]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.max_wait
+        while n_rows < self.max_batch_size:
+            if self._queue.empty():
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                request = self._queue.get_nowait()
+            if n_rows + request[1] > self.max_batch_size:
+                self._carried = request  # starts the next batch
+                break
+            batch.append(request)
+            n_rows += request[1]
+        return batch
+
+    def _score(self, batch: List[_Request]):
+        return self._method(_concat_requests(batch))
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            first, self._carried = self._carried, None
+            batch = await self._next_batch(first)
+            batch = [r for r in batch if not r[2].cancelled()]
+            if len(batch) == 0:
+                continue
+            self.n_batches += 1
+            self.n_requests += len(batch)
+            try:
+                result = await loop.run_in_executor(self._executor, self._score, batch)
+            except Exception as exc:  # pylint:disable=broad-exception-caught
+                logger.debug(f"batch of {len(batch)} requests failed: {exc}")
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(exc)
+                continue
+            start = 0
+            for X, n_rows, future in batch:
+                if not future.done():
+                    rows = _slice_rows(result, start, start + n_rows)
+                    if isinstance(X, dict):
+                        rows = _first_row(rows)
+                    future.set_result(rows)
+                start += n_rows
+
+    async def close(self):
+        """Stop the background task and, if owned, shut down the executor."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            pending = [] if self._carried is None else [self._carried]
+            assert self._queue is not None
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            for _, _, future in pending:
+                future.cancel()
+            self._carried = None
+            self._queue = None
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def __aenter__(self) -> "BatchingPredictor":
+        self._start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
@@ -149,7 +149,7 @@ setup(
     long_description_content_type="text/markdown",
     url="https://github.com/IBM/lale",
     python_requires=">=3.8",
-    package_data={"lale": ["py.typed"]},
+    package_data={"lale": ["py.typed", "lib/catalog.json"]},
     packages=find_packages(),
     license="Apache License 2.0",
     classifiers=classifiers,
@@ -373,3 +373,54 @@ _combined_schemas_OpThatWorksWithFilesImpl = {
 OpThatWorksWithFiles = lale.operators.make_operator(
     _OpThatWorksWithFilesImpl, _combined_schemas_OpThatWorksWithFilesImpl
 )
+
+
+class _SleepyClassifierImpl:
+    def __init__(self, seconds=0.0):
+        self.seconds = seconds
+
+    def fit(self, X, y):
+        import time
+
+        time.sleep(self.seconds)
+        self.classes_, counts = np.unique(y, return_counts=True)
+        self._majority = self.classes_[np.argmax(counts)]
+        return self
+
+    def predict(self, X):
+        return np.full(len(X), self._majority)
+
+
+_hyperparams_schema_SleepyClassifier = {
+    "allOf": [
+        {
+            "type": "object",
+            "additionalProperties": False,
+            "required": ["seconds"],
+            "relevantToOptimizer": ["seconds"],
+            "properties": {
+                "seconds": {
+                    "description": "How long fit sleeps, to test timeouts.",
+                    "enum": [0.0, 60.0],
+                    "default": 0.0,
+                },
+            },
+        }
+    ]
+}
+
+_combined_schemas_SleepyClassifier = {
+    "$schema": "http://json-schema.org/draft-04/schema#",
+    "type": "object",
+    "tags": {"pre": [], "op": ["estimator", "classifier"], "post": []},
+    "properties": {
+        "input_fit": {},
+        "input_predict": {},
+        "output_predict": {},
+        "hyperparams": _hyperparams_schema_SleepyClassifier,
+    },
+}
+
+SleepyClassifier = lale.operators.make_operator(
+    _SleepyClassifierImpl, _combined_schemas_SleepyClassifier
+)
@@ -177,6 +177,125 @@ class TestLaleVersion(unittest.TestCase):
         self.assertIsNot(lale_version, None)
 
 
+class TestLazyLibImports(unittest.TestCase):
+    def _run(self, code):
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        return result.stdout.split()
+
+    def test_operators_load_on_first_access(self):
+        loaded = self._run(
+            "import sys\n"
+            "import lale.lib.sklearn\n"
+            "print('lale.lib.sklearn.logistic_regression' in sys.modules)\n"
+            "from lale.lib.sklearn import LogisticRegression\n"
+            "print('lale.lib.sklearn.logistic_regression' in sys.modules)\n"
+            "print('lale.lib.sklearn.pca' in sys.modules)\n"
+        )
+        self.assertEqual(loaded, ["False", "True", "False"])
+
+    def test_exports(self):
+        import lale.lib.autogen
+        import lale.lib.lale
+        import lale.lib.rasl
+        import lale.lib.sklearn
+
+        self.assertIn("LogisticRegression", lale.lib.sklearn.__all__)
+        self.assertIn("StackingClassifier", dir(lale.lib.sklearn))
+        self.assertIs(lale.lib.sklearn.LogisticRegression, LogisticRegression)
+        self.assertIs(lale.lib.lale.ConcatFeatures, lale.lib.rasl.ConcatFeatures)
+        self.assertIs(lale.lib.autogen.PCA, PCA)
+        self.assertIs(lale.lib.rasl.categorical, categorical)
+        # submodules are available as attributes, as before
+        self.assertEqual(
+            lale.lib.sklearn.pipeline.__name__, "lale.lib.sklearn.pipeline"
+        )
+        with self.assertRaises(AttributeError):
+            _ = lale.lib.sklearn.NotAnOperator
+
+    def test_exports_match_type_checking_imports(self):
+        import ast
+        import importlib.util
+
+        for name in ["aif360", "autogen", "imblearn", "lale", "rasl", "sklearn"]:
+            package_name = f"lale.lib.{name}"
+            spec = importlib.util.find_spec(package_name)
+            assert spec is not None and spec.origin is not None
+            with open(spec.origin, encoding="utf-8") as f:
+                tree = ast.parse(f.read())
+            imports, exports = {}, None
+            for node in tree.body:
+                if (
+                    isinstance(node, ast.If)
+                    and ast.unparse(node.test) == "TYPE_CHECKING"
+                ):
+                    for stmt in node.body:
+                        assert isinstance(stmt, ast.ImportFrom)
+                        module = "." * stmt.level + (stmt.module or "")
+                        for alias in stmt.names:
+                            self.assertEqual(alias.asname or alias.name, alias.name)
+                            imports[alias.name] = module
+                elif isinstance(node, ast.Assign):
+                    if ast.unparse(node.targets[0]) == "_lazy_exports":
+                        exports = ast.literal_eval(node.value)
+            self.assertEqual(exports, imports, package_name)
+
+    def test_find_lale_wrapper(self):
+        from sklearn.linear_model import LogisticRegression as SkLR
+
+        from lale.helpers import find_lale_wrapper
+
+        self.assertIs(find_lale_wrapper(SkLR()), LogisticRegression)
+
+
+class TestOperatorCatalog(unittest.TestCase):
+    def _run(self, code):
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        return result.stdout.split()
+
+    def test_up_to_date(self):
+        from lale.lib._catalog import build_catalog, load_catalog
+
+        shipped = load_catalog()
+        current = build_catalog(list(shipped.keys()))
+        for package_name, entries in current.items():
+            self.assertEqual(set(entries), set(shipped[package_name]), package_name)
+            for name, entry in entries.items():
+                self.assertEqual(entry, shipped[package_name][name], name)
+
+    def test_available_operators_load_on_demand(self):
+        loaded = self._run(
+            "import sys\n"
+            "import lale.lib.sklearn\n"
+            "from lale.operators import get_available_transformers\n"
+            "names = [op.name() for op in get_available_transformers()]\n"
+            "print('PCA' in names, 'LogisticRegression' in names)\n"
+            "print('lale.lib.sklearn.pca' in sys.modules)\n"
+            "print('lale.lib.sklearn.logistic_regression' in sys.modules)\n"
+        )
+        self.assertEqual(loaded, ["True", "False", "True", "False"])
+
+    def test_find_lale_wrapper_skips_other_packages(self):
+        loaded = self._run(
+            "import sys\n"
+            "from sklearn.decomposition import PCA\n"
+            "from lale.helpers import find_lale_wrapper\n"
+            "print(find_lale_wrapper(PCA()).name())\n"
+            "print('lale.lib.xgboost' in sys.modules)\n"
+            "print('lale.lib.lightgbm' in sys.modules)\n"
+        )
+        self.assertEqual(loaded, ["PCA", "False", "False"])
+
+
 class TestMethodParameters(unittest.TestCase):
     def test_fit_predict_params_individual(self):
         from test.mock_custom_operators import CustomParamsCheckerOp
@@ -1403,6 +1522,270 @@ class TestOperatorFowarding(unittest.TestCase):
             self.assertTrue(Op.f()())
 
 
+class TestSharedData(unittest.TestCase):
+    def setUp(self):
+        import pandas as pd
+
+        rng = np.random.default_rng(42)
+        n_rows = 10_000
+        self.X = pd.DataFrame(
+            {
+                "num": rng.random(n_rows),
+                "int": rng.integers(0, 10, n_rows),
+                "str": rng.choice(["a", "b"], n_rows),
+                "cat": pd.Categorical(rng.choice(["c", "d"], n_rows)),
+            },
+            index=pd.Index(np.arange(n_rows) * 2, name="id"),
+        )
+        self.y = pd.Series(rng.integers(0, 2, n_rows), name="target")
+        self.arr = rng.random((n_rows, 20))
+
+    def test_round_trip(self):
+        import pickle
+
+        import pandas as pd
+        import scipy.sparse
+
+        from lale.datasets.data_schemas import add_table_name, get_table_name
+        from lale.shared_data import SharedData
+
+        sparse = scipy.sparse.random(10_000, 50, density=0.1, format="csr")
+        data = (add_table_name(self.X, "t"), self.y, self.arr, sparse, None, [1])
+        with SharedData() as shared:
+            handle = pickle.loads(pickle.dumps(shared.share(data)))
+            X, y, arr, sp, none, lst = handle.load()
+            pd.testing.assert_frame_equal(X, self.X)
+            self.assertEqual(get_table_name(X), "t")
+            pd.testing.assert_series_equal(y, self.y)
+            self.assertTrue(np.array_equal(arr, self.arr))
+            self.assertEqual((sp != sparse).nnz, 0)
+            self.assertEqual((none, lst), (None, [1]))
+
+    def test_zero_copy(self):
+        import pickle
+
+        from lale.shared_data import SharedData
+
+        with SharedData() as shared:
+            handle = shared.share((self.arr, self.X[["num", "int"]]))
+            # the handle refers to the buffers rather than containing them
+            self.assertLess(len(pickle.dumps(handle)), 2000)
+            arr1, X1 = handle.load()
+            arr2, _ = handle.load()
+            self.assertIsInstance(arr1, np.memmap)
+            self.assertIsInstance(X1["num"].to_numpy().base, np.memmap)
+            # writes are private to the process that makes them
+            arr1[0, 0] = -1.0
+            self.assertEqual(arr2[0, 0], self.arr[0, 0])
+
+    def test_close(self):
+        import os
+
+        from lale.shared_data import SharedData
+
+        shared = SharedData()
+        shared.share(self.arr)
+        path = shared._path
+        self.assertTrue(os.path.isdir(path))
+        shared.close()
+        self.assertFalse(os.path.exists(path))
+
+
+class TestPruners(unittest.TestCase):
+    def setUp(self):
+        self.X, self.y = load_iris(return_X_y=True)
+
+    def test_threshold(self):
+        from lale.pruners import ThresholdPruner
+
+        pruner = ThresholdPruner(0.5, n_warmup_folds=2)
+        self.assertFalse(pruner.should_prune(0, 0.1))
+        self.assertTrue(pruner.should_prune(1, 0.1))
+        self.assertFalse(pruner.should_prune(1, 0.9))
+
+    def test_median(self):
+        from lale.pruners import MedianPruner
+
+        pruner = MedianPruner(n_startup_trials=3)
+        pruner.report([0.5, 0.6, 0.7])
+        pruner.report([0.7, 0.8, 0.9])
+        self.assertFalse(pruner.should_prune(0, 0.1))
+        pruner.report([0.9, 0.9, 0.9])
+        self.assertTrue(pruner.should_prune(0, 0.6))
+        self.assertFalse(pruner.should_prune(0, 0.7))
+        self.assertTrue(pruner.should_prune(1, 0.7))
+        self.assertFalse(pruner.should_prune(3, 0.1))
+
+    def test_percentile(self):
+        from lale.pruners import PercentilePruner
+
+        pruner = PercentilePruner(25.0, n_startup_trials=1)
+        for score in [0.1, 0.2, 0.3, 0.4, 0.5]:
+            pruner.report([score])
+        self.assertTrue(pruner.should_prune(0, 0.15))
+        self.assertFalse(pruner.should_prune(0, 0.25))
+        with self.assertRaises(ValueError):
+            PercentilePruner(101.0)
+
+    def test_cross_val_score_track_trials(self):
+        from lale.helpers import cross_val_score_track_trials
+        from lale.lib.sklearn import DummyClassifier
+        from lale.pruners import ThresholdPruner, TrialPruned
+
+        pruner = ThresholdPruner(0.5)
+        expected = cross_val_score_track_trials(
+            LogisticRegression(), self.X, self.y, scoring="accuracy"
+        )
+        result = cross_val_score_track_trials(
+            LogisticRegression(), self.X, self.y, scoring="accuracy", pruner=pruner
+        )
+        self.assertEqual(result[:2], expected[:2])
+        with self.assertRaises(TrialPruned) as context:
+            cross_val_score_track_trials(
+                DummyClassifier(),
+                self.X,
+                self.y,
+                scoring="accuracy",
+                cv=3,
+                pruner=pruner,
+            )
+        self.assertEqual(context.exception.n_folds, 1)
+        self.assertLess(context.exception.score, 0.5)
+
+    def test_report_finished_trials(self):
+        from lale.helpers import cross_val_score_track_trials
+        from lale.lib.sklearn import DummyClassifier
+        from lale.pruners import MedianPruner, TrialPruned
+
+        pruner = MedianPruner(n_startup_trials=1)
+        cross_val_score_track_trials(
+            LogisticRegression(), self.X, self.y, scoring="accuracy", pruner=pruner
+        )
+        self.assertEqual(len(pruner._scores), 5)
+        with self.assertRaises(TrialPruned):
+            cross_val_score_track_trials(
+                DummyClassifier(),
+                self.X,
+                self.y,
+                scoring="accuracy",
+                pruner=pruner,
+                n_jobs=2,
+            )
+        self.assertEqual([len(s) for s in pruner._scores], [1] * 5)
+
+
+class TestTrialCache(unittest.TestCase):
+    def setUp(self):
+        from sklearn.model_selection import StratifiedKFold
+
+        self.X, self.y = load_iris(return_X_y=True)
+        self.cv = StratifiedKFold(3)
+
+    def test_trial_key(self):
+        from lale.lib.sklearn import PCA
+        from lale.trial_cache import trial_evaluation, trial_key
+
+        evaluation = trial_evaluation(self.X, self.y, self.cv, "accuracy")
+        assert evaluation is not None
+        key = trial_key(PCA(n_components=2) >> LogisticRegression(), evaluation)
+        self.assertIsNotNone(key)
+        # equal to the default, and a numpy integer
+        same = PCA(n_components=np.int64(2)) >> LogisticRegression(C=1.0)
+        self.assertEqual(trial_key(same, evaluation), key)
+        other = PCA(n_components=3) >> LogisticRegression()
+        self.assertNotEqual(trial_key(other, evaluation), key)
+        self.assertNotEqual(trial_key(PCA(n_components=2) >> NoOp, evaluation), key)
+        # one feature versus all features
+        self.assertNotEqual(
+            trial_key(RandomForestClassifier(max_features=1), evaluation),
+            trial_key(RandomForestClassifier(max_features=1.0), evaluation),
+        )
+        self.assertNotEqual(
+            trial_key(PCA(n_components=2) >> LogisticRegression(), evaluation, 1), key
+        )
+        for changed in [
+            trial_evaluation(self.X[1:], self.y[1:], self.cv, "accuracy"),
+            trial_evaluation(self.X, self.y, self.cv, "balanced_accuracy"),
+            trial_evaluation(self.X, self.y, None, "accuracy", X_valid=self.X),
+        ]:
+            assert changed is not None
+            self.assertNotEqual(
+                trial_key(PCA(n_components=2) >> LogisticRegression(), changed), key
+            )
+
+    def test_not_canonical(self):
+        from lale.trial_cache import data_fingerprint, trial_evaluation, trial_key
+
+        evaluation = trial_evaluation(self.X, self.y, self.cv, "accuracy")
+        assert evaluation is not None
+        self.assertIsNotNone(trial_key(NoOp >> LogisticRegression(), evaluation))
+        trained = LogisticRegression().fit(self.X, self.y)
+        self.assertIsNone(trial_key(NoOp >> trained, evaluation))
+        lambda_scoring = dict(evaluation, scoring=lambda est, X, y: 0.0)
+        self.assertIsNone(trial_key(LogisticRegression(), lambda_scoring))
+        self.assertIsNone(data_fingerprint([object()]))
+
+    def test_data_fingerprint(self):
+        import pandas as pd
+        import scipy.sparse
+
+        from lale.trial_cache import data_fingerprint
+
+        df = pd.DataFrame(self.X, columns=["a", "b", "c", "d"])
+        fingerprint = data_fingerprint(df)
+        self.assertEqual(data_fingerprint(df.copy()), fingerprint)
+        self.assertNotEqual(
+            data_fingerprint(df.rename(columns={"a": "e"})), fingerprint
+        )
+        self.assertNotEqual(data_fingerprint(df.iloc[::-1]), fingerprint)
+        self.assertNotEqual(data_fingerprint(self.X), fingerprint)
+        sparse = scipy.sparse.csr_matrix(self.X)
+        self.assertEqual(data_fingerprint(sparse), data_fingerprint(sparse.tocoo()))
+
+    def test_lru(self):
+        from lale.trial_cache import TrialCache, TrialResult
+
+        cache = TrialCache(max_size=2)
+        for key in ["a", "b", "c"]:
+            cache.put(key, TrialResult(0.5, 0.1, 1.0))
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("c"), TrialResult(0.5, 0.1, 1.0))
+        self.assertEqual(cache.cache_info(), (1, 1, 2, 2))
+
+    def test_persisted(self):
+        import pickle
+        import tempfile
+
+        from lale.trial_cache import TrialCache, TrialResult
+
+        with tempfile.TemporaryDirectory() as path:
+            cache = TrialCache(path)
+            cache.put("a", TrialResult(0.5, float("nan"), 1.0))
+            for other in [TrialCache(path), pickle.loads(pickle.dumps(cache))]:
+                result = other.get("a")
+                assert result is not None
+                self.assertEqual((result.score, result.time), (0.5, 1.0))
+            cache.clear()
+            self.assertIsNone(TrialCache(path).get("a"))
+
+    def test_get_trial_cache(self):
+        import copy
+        import tempfile
+
+        from lale.trial_cache import TrialCache, get_trial_cache
+
+        self.assertIsNone(get_trial_cache(None))
+        self.assertIs(get_trial_cache(True), get_trial_cache(True))
+        with tempfile.TemporaryDirectory() as path:
+            cache = get_trial_cache(path)
+            self.assertEqual(cache.path, path)
+            self.assertIs(get_trial_cache(path + "/"), cache)
+            self.assertIsNot(cache, get_trial_cache(True))
+        cache = TrialCache()
+        self.assertIs(get_trial_cache(cache), cache)
+        self.assertIs(copy.deepcopy(cache), cache)
+
+
 class TestSteps(unittest.TestCase):
     def test_pipeline(self):
         pca = PCA()
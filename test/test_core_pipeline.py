@@ -13,7 +13,9 @@
 # limitations under the License.
 
 import pickle
+import threading
 import traceback
+import tracemalloc
 import typing
 import unittest
 
@@ -26,6 +28,7 @@ from sklearn.model_selection import train_test_split
 
 import lale.datasets.openml
 import lale.helpers
+import lale.operators
 from lale.helpers import import_from_sklearn_pipeline
 from lale.lib.lale import ConcatFeatures, NoOp
 from lale.lib.sklearn import (
@@ -54,6 +57,7 @@ from lale.operators import (
     make_pipeline,
     make_union,
 )
+from lale.pruners import Pruner
 
 
 class TestCreation(unittest.TestCase):
@@ -781,8 +785,18 @@ class TestComposition(unittest.TestCase):
         pipeline.remove_last(inplace=True).freeze_trainable()
 
 
+class _PruneFirstTrials(Pruner):
+    def __init__(self, n_trials):
+        self.n_trials = n_trials
+
+    def should_prune(self, fold, score):
+        if fold == 0:
+            self.n_trials -= 1
+        return self.n_trials >= 0
+
+
 class TestAutoPipeline(unittest.TestCase):
-    def _fit_predict(self, prediction_type, all_X, all_y, verbose=True):
+    def _fit_predict(self, prediction_type, all_X, all_y, verbose=True, **kwargs):
         if verbose:
             _file_name, _line, fn_name, _text = traceback.extract_stack()[-2]
             print(f"--- TestAutoPipeline.{fn_name}() ---")
@@ -790,7 +804,7 @@ class TestAutoPipeline(unittest.TestCase):
 
         train_X, test_X, train_y, test_y = train_test_split(all_X, all_y)
         trainable = AutoPipeline(
-            prediction_type=prediction_type, max_evals=10, verbose=verbose
+            prediction_type=prediction_type, max_evals=10, verbose=verbose, **kwargs
         )
         trained = trainable.fit(train_X, train_y)
         predicted = trained.predict(test_X)
@@ -809,6 +823,38 @@ class TestAutoPipeline(unittest.TestCase):
         all_X, all_y = sklearn.datasets.load_iris(return_X_y=True)
         self._fit_predict("classification", all_X, all_y)
 
+    def test_sklearn_iris_with_pruner(self):
+        from lale.pruners import MedianPruner
+
+        all_X, all_y = sklearn.datasets.load_iris(return_X_y=True)
+        pruner = MedianPruner(n_startup_trials=2)
+        self._fit_predict("classification", all_X, all_y, pruner=pruner)
+
+    def test_baselines_pruned(self):
+        from lale.lib.lale import AutoPipeline
+
+        X, y = sklearn.datasets.make_classification(random_state=42)
+        trained = AutoPipeline(max_evals=6, cv=3, pruner=_PruneFirstTrials(3)).fit(X, y)
+        summary = trained.summary()
+        self.assertEqual(
+            list(summary.loc[["dummy", "gbt_num", "gbt_all"], "status"]),
+            ["pruned"] * 3,
+        )
+        self.assertNotIn(trained.impl._name_of_best, ["dummy", "gbt_num", "gbt_all"])
+        self.assertEqual(len(trained.predict(X)), len(y))
+
+    def test_all_trials_pruned(self):
+        from lale.lib.lale import AutoPipeline
+        from lale.pruners import AllTrialsPruned, ThresholdPruner
+
+        X, y = sklearn.datasets.make_classification(random_state=42)
+        trainable = AutoPipeline(max_evals=5, cv=3, pruner=ThresholdPruner(1.01))
+        with self.assertRaises(AllTrialsPruned) as ctx:
+            trainable.fit(X, y)
+        summary = ctx.exception.summary
+        self.assertEqual(len(summary), 5)
+        self.assertEqual(list(summary.status), ["pruned"] * 5)
+
     def test_sklearn_digits(self):
         # classification, numbers but some appear categorical, no missing values
         all_X, all_y = sklearn.datasets.load_digits(return_X_y=True)
@@ -1127,3 +1173,619 @@ class TestPartialFit(unittest.TestCase):
                 freeze_trained_prefix=False,
                 classes=[0, 1, 2],
             )
+
+
+class _WaitForSiblingImpl:
+    barrier = threading.Barrier(2, timeout=10)
+
+    def __init__(self):
+        pass
+
+    def fit(self, X, y=None):
+        self.barrier.wait()
+        return self
+
+    def transform(self, X):
+        self.barrier.wait()
+        return X
+
+
+_WaitForSibling = lale.operators.make_operator(_WaitForSiblingImpl, {})
+
+
+class TestParallelFit(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        X, y = data.data, data.target
+        self.X_train, self.X_test, self.y_train, self.y_test = train_test_split(X, y)
+
+    def _check_same_as_sequential(self, **fit_args):
+        pipeline = (
+            StandardScaler()
+            >> (PCA(n_components=2, random_state=42) & Nystroem(random_state=42))
+            >> ConcatFeatures()
+            >> LogisticRegression(random_state=42)
+        )
+        expected = pipeline.fit(self.X_train, self.y_train).predict(self.X_test)
+        trained = pipeline.fit(self.X_train, self.y_train, **fit_args)
+        self.assertIsInstance(trained, TrainedPipeline)
+        self.assertEqual(
+            [s.name() for s in trained.steps_list()],
+            [s.name() for s in pipeline.steps_list()],
+        )
+        np.testing.assert_array_equal(expected, trained.predict(self.X_test))
+
+    def test_threads(self):
+        self._check_same_as_sequential(n_jobs=2)
+
+    def test_all_cpus(self):
+        self._check_same_as_sequential(n_jobs=-1, prefer="threads")
+
+    def test_processes(self):
+        self._check_same_as_sequential(n_jobs=2, prefer="processes")
+
+    def test_siblings_run_concurrently(self):
+        # each branch waits for the other one, so a sequential fit would time out
+        pipeline = (_WaitForSibling() & _WaitForSibling()) >> ConcatFeatures()
+        trained = pipeline.fit(self.X_train, n_jobs=2)
+        self.assertIsInstance(trained, TrainedPipeline)
+
+    def test_invalid_prefer(self):
+        pipeline = (PCA() & Nystroem()) >> ConcatFeatures()
+        with self.assertRaises(ValueError):
+            pipeline.fit(self.X_train, n_jobs=2, prefer="fibers")  # type: ignore
+
+
+class TestParallelPredict(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        X, y = data.data, data.target
+        self.X_train, self.X_test, self.y_train, self.y_test = train_test_split(X, y)
+        pipeline = (
+            StandardScaler()
+            >> (PCA(n_components=2) & Nystroem(random_state=42) & GaussianNB())
+            >> ConcatFeatures()
+            >> LogisticRegression()
+        )
+        self.trained = pipeline.fit(self.X_train, self.y_train)
+
+    def test_predict(self):
+        expected = self.trained.predict(self.X_test)
+        result = self.trained.predict(self.X_test, n_jobs=3)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_predict_proba(self):
+        expected = self.trained.predict_proba(self.X_test)
+        result = self.trained.predict_proba(self.X_test, n_jobs=-1)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_transform(self):
+        prefix = self.trained.remove_last()
+        expected = prefix.transform(self.X_test)
+        result = prefix.transform(self.X_test, n_jobs=2)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_siblings_run_concurrently(self):
+        # each branch waits for the other one, so a sequential transform would time out
+        pipeline = (_WaitForSibling() & _WaitForSibling()) >> ConcatFeatures()
+        trained = pipeline.fit(self.X_train, n_jobs=2)
+        result = trained.transform(self.X_test, n_jobs=2)
+        self.assertEqual(result.shape, (self.X_test.shape[0], 8))
+
+
+class _CopyImpl:
+    def __init__(self):
+        pass
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X):
+        return X + 1.0
+
+
+_Copy = lale.operators.make_operator(_CopyImpl, {})
+
+
+class TestReleaseIntermediateOutputs(unittest.TestCase):
+    n_steps = 8
+
+    def setUp(self):
+        self.X = np.zeros((100_000, 20))
+        self.pipeline = make_pipeline(*[_Copy() for _ in range(self.n_steps)])
+
+    def _peak_memory(self, f):
+        tracemalloc.start()
+        try:
+            result = f()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        return result, peak
+
+    def test_fit(self):
+        _, peak = self._peak_memory(lambda: self.pipeline.fit(self.X))
+        # keeping every intermediate output alive would need n_steps - 1 copies
+        self.assertLess(
+            peak,
+            3 * self.X.nbytes,
+            f"peak {peak} bytes for {self.n_steps} steps over {self.X.nbytes} bytes",
+        )
+
+    def test_transform(self):
+        trained = self.pipeline.fit(self.X)
+        result, peak = self._peak_memory(lambda: trained.transform(self.X))
+        np.testing.assert_array_equal(result, self.X + self.n_steps)
+        self.assertLess(
+            peak,
+            3 * self.X.nbytes,
+            f"peak {peak} bytes for {self.n_steps} steps over {self.X.nbytes} bytes",
+        )
+
+    def test_shared_output_kept_for_all_consumers(self):
+        first = _Copy()
+        pipeline = first >> (_Copy() & _Copy() & _Copy()) >> ConcatFeatures()
+        trained = pipeline.fit(self.X[:10])
+        result = trained.transform(self.X[:10])
+        self.assertEqual(result.shape, (10, 60))
+        np.testing.assert_array_equal(result, np.full((10, 60), 2.0))
+
+
+class TestInferencePlan(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        X, y = data.data, data.target
+        self.X_train, self.X_test, self.y_train, self.y_test = train_test_split(X, y)
+        pipeline = (
+            StandardScaler()
+            >> (PCA(n_components=2) & GaussianNB())
+            >> ConcatFeatures()
+            >> LogisticRegression()
+        )
+        self.trained = pipeline.fit(self.X_train, self.y_train)
+
+    def test_same_as_without_plan(self):
+        for method in ["predict", "predict_proba", "decision_function"]:
+            # with more than one job, the pipeline is evaluated step by step
+            expected = getattr(self.trained, method)(self.X_test, n_jobs=2)
+            result = getattr(self.trained, method)(self.X_test)
+            np.testing.assert_array_equal(expected, result)
+        self.assertEqual(
+            self.trained.score(self.X_test, self.y_test),
+            accuracy_score(self.y_test, self.trained.predict(self.X_test)),
+        )
+
+    def test_plan_is_cached(self):
+        from lale.settings import (
+            disable_data_schema_validation,
+            set_disable_data_schema_validation,
+        )
+
+        existing_flag = disable_data_schema_validation
+        set_disable_data_schema_validation(True)
+        try:
+            self.trained.predict(self.X_test)
+            plan = self.trained._cached_inference_plans["_predict"]
+            self.assertIsNotNone(plan)
+            self.trained.predict(self.X_test)
+            self.assertIs(plan, self.trained._cached_inference_plans["_predict"])
+        finally:
+            set_disable_data_schema_validation(existing_flag)
+
+    def test_remove_last_invalidates_plan(self):
+        self.trained.predict(self.X_test)
+        prefix = self.trained.remove_last()
+        result = prefix.transform(self.X_test)
+        self.assertEqual(result.shape, (self.X_test.shape[0], 5))
+
+    def test_validation_bypasses_plan(self):
+        from test import EnableSchemaValidation
+
+        with EnableSchemaValidation():
+            with self.assertRaises(ValueError):
+                self.trained.predict([["not a number"] * 4])
+
+
+class TestPredictRecords(unittest.TestCase):
+    def setUp(self):
+        from lale.expressions import it
+        from lale.lib.rasl import Map, Project
+
+        data = sklearn.datasets.load_iris(as_frame=True)
+        X, y = data.data, data.target
+        X.columns = ["a", "b", "c", "d"]
+        self.X_train, self.X_test, self.y_train, _ = train_test_split(X, y)
+        pipeline = (
+            Map(columns={"a2": it.a * 2, "b": it.b, "c": it.c})
+            >> Project(columns=["a2", "b"])
+            >> LogisticRegression()
+        )
+        self.trained = pipeline.fit(self.X_train, self.y_train)
+
+    def test_records_same_as_predict(self):
+        expected = self.trained.predict(self.X_test)
+        records = self.X_test.to_dict(orient="records")
+        result = self.trained.predict_records(records)
+        np.testing.assert_array_equal(expected, result)
+
+    def test_one_same_as_predict(self):
+        expected = self.trained.predict(self.X_test.iloc[:3])
+        records = self.X_test.iloc[:3].to_dict(orient="records")
+        for record, label in zip(records, expected):
+            self.assertEqual(self.trained.predict_one(record), label)
+
+    def test_column_layout_is_reused(self):
+        records = self.X_test.to_dict(orient="records")
+        self.trained.predict_one(records[0])
+        self.assertEqual(self.trained._record_columns, ("a", "b", "c", "d"))
+        # later records may list their keys in a different order
+        reordered = {k: records[1][k] for k in ["d", "c", "b", "a"]}
+        self.assertEqual(
+            self.trained.predict_one(reordered),
+            self.trained.predict(self.X_test.iloc[1:2])[0],
+        )
+
+    def test_explicit_columns(self):
+        record = {"extra": "ignored", **self.X_test.iloc[0].to_dict()}
+        result = self.trained.predict_records(record, columns=["a", "b", "c", "d"])
+        self.assertEqual(result[0], self.trained.predict(self.X_test.iloc[:1])[0])
+        self.assertEqual(self.trained._record_columns, ("a", "b", "c", "d"))
+
+    def test_missing_column(self):
+        record = self.X_test.iloc[0].to_dict()
+        self.trained.predict_one(record)
+        del record["a"]
+        with self.assertRaisesRegex(ValueError, "missing column 'a'"):
+            self.trained.predict_one(record)
+
+    def test_unexpected_column(self):
+        record = {"extra": 1.0, **self.X_test.iloc[0].to_dict()}
+        with self.assertRaisesRegex(ValueError, "unexpected columns \\['extra'\\]"):
+            self.trained.predict_one(record)
+
+    def test_layout_from_fitted_columns(self):
+        X_train = self.X_train[["a", "b"]]
+        trained = (StandardScaler() >> LogisticRegression()).fit(X_train, self.y_train)
+        expected = trained.predict(self.X_test[["a", "b"]].iloc[:1])[0]
+        record = {"b": self.X_test.iloc[0]["b"], "a": self.X_test.iloc[0]["a"]}
+        self.assertEqual(trained.predict_one(record), expected)
+        self.assertEqual(trained._record_columns, ("a", "b"))
+
+    def test_failed_call_keeps_layout(self):
+        X_train = self.X_train[["a", "b"]]
+        trained = (StandardScaler() >> LogisticRegression()).fit(X_train, self.y_train)
+        X_test = self.X_test[["a", "b"]].iloc[:1]
+        record = X_test.iloc[0].to_dict()
+        with self.assertRaises(ValueError):
+            trained.predict_records(record, columns=["b", "a"])
+        self.assertEqual(trained.predict_one(record), trained.predict(X_test)[0])
+        self.assertEqual(trained._record_columns, ("a", "b"))
+
+
+class TestBatchingPredictor(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        X, y = data.data, data.target
+        self.X_train, self.X_test, self.y_train, _ = train_test_split(X, y)
+        self.trained = (StandardScaler() >> LogisticRegression()).fit(
+            self.X_train, self.y_train
+        )
+
+    def _serve(self, requests, **kwargs):
+        import asyncio
+
+        from lale.util.batching_predictor import BatchingPredictor
+
+        async def serve():
+            async with BatchingPredictor(self.trained, **kwargs) as predictor:
+                results = await asyncio.gather(
+                    *[predictor.predict(r) for r in requests]
+                )
+            return results, predictor
+
+        return asyncio.run(serve())
+
+    def test_rows_are_batched(self):
+        rows = [self.X_test[i : i + 1] for i in range(len(self.X_test))]
+        results, predictor = self._serve(rows, max_batch_size=8, max_wait=1.0)
+        expected = self.trained.predict(self.X_test)
+        np.testing.assert_array_equal(np.concatenate(results), expected)
+        self.assertEqual(predictor.n_requests, len(rows))
+        self.assertEqual(predictor.n_batches, (len(rows) + 7) // 8)
+
+    def test_mixed_sizes(self):
+        requests = [self.X_test[:3], self.X_test[3:4], self.X_test[4:20]]
+        results, predictor = self._serve(requests, max_batch_size=5)
+        for request, result in zip(requests, results):
+            np.testing.assert_array_equal(result, self.trained.predict(request))
+        self.assertEqual(predictor.n_batches, 2)
+
+    def test_records(self):
+        import pandas as pd
+
+        df = pd.DataFrame(self.X_test, columns=["a", "b", "c", "d"])
+        records = df.to_dict(orient="records")
+        results, _ = self._serve(records, method="predict_proba")
+        np.testing.assert_allclose(results, self.trained.predict_proba(df))
+
+    def test_error_reaches_callers(self):
+        with self.assertRaises(ValueError):
+            self._serve([self.X_test[:1], self.X_test[:1, :2]])
+
+
+class TestTransformBatches(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        self.X, self.y = data.data, data.target
+        self.trained = (StandardScaler() >> PCA(n_components=2)).fit(self.X, self.y)
+        # the last batch is shorter than the others
+        self.batches = [self.X[i : i + 40] for i in range(0, len(self.X), 40)]
+
+    def test_generator(self):
+        outputs = self.trained.transform_batches(iter(self.batches))
+        self.assertIsInstance(outputs, typing.Iterator)
+        expected = self.trained.transform(self.X)
+        np.testing.assert_allclose(np.vstack(list(outputs)), expected)
+
+    def test_in_memory(self):
+        result = self.trained.transform_with_batches(self.batches)
+        np.testing.assert_allclose(result, self.trained.transform(self.X))
+
+    def test_npy_output_file(self):
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "out.npy")
+            result = self.trained.transform_with_batches(
+                self.batches, output_file=path, n_rows=len(self.X)
+            )
+            self.assertIsInstance(result, np.memmap)
+            np.testing.assert_allclose(result, self.trained.transform(self.X))
+            np.testing.assert_allclose(np.load(path), self.trained.transform(self.X))
+            del result
+
+    def test_output_file_needs_n_rows(self):
+        with self.assertRaises(ValueError):
+            self.trained.transform_with_batches(self.batches, output_file="out.npy")
+
+
+class TestConcatBatches(unittest.TestCase):
+    def test_same_as_append_batch(self):
+        import pandas as pd
+
+        batches = [np.arange(6).reshape(3, 2) + i for i in range(4)]
+        appended = None
+        for batch in batches:
+            appended = lale.helpers.append_batch(appended, batch)
+        np.testing.assert_array_equal(lale.helpers.concat_batches(batches), appended)
+        pairs = [(b, b[:, 0]) for b in batches]
+        X, y = lale.helpers.concat_batches(pairs)
+        self.assertEqual(X.shape, (12, 2))
+        self.assertEqual(y.shape, (12,))
+        frames = [pd.DataFrame(b) for b in batches]
+        self.assertEqual(lale.helpers.concat_batches(frames).shape, (12, 2))
+        self.assertIsNone(lale.helpers.concat_batches([]))
+
+
+class _CountTransformsImpl:
+    n_transforms = 0
+
+    def __init__(self):
+        pass
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X):
+        _CountTransformsImpl.n_transforms += 1
+        return X
+
+
+_CountTransforms = lale.operators.make_operator(_CountTransformsImpl, {})
+
+
+class TestPredictMany(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        X, y = data.data, data.target
+        self.X_train, self.X_test, self.y_train, self.y_test = train_test_split(X, y)
+        _CountTransformsImpl.n_transforms = 0
+
+    def test_same_as_separate_calls(self):
+        trained = (
+            StandardScaler()
+            >> (PCA(n_components=2) & GaussianNB())
+            >> ConcatFeatures()
+            >> LogisticRegression()
+        ).fit(self.X_train, self.y_train)
+        methods = ["predict", "predict_proba", "decision_function"]
+        result = trained.predict_many(self.X_test, methods)
+        self.assertEqual(list(result.keys()), methods)
+        for method in methods:
+            expected = getattr(trained, method)(self.X_test)
+            np.testing.assert_allclose(result[method], expected)
+
+    def test_prefix_runs_once(self):
+        trained = (_CountTransforms() >> LogisticRegression()).fit(
+            self.X_train, self.y_train
+        )
+        _CountTransformsImpl.n_transforms = 0
+        result = trained.predict_many(self.X_test)
+        self.assertEqual(_CountTransformsImpl.n_transforms, 1)
+        self.assertEqual(set(result.keys()), {"predict", "predict_proba"})
+
+    def test_several_sink_inputs(self):
+        trained = ((PCA(n_components=2) & NoOp()) >> ConcatFeatures()).fit(self.X_train)
+        with self.assertRaises(AttributeError):
+            trained.predict_many(self.X_test, ["predict"])
+
+    def test_single_step(self):
+        trained = make_pipeline(LogisticRegression()).fit(self.X_train, self.y_train)
+        result = trained.predict_many(self.X_test, ["predict"])
+        np.testing.assert_array_equal(result["predict"], trained.predict(self.X_test))
+
+    def test_cross_val_score_track_trials(self):
+        from lale.helpers import cross_val_score_track_trials
+
+        pipeline = _CountTransforms() >> LogisticRegression()
+        score, logloss, _ = cross_val_score_track_trials(
+            pipeline, self.X_train, self.y_train, scoring="accuracy", cv=3
+        )
+        # once per fold for fit and once per fold for scoring and log loss
+        self.assertEqual(_CountTransformsImpl.n_transforms, 6)
+        self.assertGreater(score, 0.5)
+        self.assertGreater(logloss, 0.0)
+
+    def test_cross_val_score_track_trials_without_proba(self):
+        from lale.helpers import cross_val_score_track_trials
+        from lale.lib.sklearn import SVC
+
+        pipeline = _CountTransforms() >> SVC()
+        score, logloss, _ = cross_val_score_track_trials(
+            pipeline, self.X_train, self.y_train, scoring="accuracy", cv=3
+        )
+        self.assertEqual(_CountTransformsImpl.n_transforms, 6)
+        self.assertGreater(score, 0.5)
+        self.assertTrue(np.isnan(logloss))
+
+
+class TestParallelCrossValidation(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        self.X, self.y = data.data, data.target
+        self.pipeline = PCA(n_components=3) >> LogisticRegression()
+
+    def test_threads_same_as_sequential(self):
+        from lale.helpers import cross_val_score_track_trials
+
+        sequential = cross_val_score_track_trials(
+            self.pipeline, self.X, self.y, scoring="accuracy", cv=3
+        )
+        parallel = cross_val_score_track_trials(
+            self.pipeline, self.X, self.y, scoring="accuracy", cv=3, n_jobs=3
+        )
+        self.assertAlmostEqual(parallel[0], sequential[0])
+        self.assertAlmostEqual(parallel[1], sequential[1])
+
+    def test_threads_fit_copies(self):
+        from lale.helpers import cross_val_score
+
+        _ = cross_val_score(self.pipeline, self.X, self.y, cv=3, n_jobs=3)
+        # concurrent fits on the same operator would race on its state
+        self.assertFalse(hasattr(self.pipeline, "_trained"))
+        for step in self.pipeline.steps_list():
+            self.assertFalse(hasattr(step, "_trained"))
+
+    def test_processes_same_as_sequential(self):
+        from lale.helpers import cross_val_score
+
+        sequential = cross_val_score(self.pipeline, self.X, self.y, cv=3)
+        parallel = cross_val_score(
+            self.pipeline, self.X, self.y, cv=3, n_jobs=2, prefer="processes"
+        )
+        self.assertEqual(parallel, sequential)
+
+    def test_sklearn_estimator_with_threads(self):
+        from sklearn.linear_model import LogisticRegression as SkLogisticRegression
+
+        from lale.helpers import cross_val_score
+
+        estimator = SkLogisticRegression(max_iter=500)
+        sequential = cross_val_score(estimator, self.X, self.y, cv=4)
+        parallel = cross_val_score(estimator, self.X, self.y, cv=4, n_jobs=2)
+        self.assertEqual(parallel, sequential)
+
+    def test_fold_times(self):
+        from lale.helpers import FoldTimes, cross_val_score_track_trials
+
+        _, _, mean_time, fold_times = cross_val_score_track_trials(
+            self.pipeline,
+            self.X,
+            self.y,
+            scoring="accuracy",
+            cv=3,
+            n_jobs=2,
+            return_fold_times=True,
+        )
+        self.assertEqual(len(fold_times), 3)
+        for times in fold_times:
+            self.assertIsInstance(times, FoldTimes)
+            self.assertGreater(times.wall_time, 0.0)
+            self.assertGreaterEqual(times.cpu_time, 0.0)
+        self.assertAlmostEqual(
+            mean_time, sum(t.wall_time for t in fold_times) / len(fold_times)
+        )
+
+    def test_invalid_prefer(self):
+        from lale.helpers import cross_val_score
+
+        with self.assertRaises(ValueError):
+            cross_val_score(self.pipeline, self.X, self.y, n_jobs=2, prefer="gpus")
+
+
+class _FusedFitTransformImpl:
+    n_fit_transforms = 0
+    n_transforms = 0
+
+    def __init__(self):
+        pass
+
+    def fit(self, X, y=None):
+        return self
+
+    def transform(self, X):
+        _FusedFitTransformImpl.n_transforms += 1
+        return X * 2.0
+
+    def fit_transform(self, X, y=None):
+        _FusedFitTransformImpl.n_fit_transforms += 1
+        return X * 2.0
+
+
+_FusedFitTransform = lale.operators.make_operator(_FusedFitTransformImpl, {})
+
+
+class TestFusedFitTransform(unittest.TestCase):
+    def setUp(self):
+        data = sklearn.datasets.load_iris()
+        X, y = data.data, data.target
+        self.X_train, self.X_test, self.y_train, _ = train_test_split(X, y)
+        _FusedFitTransformImpl.n_fit_transforms = 0
+        _FusedFitTransformImpl.n_transforms = 0
+
+    def test_pipeline_uses_fit_transform(self):
+        trained = (_FusedFitTransform() >> LogisticRegression()).fit(
+            self.X_train, self.y_train
+        )
+        self.assertEqual(_FusedFitTransformImpl.n_fit_transforms, 1)
+        self.assertEqual(_FusedFitTransformImpl.n_transforms, 0)
+        trained.predict(self.X_test)
+        self.assertEqual(_FusedFitTransformImpl.n_transforms, 1)
+
+    def test_sink_is_only_fit(self):
+        _FusedFitTransform().fit(self.X_train)
+        make_pipeline(NoOp(), _FusedFitTransform()).fit(self.X_train)
+        self.assertEqual(_FusedFitTransformImpl.n_fit_transforms, 0)
+
+    def test_same_as_sklearn(self):
+        trainable = StandardScaler() >> PCA(n_components=2) >> LogisticRegression()
+        sk_pipeline = trainable.export_to_sklearn_pipeline()
+        trained = trainable.fit(self.X_train, self.y_train)
+        sk_pipeline.fit(self.X_train, self.y_train)
+        np.testing.assert_allclose(
+            trained.predict_proba(self.X_test), sk_pipeline.predict_proba(self.X_test)
+        )
+
+    def test_output_validated(self):
+        from test import EnableSchemaValidation
+
+        from lale.lib.sklearn import OneHotEncoder
+
+        with EnableSchemaValidation():
+            trained = (OneHotEncoder() >> LogisticRegression()).fit(
+                self.X_train.astype(int), self.y_train
+            )
+        self.assertEqual(
+            len(trained.predict(self.X_test.astype(int))), len(self.X_test)
+        )
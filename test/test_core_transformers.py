@@ -554,6 +554,44 @@ class TestConcatFeatures(unittest.TestCase):
         transformed = trained_cf.transform([A, B])
         self.assertEqual(get_table_name(transformed), "AB")
 
+    def test_sparse(self):
+        import numpy as np
+        import scipy.sparse
+
+        A = scipy.sparse.csr_matrix([[1.0, 0.0], [0.0, 0.0], [0.0, 2.0]])
+        B = np.array([[14, 15], [24, 25], [34, 35]])
+        C = pd.Series([16, 26, 36], name="f")
+        with EnableSchemaValidation():
+            transformed = ConcatFeatures.transform([A, B, C])
+        self.assertTrue(scipy.sparse.isspmatrix_csr(transformed))
+        expected = [[1, 0, 14, 15, 16], [0, 0, 24, 25, 26], [0, 2, 34, 35, 36]]
+        self.assertEqual(transformed.toarray().tolist(), expected)
+
+    def test_sparse_pipeline(self):
+        import numpy as np
+        import scipy.sparse
+
+        from lale.lib.rasl import Project
+        from lale.lib.sklearn import LogisticRegression
+
+        X = pd.DataFrame(
+            {
+                "text": ["a cat", "a dog", "the cat", "the dog"] * 5,
+                "num": np.arange(20.0),
+            }
+        )
+        y = np.array([0, 1, 0, 1] * 5)
+        prefix = (Project(columns=["text"]) >> TfidfVectorizer()) & Project(
+            columns=["num"]
+        )
+        trained_prefix = (prefix >> ConcatFeatures()).fit(X, y)
+        features = trained_prefix.transform(X)
+        self.assertTrue(scipy.sparse.isspmatrix_csr(features))
+        self.assertEqual(features.shape, (20, 4))  # cat, dog, the, num
+        with EnableSchemaValidation():
+            trained = LogisticRegression().fit(features, y)
+        self.assertEqual(len(trained.predict(features)), 20)
+
 
 class TestTfidfVectorizer(unittest.TestCase):
     def test_more_hyperparam_values(self):
@@ -670,3 +670,135 @@ class TestFreeze(unittest.TestCase):
         self.assertFalse(liquid.is_frozen_trainable())
         self.assertTrue(frozen.is_frozen_trainable())
         self.assertIsInstance(frozen, TrainedPipeline)
+
+
+class TestSchemaInterning(unittest.TestCase):
+    def test_equal_schemas_are_shared(self):
+        from lale.schema_interning import intern_schema
+
+        s1 = intern_schema({"type": "integer", "enum": [1, 2]})
+        s2 = intern_schema({"type": "integer", "enum": [1, 2]})
+        self.assertIs(s1, s2)
+        parent = intern_schema({"anyOf": [{"type": "integer", "enum": [1, 2]}]})
+        self.assertIs(parent["anyOf"][0], s1)
+        # the order of keys does not affect equality or hashing
+        s3 = intern_schema({"enum": [1, 2], "type": "integer"})
+        self.assertEqual(s1, s3)
+        self.assertEqual(hash(s1), hash(s3))
+        self.assertNotEqual(s1, intern_schema({"type": "integer", "enum": [1, 3]}))
+        self.assertEqual(s1, {"type": "integer", "enum": [1, 2]})
+        # equal values of different types compare like in plain dicts,
+        # but keep their own nodes, so the JSON encoding does not change
+        s4 = intern_schema({"type": "integer", "enum": [True, 2]})
+        self.assertIsNot(s1, s4)
+        self.assertEqual(s1, s4)
+        self.assertEqual(hash(s1), hash(s4))
+
+    def test_numpy_scalars(self):
+        import numpy as np
+
+        from lale.schema_interning import intern_schema, thaw_schema
+
+        s1 = intern_schema({"default": np.float64(0.5)})
+        s2 = intern_schema({"default": np.float64(0.5)})
+        self.assertIs(s1, s2)
+        s3 = intern_schema({"default": 0.5})
+        self.assertEqual(s1, s3)
+        self.assertEqual(hash(s1), hash(s3))
+        self.assertEqual(thaw_schema(s1), thaw_schema(s3))
+        self.assertNotEqual(s1, intern_schema({"default": np.float64(0.25)}))
+
+    def test_opaque_values(self):
+        from lale.lib.sklearn import PCA, LogisticRegression
+        from lale.schema_interning import intern_schema
+
+        class Opaque:
+            def __eq__(self, other):
+                return isinstance(other, Opaque)
+
+            __hash__ = None  # type: ignore
+
+        s1 = intern_schema({"enum": [Opaque(), LogisticRegression]})
+        s2 = intern_schema({"enum": [Opaque(), LogisticRegression]})
+        self.assertEqual(s1, s2)
+        self.assertEqual(hash(s1), hash(s2))
+        self.assertNotEqual(s1, intern_schema({"enum": [Opaque(), PCA]}))
+
+    def test_immutable(self):
+        from lale.schema_interning import intern_schema, thaw_schema
+
+        schema = intern_schema({"default": (0, 1), "items": [{"type": "number"}]})
+        self.assertIsInstance(schema["default"], tuple)
+        with self.assertRaises(TypeError):
+            schema["type"] = "array"
+        with self.assertRaises(TypeError):
+            schema["items"].append({"type": "string"})
+        thawed = thaw_schema(schema)
+        thawed["items"].append({"type": "string"})
+        self.assertEqual(len(schema["items"]), 1)
+
+    def test_copies_are_mutable(self):
+        import copy
+
+        from lale.lib.sklearn import LogisticRegression
+
+        schema = LogisticRegression.hyperparam_schema()
+        deep = copy.deepcopy(schema)
+        deep["allOf"][0]["properties"]["C"]["default"] = 2.0
+        self.assertEqual(schema["allOf"][0]["properties"]["C"]["default"], 1.0)
+        shallow = copy.copy(schema)
+        shallow["description"] = "changed"
+        self.assertNotEqual(schema.get("description"), "changed")
+
+    def test_validated_once(self):
+        from unittest import mock
+
+        import jsonschema
+
+        from lale.schema_interning import intern_schema
+
+        schema = intern_schema({"type": "integer", "minimum": 17})
+        with EnableSchemaValidation():
+            with mock.patch.object(
+                lale.type_checking, "_validator", wraps=lale.type_checking._validator
+            ) as validator:
+                lale.type_checking.validate_is_schema(schema)
+                lale.type_checking.validate_is_schema(schema)
+                self.assertEqual(validator.validate.call_count, 1)
+                # plain dicts can be mutated, so they are validated every time
+                lale.type_checking.validate_is_schema(dict(schema))
+                self.assertEqual(validator.validate.call_count, 2)
+            invalid = intern_schema({"type": "integer", "minimum": "17"})
+            for _ in range(2):
+                with self.assertRaises(jsonschema.ValidationError):
+                    lale.type_checking.validate_is_schema(invalid)
+
+    def test_copies_and_clones_share_schemas(self):
+        import copy
+        import pickle
+
+        import sklearn.base
+
+        from lale.lib.sklearn import LogisticRegression
+
+        trainable = LogisticRegression(C=2.0)
+        self.assertIs(trainable._schemas, LogisticRegression._schemas)
+        self.assertIs(
+            sklearn.base.clone(trainable)._schemas, LogisticRegression._schemas
+        )
+        self.assertIs(copy.deepcopy(trainable)._schemas, LogisticRegression._schemas)
+        unpickled = pickle.loads(pickle.dumps(trainable))
+        self.assertIs(unpickled._schemas, LogisticRegression._schemas)
+
+    def test_customize_schema_shares_unchanged_parts(self):
+        from lale.lib.sklearn import LogisticRegression
+
+        original = LogisticRegression.hyperparam_schema("C")
+        custom = LogisticRegression.customize_schema(
+            C=schemas.Float(minimum=0.5, maximum=2.0, default=1.0)
+        )
+        self.assertEqual(custom.hyperparam_schema("C")["maximum"], 2.0)
+        self.assertIs(LogisticRegression.hyperparam_schema("C"), original)
+        self.assertIs(
+            custom.get_schema("input_fit"), LogisticRegression.get_schema("input_fit")
+        )
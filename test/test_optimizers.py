@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import sys
 import tempfile
 import unittest
@@ -41,6 +42,7 @@ from lale.lib.lale import (
 from lale.lib.sklearn import (
     PCA,
     SVC,
+    DummyClassifier,
     KNeighborsClassifier,
     KNeighborsRegressor,
     LinearRegression,
@@ -59,7 +61,7 @@ from lale.operators import TrainedIndividualOp, TrainedPipeline, sklearn_version
 from lale.search.lale_smac import get_smac_space, lale_op_smac_tae
 from lale.search.op2hp import hyperopt_search_space
 
-from .mock_custom_operators import OpThatWorksWithFiles
+from .mock_custom_operators import OpThatWorksWithFiles, SleepyClassifier
 
 
 def f_min(op, X, y, num_folds=5):
@@ -261,6 +263,18 @@ class TestSMAC(unittest.TestCase):
             rel_diff < 0.5
         ), f"Max time: {max_opt_time}, Actual time: {opt_time}, relative diff: {rel_diff}"
 
+    def test_smac_trial_cache(self):
+        from lale.trial_cache import TrialCache
+
+        cache = TrialCache()
+        planned_pipeline = (PCA | NoOp) >> LogisticRegression
+        for _ in range(2):
+            opt = SMAC(estimator=planned_pipeline, max_evals=2, trial_cache=cache)
+            _ = opt.fit(self.X_train, self.y_train)
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 4)
+        self.assertGreaterEqual(info.hits, 2)
+
 
 def run_hyperopt_on_planned_pipeline(planned_pipeline, max_iters=1):
     # data
@@ -458,6 +472,300 @@ class TestHyperopt(unittest.TestCase):
         hor_fitted = hor.fit(X, y)
         assert hor_fitted.get_pipeline() is None
 
+    def test_n_jobs(self):
+        import time
+
+        planned_pipeline = (MinMaxScaler | Normalizer) >> (
+            LogisticRegression | KNeighborsClassifier
+        )
+        hoc = Hyperopt(
+            estimator=planned_pipeline, max_evals=8, cv=3, n_jobs=4, verbose=True
+        )
+        start = time.time()
+        trained = hoc.fit(self.X_train, self.y_train)
+        self.assertLess(time.time() - start, 60)
+        summary = trained.summary()
+        self.assertEqual(len(summary), 8)
+        self.assertTrue((summary["status"] == "ok").all())
+        predictions = trained.predict(self.X_test)
+        self.assertEqual(len(predictions), len(self.y_test))
+
+    def test_n_jobs_one_same_as_sequential(self):
+        def losses(**kwargs):
+            hoc = Hyperopt(
+                # the sag and saga solvers shuffle with the random_state
+                estimator=LogisticRegression(random_state=42) | KNeighborsClassifier,
+                max_evals=5,
+                cv=3,
+                show_progressbar=False,
+                **kwargs,
+            )
+            return list(hoc.fit(self.X_train, self.y_train).summary()["loss"])
+
+        # max_eval_time evaluates the trials in a worker process
+        self.assertEqual(losses(), losses(n_jobs=1, max_eval_time=60))
+
+    def test_max_eval_time_with_n_jobs(self):
+        import time
+
+        hoc = Hyperopt(
+            estimator=SleepyClassifier,
+            algo="rand",
+            max_evals=6,
+            cv=2,
+            n_jobs=3,
+            max_eval_time=2,
+        )
+        start = time.time()
+        trained = hoc.fit(self.X_train, self.y_train)
+        self.assertLess(time.time() - start, 30)
+        summary = trained.summary()
+        self.assertEqual(len(summary), 6)
+        self.assertIn("fail", list(summary["status"]))
+        self.assertIn("ok", list(summary["status"]))
+        self.assertIsNotNone(trained.get_pipeline())
+
+    def test_n_jobs_spawn(self):
+        import multiprocessing
+
+        # spawned workers map the data from shared memory
+        start_method = multiprocessing.get_start_method()
+        multiprocessing.set_start_method("spawn", force=True)
+        try:
+            hoc = Hyperopt(
+                estimator=SleepyClassifier,
+                algo="rand",
+                max_evals=4,
+                cv=2,
+                n_jobs=2,
+                max_eval_time=5,
+            )
+            trained = hoc.fit(pd.DataFrame(self.X_train), pd.Series(self.y_train))
+        finally:
+            multiprocessing.set_start_method(start_method, force=True)
+        self.assertIn("ok", list(trained.summary()["status"]))
+
+    def _check_pruned(self, trained):
+        summary = trained.summary()
+        self.assertLessEqual(set(summary["status"]), {"ok", "pruned"})
+        self.assertIn("pruned", list(summary["status"]))
+        # pruned losses come from lower rungs or fewer folds, so they are
+        # not comparable to the losses of completed trials, and a pruned
+        # trial can have a lower loss than the best one; the best pipeline
+        # is the best one among the trials that were not pruned
+        best_name = summary[summary["status"] == "ok"]["loss"].idxmin()
+        self.assertIs(trained.get_pipeline(best_name), trained.get_pipeline())
+        self.assertIsInstance(trained.get_pipeline(), TrainedIndividualOp)
+        self.assertEqual(trained.get_pipeline().name(), "LogisticRegression")
+
+    def test_successive_halving_n_folds(self):
+        hoc = Hyperopt(
+            estimator=LogisticRegression | DummyClassifier,
+            algo="rand",
+            max_evals=12,
+            cv=3,
+            resource="n_folds",
+        )
+        self._check_pruned(hoc.fit(self.X_train, self.y_train))
+
+    def test_successive_halving_n_samples_with_n_jobs(self):
+        hoc = Hyperopt(
+            estimator=LogisticRegression | DummyClassifier,
+            algo="rand",
+            max_evals=12,
+            cv=3,
+            resource="n_samples",
+            min_resources=0.3,
+            n_jobs=2,
+        )
+        self._check_pruned(hoc.fit(self.X_train, self.y_train))
+
+    def test_successive_halving_n_samples_data_constraints(self):
+        # n_neighbors is bounded by the rows of the training folds, which
+        # are fewest at the first rung
+        hoc = Hyperopt(
+            estimator=KNeighborsClassifier,
+            algo="rand",
+            max_evals=10,
+            cv=3,
+            resource="n_samples",
+        )
+        summary = hoc.fit(self.X_train, self.y_train).summary()
+        self.assertNotIn("fail", list(summary["status"]))
+
+    def test_successive_halving_last_rung_is_full_cv(self):
+        def losses(**kwargs):
+            hoc = Hyperopt(
+                estimator=KNeighborsClassifier,
+                algo="rand",
+                max_evals=8,
+                cv=3,
+                **kwargs,
+            )
+            summary = hoc.fit(self.X_train, self.y_train).summary()
+            return summary["loss"], summary["status"]
+
+        full_losses, _ = losses()
+        halving_losses, statuses = losses(resource="n_folds", factor=2)
+        for name, status in statuses.items():
+            if status == "ok":
+                self.assertAlmostEqual(halving_losses[name], full_losses[name])
+
+    def test_successive_halving_n_folds_requires_cv(self):
+        hoc = Hyperopt(
+            estimator=LogisticRegression, max_evals=2, cv=None, resource="n_folds"
+        )
+        with self.assertRaises(ValueError):
+            hoc.fit(
+                self.X_train, self.y_train, X_valid=self.X_test, y_valid=self.y_test
+            )
+
+    def test_successive_halving_n_folds_whole_folds(self):
+        from lale.lib.lale.hyperopt import _SuccessiveHalving
+
+        self.assertEqual(_SuccessiveHalving("n_folds", 3, 2, 5).resources, [2, 5])
+        with self.assertRaises(ValueError):
+            _SuccessiveHalving("n_folds", 3, 0.3, 5)
+        with EnableSchemaValidation():
+            with self.assertRaises(jsonschema.ValidationError):
+                Hyperopt(
+                    estimator=LogisticRegression, resource="n_folds", min_resources=0.3
+                )
+            _ = Hyperopt(
+                estimator=LogisticRegression, resource="n_samples", min_resources=0.3
+            )
+
+    def test_pruner(self):
+        from lale.pruners import ThresholdPruner
+
+        hoc = Hyperopt(
+            estimator=LogisticRegression | DummyClassifier,
+            algo="rand",
+            max_evals=12,
+            cv=3,
+            pruner=ThresholdPruner(0.5),
+        )
+        self._check_pruned(hoc.fit(self.X_train, self.y_train))
+
+    def test_pruner_with_n_jobs(self):
+        from lale.pruners import MedianPruner
+
+        hoc = Hyperopt(
+            estimator=LogisticRegression | DummyClassifier,
+            algo="rand",
+            max_evals=12,
+            cv=3,
+            n_jobs=2,
+            pruner=MedianPruner(n_startup_trials=2),
+        )
+        trained = hoc.fit(self.X_train, self.y_train)
+        self._check_pruned(trained)
+        # trials that finished in the workers were reported to the pruner
+        n_ok = list(trained.summary()["status"]).count("ok")
+        self.assertEqual(len(trained.impl.pruner._scores[0]), n_ok)
+
+    def test_pruner_and_resource(self):
+        from lale.pruners import MedianPruner
+
+        hoc = Hyperopt(
+            estimator=LogisticRegression,
+            max_evals=2,
+            resource="n_folds",
+            pruner=MedianPruner(),
+        )
+        with self.assertRaises(ValueError):
+            hoc.fit(self.X_train, self.y_train)
+
+    def test_all_trials_pruned(self):
+        from lale.pruners import AllTrialsPruned, ThresholdPruner
+
+        hoc = Hyperopt(
+            estimator=LogisticRegression,
+            max_evals=3,
+            cv=3,
+            pruner=ThresholdPruner(1.01),
+        )
+        with self.assertRaises(AllTrialsPruned):
+            hoc.fit(self.X_train, self.y_train)
+
+    def test_trial_cache_with_pruner(self):
+        from lale.pruners import AllTrialsPruned, ThresholdPruner
+        from lale.trial_cache import TrialCache
+
+        cache = TrialCache()
+
+        def fit(pruner):
+            hoc = Hyperopt(
+                estimator=LogisticRegression,
+                max_evals=3,
+                cv=3,
+                pruner=pruner,
+                trial_cache=cache,
+            )
+            return hoc.fit(self.X_train, self.y_train)
+
+        with self.assertRaises(AllTrialsPruned):
+            fit(ThresholdPruner(1.01))
+        self.assertEqual(cache.cache_info().currsize, 0)
+        # pruning depends on the pruner, so the trials are evaluated again
+        trained = fit(None)
+        self.assertFalse(
+            any(r.get("pruned", False) for r in trained.impl._trials.results)
+        )
+        self.assertEqual(cache.cache_info().hits, 0)
+
+    def test_trial_cache(self):
+        from lale.trial_cache import TrialCache
+
+        cache = TrialCache()
+
+        def fit():
+            hoc = Hyperopt(
+                estimator=(NoOp | MinMaxScaler)
+                >> (LogisticRegression | DummyClassifier),
+                max_evals=20,
+                cv=3,
+                trial_cache=cache,
+            )
+            return hoc.fit(self.X_train, self.y_train)
+
+        first = fit()
+        info = cache.cache_info()
+        self.assertEqual(info.hits + info.misses, 20)
+        self.assertEqual(info.currsize, info.misses)
+        n_cached = sum(r.get("cached", False) for r in first.impl._trials.results)
+        self.assertEqual(n_cached, info.hits)
+        # the same proposals are all found in the cache
+        second = fit()
+        self.assertEqual(cache.cache_info().hits, info.hits + 20)
+        pd.testing.assert_series_equal(
+            first.summary()["loss"], second.summary()["loss"]
+        )
+
+    def test_trial_cache_with_n_jobs(self):
+        with tempfile.TemporaryDirectory() as path:
+
+            def fit():
+                hoc = Hyperopt(
+                    estimator=LogisticRegression | DummyClassifier,
+                    algo="rand",
+                    max_evals=8,
+                    cv=3,
+                    n_jobs=2,
+                    trial_cache=path,
+                )
+                return hoc.fit(self.X_train, self.y_train)
+
+            first = fit()
+            self.assertGreater(len(os.listdir(path)), 0)
+            second = fit()
+            results = second.impl._trials.results
+            self.assertTrue(all(r.get("cached", False) for r in results))
+            self.assertEqual(
+                first.get_pipeline().pretty_print(),
+                second.get_pipeline().pretty_print(),
+            )
+
     def test_hyperparam_overriding_with_hyperopt(self):
         pca1 = PCA(n_components=3)
         pca2 = PCA()
@@ -752,6 +1060,37 @@ class TestAutoConfigureRegression(unittest.TestCase):
 
 
 class TestGridSearchCV(unittest.TestCase):
+    def test_trial_cache(self):
+        from sklearn.model_selection import StratifiedKFold
+
+        from lale.trial_cache import TrialCache
+
+        cache = TrialCache()
+        iris = load_iris()
+
+        def fit(**kwargs):
+            clf = GridSearchCV(
+                estimator=(NoOp | MinMaxScaler)
+                >> (LogisticRegression | KNeighborsClassifier),
+                lale_num_samples=1,
+                cv=StratifiedKFold(3),
+                **kwargs,
+            )
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                return clf.fit(iris.data, iris.target)
+
+        expected = fit().get_pipeline().pretty_print()
+        first = fit(trial_cache=cache)
+        n_candidates = len(first.impl.grid.cv_results_["params"])
+        self.assertEqual(cache.cache_info().currsize, n_candidates)
+        self.assertEqual(first.get_pipeline().pretty_print(), expected)
+        # nothing left to evaluate
+        second = fit(trial_cache=cache)
+        self.assertIsNone(second.impl.grid)
+        self.assertEqual(cache.cache_info().hits, n_candidates)
+        self.assertEqual(second.get_pipeline().pretty_print(), expected)
+
     def test_manual_grid(self):
         warnings.simplefilter("ignore")
 
@@ -111,3 +111,70 @@ class TestPGOHyperopt(unittest.TestCase):
         _ = parameter_grids
 
         # print(parameters)
+
+
+class TestSearchSpaceCache(unittest.TestCase):
+    def setUp(self):
+        import lale.search.schema2search_space
+
+        lale.search.schema2search_space.clear_search_space_cache()
+        self.existing_cache_size = (
+            lale.search.schema2search_space.search_space_cache_size
+        )
+
+    def tearDown(self):
+        import lale.search.schema2search_space
+
+        lale.search.schema2search_space.search_space_cache_size = (
+            self.existing_cache_size
+        )
+        lale.search.schema2search_space.clear_search_space_cache()
+
+    def test_shared_across_pipelines(self):
+        from lale.lib.sklearn import RandomForestClassifier
+        from lale.search.schema2search_space import search_space_cache_info
+
+        _ = hyperopt_search_space(PCA() >> LogisticRegression())
+        _ = hyperopt_search_space(PCA() >> RandomForestClassifier())
+        _ = get_grid_search_parameter_grids(LogisticRegression(), num_samples=2)
+        info = search_space_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 3, 3))
+
+    def test_same_search_space(self):
+        import lale.search.schema2search_space
+        from lale.search.schema2search_space import op_to_search_space
+
+        pgo = PGO.load_pgo_file(example_pgo_fp)
+        for op in [LogisticRegression, LogisticRegression(solver="saga"), PCA]:
+            first = op_to_search_space(op, pgo=pgo)
+            second = op_to_search_space(op, pgo=pgo)
+            self.assertIsNot(first, second)
+            lale.search.schema2search_space.search_space_cache_size = 0
+            uncached = op_to_search_space(op, pgo=pgo)
+            lale.search.schema2search_space.search_space_cache_size = 1024
+            self.assertEqual(str(first), str(uncached))
+            self.assertEqual(str(second), str(uncached))
+
+    def test_keyed_by_hyperparams_pgo_and_data_schema(self):
+        from lale.lib.sklearn import DecisionTreeClassifier
+        from lale.search.schema2search_space import search_space_cache_info
+
+        pgo = PGO.load_pgo_file(example_pgo_fp)
+        data_schema = {"properties": {"X": {"maxItems": 10}}}
+        _ = hyperopt_search_space(LogisticRegression())
+        _ = hyperopt_search_space(LogisticRegression(solver="saga"))
+        _ = hyperopt_search_space(LogisticRegression(), pgo=pgo)
+        _ = hyperopt_search_space(DecisionTreeClassifier(), data_schema=data_schema)
+        _ = hyperopt_search_space(DecisionTreeClassifier())
+        info = search_space_cache_info()
+        self.assertEqual((info.hits, info.misses), (0, 5))
+
+    def test_bounded(self):
+        import lale.search.schema2search_space
+        from lale.search.schema2search_space import search_space_cache_info
+
+        lale.search.schema2search_space.search_space_cache_size = 1
+        _ = hyperopt_search_space(PCA() >> LogisticRegression())
+        _ = hyperopt_search_space(PCA() >> LogisticRegression())
+        info = search_space_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 4, 1))
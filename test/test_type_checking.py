@@ -1403,6 +1403,421 @@ class TestSchemaValidation(unittest.TestCase):
         _ = trainable.fit(X, y)
 
 
+class TestTrustedHyperparams(unittest.TestCase):
+    def test_skips_per_hyperparam_checks(self):
+        from lale.settings import trusted_hyperparams
+
+        with EnableSchemaValidation():
+            with trusted_hyperparams():
+                _ = LogisticRegression(C=-1.0)
+            with self.assertRaises(jsonschema.ValidationError):
+                _ = LogisticRegression(C=-1.0)
+
+    def test_checks_side_constraints(self):
+        from unittest import mock
+
+        from lale.settings import trusted_hyperparams
+
+        with EnableSchemaValidation():
+            with mock.patch.object(
+                lale.operators.IndividualOp, "_propose_fixed_hyperparams"
+            ) as propose:
+                with trusted_hyperparams():
+                    _ = LogisticRegression(solver="liblinear", penalty="l1")
+                    with self.assertRaisesRegex(
+                        jsonschema.ValidationError,
+                        "Invalid configuration for LogisticRegression(.*) due to constraint",
+                    ):
+                        LogisticRegression(
+                            penalty="l1",
+                            solver="liblinear",
+                            multi_class="multinomial",
+                            dual=True,
+                        )
+                propose.assert_not_called()
+
+    def test_hyperopt_trusts_search_space(self):
+        from unittest import mock
+
+        import sklearn.datasets
+
+        from lale.lib.lale import Hyperopt
+
+        X, y = sklearn.datasets.load_iris(return_X_y=True)
+
+        def count_full_validations(max_evals):
+            with mock.patch.object(
+                lale.operators.IndividualOp,
+                "_validate_hyperparams_with_fixes",
+                autospec=True,
+            ) as full_validation:
+                trained = Hyperopt(
+                    estimator=LogisticRegression, max_evals=max_evals, cv=2
+                ).fit(X, y)
+            self.assertEqual(len(trained.summary()), max_evals)
+            return full_validation.call_count
+
+        with EnableSchemaValidation():
+            # only setting up the search validates fully, not each trial
+            self.assertEqual(count_full_validations(2), count_full_validations(4))
+
+
+class TestValidatorCache(unittest.TestCase):
+    def setUp(self):
+        import lale.type_checking
+
+        lale.type_checking.clear_validator_cache()
+        self.existing_cache_size = lale.type_checking.validator_cache_size
+
+    def tearDown(self):
+        import lale.type_checking
+
+        lale.type_checking.validator_cache_size = self.existing_cache_size
+        lale.type_checking.clear_validator_cache()
+
+    def test_validator_reused(self):
+        from lale.schema_interning import intern_schema
+        from lale.type_checking import _cached_validator, always_validate_schema
+
+        schema = intern_schema({"type": "integer", "minimum": 0})
+        always_validate_schema(3, schema)
+        validator = _cached_validator(schema)
+        always_validate_schema(4, schema)
+        self.assertIs(validator, _cached_validator(schema))
+        with self.assertRaises(jsonschema.ValidationError):
+            always_validate_schema(-1, schema)
+
+    def test_equal_schemas_are_distinct_entries(self):
+        from lale.schema_interning import intern_schema
+        from lale.type_checking import _cached_validator, always_validate_schema
+
+        schema1 = intern_schema({"type": "integer"})
+        schema2 = intern_schema({"type": "string"})
+        always_validate_schema(1, schema1)
+        always_validate_schema("a", schema2)
+        self.assertIsNot(_cached_validator(schema1), _cached_validator(schema2))
+        with self.assertRaises(jsonschema.ValidationError):
+            always_validate_schema("a", schema1)
+
+    def test_bounded(self):
+        import lale.type_checking
+        from lale.schema_interning import intern_schema
+
+        lale.type_checking.validator_cache_size = 4
+        schemas = [intern_schema({"type": "integer", "minimum": i}) for i in range(10)]
+        for i, schema in enumerate(schemas):
+            lale.type_checking.always_validate_schema(i, schema)
+        self.assertEqual(len(lale.type_checking._validator_cache), 4)
+        # the most recently used schemas are kept
+        cached = [entry[0] for entry in lale.type_checking._validator_cache.values()]
+        self.assertEqual(cached, schemas[-4:])
+
+    def test_mutated_schema(self):
+        import lale.type_checking
+        from lale.type_checking import always_validate_schema
+
+        schema = {"type": "integer", "minimum": 0}
+        always_validate_schema(3, schema)
+        schema["minimum"] = 5
+        with self.assertRaises(jsonschema.ValidationError):
+            always_validate_schema(3, schema)
+        self.assertEqual(len(lale.type_checking._validator_cache), 0)
+
+    def test_hyperparams_still_validated(self):
+        with EnableSchemaValidation():
+            _ = LogisticRegression(C=0.5)
+            with self.assertRaises(jsonschema.ValidationError):
+                _ = LogisticRegression(C=-1.0)
+
+
+class TestSubschemaCache(unittest.TestCase):
+    def setUp(self):
+        import lale.type_checking
+
+        lale.type_checking.clear_subschema_cache()
+        self.existing_cache_size = lale.type_checking.subschema_cache_size
+
+    def tearDown(self):
+        import lale.type_checking
+
+        lale.type_checking.subschema_cache_size = self.existing_cache_size
+        lale.type_checking.clear_subschema_cache()
+
+    def test_hits_on_equal_schemas(self):
+        from lale.type_checking import is_subschema, subschema_cache_info
+
+        self.assertTrue(is_subschema({"type": "integer"}, {"type": "number"}))
+        self.assertFalse(is_subschema({"type": "number"}, {"type": "integer"}))
+        # equal but distinct objects, with keys in a different order
+        self.assertTrue(
+            is_subschema({"type": "integer"}, {"minimum": 0, "type": "number"})
+            is is_subschema({"type": "integer"}, {"type": "number", "minimum": 0})
+        )
+        self.assertTrue(is_subschema({"type": "integer"}, {"type": "number"}))
+        info = subschema_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (2, 3, 3))
+
+    def test_bounded(self):
+        import lale.type_checking
+
+        lale.type_checking.subschema_cache_size = 2
+        for i in range(5):
+            lale.type_checking.is_subschema(
+                {"type": "integer", "minimum": i}, {"type": "number"}
+            )
+        info = lale.type_checking.subschema_cache_info()
+        self.assertEqual((info.misses, info.currsize), (5, 2))
+
+    def test_disabled(self):
+        import lale.type_checking
+
+        lale.type_checking.subschema_cache_size = 0
+        lale.type_checking.is_subschema({"type": "integer"}, {"type": "number"})
+        lale.type_checking.is_subschema({"type": "integer"}, {"type": "number"})
+        info = lale.type_checking.subschema_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (0, 0, 0))
+
+    def test_shared_across_fit_and_predict(self):
+        import sklearn.datasets
+
+        from lale.datasets.data_schemas import add_schema
+        from lale.type_checking import subschema_cache_info
+
+        X, y = sklearn.datasets.load_iris(return_X_y=True)
+        with EnableSchemaValidation():
+            # data with a schema of its own is checked with is_subschema
+            X = add_schema(X)
+            trained = LogisticRegression().fit(X, y)
+            trained.predict(X)
+            before = subschema_cache_info()
+            for _ in range(3):
+                trained.predict(X)
+        info = subschema_cache_info()
+        self.assertEqual(info.misses, before.misses)
+        self.assertEqual(info.hits, before.hits + 3)
+
+    def test_still_rejects(self):
+        with EnableSchemaValidation():
+            for _ in range(2):
+                with self.assertRaises(ValueError):
+                    LogisticRegression().fit([["a", "b"], ["c", "d"]], [0, 1])
+
+
+class TestColumnSchemaCache(unittest.TestCase):
+    def setUp(self):
+        import numpy as np
+        import pandas as pd
+
+        import lale.datasets.data_schemas
+
+        lale.datasets.data_schemas.clear_column_schema_cache()
+        self.existing_cache_size = lale.datasets.data_schemas.column_schema_cache_size
+        self.df = pd.DataFrame(
+            {
+                "f": np.linspace(0, 1, 20),
+                "i": np.arange(20),
+                "u": np.arange(20, dtype=np.uint8),
+                "b": np.arange(20) % 2 == 0,
+                "s": [str(i) for i in range(20)],
+            }
+        )
+
+    def tearDown(self):
+        import lale.datasets.data_schemas
+
+        lale.datasets.data_schemas.column_schema_cache_size = self.existing_cache_size
+        lale.datasets.data_schemas.clear_column_schema_cache()
+
+    def test_same_as_uncached(self):
+        import lale.datasets.data_schemas
+        from lale.datasets.data_schemas import dataframe_to_schema, to_schema
+
+        cached = to_schema(self.df)
+        lale.datasets.data_schemas.column_schema_cache_size = 0
+        self.assertEqual(cached, dataframe_to_schema(self.df))
+        self.assertEqual(
+            [c["type"] for c in cached["items"]["items"]],
+            ["number", "integer", "integer", "boolean", "string"],
+        )
+
+    def test_row_slices_hit(self):
+        from sklearn.model_selection import KFold
+
+        from lale.datasets.data_schemas import column_schema_cache_info, to_schema
+        from lale.helpers import split_with_schemas
+
+        all_schema = to_schema(self.df)
+        y = self.df["i"]
+        for train, test in KFold(n_splits=4).split(self.df):
+            train_X, _ = split_with_schemas(LogisticRegression, self.df, y, train)
+            schema = to_schema(train_X)
+            self.assertEqual(schema["minItems"], 15)
+            self.assertEqual(schema["maxItems"], 15)
+            self.assertEqual(schema["items"]["items"], all_schema["items"]["items"])
+        info = column_schema_cache_info()
+        self.assertEqual((info.hits, info.misses, info.currsize), (4, 1, 1))
+
+    def test_changed_columns_miss(self):
+        from lale.datasets.data_schemas import column_schema_cache_info, to_schema
+
+        to_schema(self.df)
+        renamed = self.df.rename(columns={"f": "g"})
+        self.assertEqual(to_schema(renamed)["items"]["items"][0]["description"], "g")
+        self.df["i"] = self.df["i"].astype(float)
+        self.assertEqual(to_schema(self.df)["items"]["items"][1]["type"], "number")
+        info = column_schema_cache_info()
+        self.assertEqual((info.hits, info.misses), (0, 3))
+
+    def test_edits_do_not_reach_cache(self):
+        from lale.datasets.data_schemas import column_schema_cache_info, to_schema
+
+        schema = to_schema(self.df)
+        schema["items"]["items"][0]["type"] = "MUTATED"
+        schema["items"]["items"].append({"type": "string"})
+        again = to_schema(self.df)
+        self.assertEqual(again["items"]["items"][0]["type"], "number")
+        self.assertEqual(len(again["items"]["items"]), 5)
+        self.assertEqual(column_schema_cache_info().hits, 1)
+
+    def test_ndarray_to_json_samples_rows(self):
+        import numpy as np
+
+        from lale.helpers import ndarray_to_json
+
+        result = ndarray_to_json(np.arange(60, dtype=np.float32).reshape(20, 3))
+        self.assertEqual(len(result), 10)
+        self.assertEqual(result[9], [27.0, 28.0, 29.0])
+        self.assertIs(type(result[0][0]), float)
+        self.assertEqual(len(ndarray_to_json(np.arange(20), False)), 20)
+
+
+class TestDtypesSatisfySchema(unittest.TestCase):
+    def setUp(self):
+        import numpy as np
+        import pandas as pd
+
+        self.values = {
+            "float_2d": np.zeros((4, 3)),
+            "int_1d": np.arange(4),
+            "uint_1d": np.arange(4, dtype=np.uint8),
+            "bool_1d": np.array([True, False, True, True]),
+            "str_1d": np.array(["a", "b", "c", "d"]),
+            "mixed_df": pd.DataFrame({"x": [1, 2, 3, 4], "s": ["a", "b", "c", "d"]}),
+            "float_df": pd.DataFrame({"x": [1.0, 2.0, 3.0, 4.0], "y": [0, 1, 0, 1]}),
+            "category_df": pd.DataFrame({"c": pd.Categorical(["a", "b", "a", "b"])}),
+            "series": pd.Series([1.5, 2.5, 3.5, 4.5]),
+        }
+        number, string = {"type": "number"}, {"type": "string"}
+        self.schemas = {
+            "X_numbers": {"type": "array", "items": {"type": "array", "items": number}},
+            "X_any": {"type": "array", "items": {"laleType": "Any"}},
+            "X_numbers_or_strings": {
+                "type": "array",
+                "items": {"type": "array", "items": {"anyOf": [number, string]}},
+            },
+            "X_strings": {"type": "array", "items": {"type": "array", "items": string}},
+            "X_two_columns": {
+                "type": "array",
+                "items": {
+                    "type": "array",
+                    "minItems": 2,
+                    "maxItems": 2,
+                    "items": number,
+                },
+            },
+            "X_min_rows": {
+                "type": "array",
+                "minItems": 5,
+                "items": {"type": "array", "items": number},
+            },
+            "y_labels": {
+                "anyOf": [
+                    {"type": "array", "items": number},
+                    {"type": "array", "items": string},
+                    {"type": "array", "items": {"type": "boolean"}},
+                ]
+            },
+            "y_integers": {"type": "array", "items": {"type": "integer"}},
+            "y_enum": {"type": "array", "items": {"enum": [0, 1]}},
+        }
+
+    def test_sound(self):
+        from lale.datasets.data_schemas import _to_schema
+        from lale.type_checking import dtypes_satisfy_schema, is_subschema
+
+        for value_name, value in self.values.items():
+            for schema_name, schema in self.schemas.items():
+                if dtypes_satisfy_schema(value, schema):
+                    self.assertTrue(
+                        is_subschema(_to_schema(value), schema),
+                        (value_name, schema_name),
+                    )
+
+    def test_common_schemas(self):
+        from lale.type_checking import dtypes_satisfy_schema
+
+        expected = [
+            ("float_2d", "X_numbers"),
+            ("float_df", "X_numbers"),
+            ("float_df", "X_two_columns"),
+            ("mixed_df", "X_numbers_or_strings"),
+            ("mixed_df", "X_any"),
+            ("int_1d", "y_labels"),
+            ("uint_1d", "y_integers"),
+            ("bool_1d", "y_labels"),
+            ("str_1d", "y_labels"),
+            ("series", "y_labels"),
+        ]
+        for value_name, schema_name in expected:
+            self.assertTrue(
+                dtypes_satisfy_schema(
+                    self.values[value_name], self.schemas[schema_name]
+                ),
+                (value_name, schema_name),
+            )
+
+    def test_falls_back(self):
+        from lale.datasets.data_schemas import add_schema
+        from lale.type_checking import dtypes_satisfy_schema
+
+        not_expected = [
+            ("mixed_df", "X_numbers"),
+            ("float_2d", "X_strings"),
+            ("float_2d", "X_two_columns"),
+            ("float_2d", "X_min_rows"),
+            ("series", "y_integers"),
+            ("int_1d", "y_enum"),
+            ("category_df", "X_numbers_or_strings"),
+        ]
+        for value_name, schema_name in not_expected:
+            self.assertFalse(
+                dtypes_satisfy_schema(
+                    self.values[value_name], self.schemas[schema_name]
+                ),
+                (value_name, schema_name),
+            )
+        with EnableSchemaValidation():
+            with_schema = add_schema(self.values["float_2d"])
+        self.assertFalse(dtypes_satisfy_schema(with_schema, self.schemas["X_numbers"]))
+
+    def test_no_json_materialized(self):
+        import sklearn.datasets
+
+        import lale.type_checking
+        from lale.lib.sklearn import PCA
+
+        X, y = sklearn.datasets.load_iris(return_X_y=True)
+        with EnableSchemaValidation():
+            trained = (PCA() >> LogisticRegression()).fit(X, y)
+            lale.type_checking.clear_subschema_cache()
+            predictions = trained.predict(X)
+            with self.assertRaises(ValueError):
+                trained.predict([["a", "b", "c", "d"]])
+        self.assertFalse(hasattr(predictions, "json_schema"))
+        info = lale.type_checking.subschema_cache_info()
+        self.assertEqual(info.hits + info.misses, 1)
+
+
 class TestWithScorer(unittest.TestCase):
     def test_bare_array(self):
         import sklearn.datasets